@@ -1,4 +1,18 @@
 const mongoose = require('mongoose');
+const { idAllocator, formatId } = require('../utils/idAllocator');
+const { registrationWeight, incrementEventCounters } = require('../utils/eventCounters');
+const { recordActivity } = require('../utils/rollups');
+const {
+  claimSeats,
+  claimWaitlistSeat,
+  releaseSeats,
+  enqueueWaitlist,
+  leaveWaitlist,
+  fillFromWaitlist
+} = require('../utils/registrationService');
+const { AppError } = require('../middleware/errorHandler');
+const { logger } = require('../utils/logger');
+const { profileHooks, compileModel } = require('../utils/queryProfiler');
 
 const registrationSchema = new mongoose.Schema({
   registrationId: {
@@ -34,6 +48,7 @@ const registrationSchema = new mongoose.Schema({
     enum: ['registered', 'cancelled', 'waitlisted'],
     default: 'registered'
   },
+  waitlistPosition: Number, // FIFO order while waitlisted
 
   // Payment information
   paymentStatus: {
@@ -72,11 +87,14 @@ const registrationSchema = new mongoose.Schema({
   toObject: { virtuals: true }
 });
 
+profileHooks(registrationSchema);
+
 // Compound index to prevent duplicate registrations
 registrationSchema.index({ studentId: 1, eventId: 1 }, { unique: true });
-registrationSchema.index({ eventId: 1, registrationStatus: 1 });
-registrationSchema.index({ studentId: 1, registrationDate: -1 });
-registrationSchema.index({ registrationId: 1 }, { unique: true });
+registrationSchema.index({ eventId: 1, registrationStatus: 1, waitlistPosition: 1 });
+registrationSchema.index({ studentId: 1, registrationDate: -1, _id: -1 });
+registrationSchema.index({ eventId: 1, registrationDate: 1, _id: 1 });
+registrationSchema.index({ collegeId: 1, registrationDate: 1 });
 
 // Virtual for days since registration
 registrationSchema.virtual('daysSinceRegistration').get(function() {
@@ -91,34 +109,138 @@ registrationSchema.pre('save', async function(next) {
     const Event = mongoose.model('Event');
     const User = mongoose.model('User');
 
-    const event = await Event.findById(this.eventId);
-    const student = await User.findById(this.studentId);
+    const [event, student] = await Promise.all([
+      Event.findById(this.eventId).select('eventId').lean(),
+      User.findById(this.studentId).select('userId').lean()
+    ]);
 
     if (!event || !student) {
       return next(new Error('Event or Student not found'));
     }
 
-    const count = await this.constructor.countDocuments({ eventId: this.eventId });
-    this.registrationId = `REG${String(count + 1).padStart(3, '0')}_${event.eventId}_${student.userId}`;
+    const seq = await idAllocator.next(`registration:${event.eventId}`);
+    this.registrationId = formatId('REG', seq, `${event.eventId}_${student.userId}`);
+    next();
+  } catch (error) {
+    next(error);
+  }
+});
+
+// Remember the persisted status so counter updates can be applied as deltas
+registrationSchema.post('init', function() {
+  this.$locals.persistedStatus = this.registrationStatus;
+});
+
+registrationSchema.pre('save', function(next) {
+  this.$locals.statusChanged = this.isNew || this.isModified('registrationStatus');
+  this.$locals.previousStatus = this.isNew ? null : this.$locals.persistedStatus;
+  next();
+});
+
+// Saves that move a registration into a seat or onto the waitlist without the
+// registration service take their seat or position the same way it does, so a
+// direct save can neither oversell nor jump the waitlist
+registrationSchema.pre('save', async function(next) {
+  if (!this.$locals.statusChanged || this.$locals.skipCounters) return next();
+  const { previousStatus } = this.$locals;
+
+  try {
+    if (this.registrationStatus === 'registered' && previousStatus !== 'registered') {
+      const granted = previousStatus === 'waitlisted'
+        ? await claimWaitlistSeat(this.eventId)
+        : (await claimSeats(this.eventId, 1)) === 1;
+
+      if (!granted) {
+        return next(new AppError('Event has reached maximum capacity', 409, 'CAPACITY_FULL'));
+      }
+      this.$locals.seatClaimed = true;
+      this.waitlistPosition = undefined;
+    } else if (this.registrationStatus === 'waitlisted' && previousStatus !== 'waitlisted') {
+      [this.waitlistPosition] = await enqueueWaitlist(this.eventId, 1);
+      this.$locals.enqueued = true;
+    }
     next();
   } catch (error) {
     next(error);
   }
 });
 
-// Pre-save middleware to update event registration count
+// Post-save middleware to apply the registration count delta to the event
+// (skipped when the registration service has already claimed the seat)
 registrationSchema.post('save', async function() {
+  if (!this.$locals.statusChanged) return;
+  this.$locals.statusChanged = false;
+
+  if (this.$locals.skipCounters) {
+    this.$locals.persistedStatus = this.registrationStatus;
+    return;
+  }
+
+  const { previousStatus, seatClaimed } = this.$locals;
+  this.$locals.persistedStatus = this.registrationStatus;
+  this.$locals.seatClaimed = false;
+  this.$locals.enqueued = false;
+
   try {
-    const Event = mongoose.model('Event');
-    const totalRegistrations = await this.constructor.countDocuments({ 
-      eventId: this.eventId, 
-      registrationStatus: 'registered' 
-    });
+    if (seatClaimed) {
+      const event = await mongoose.model('Event').findById(this.eventId).select('collegeId eventType').lean();
+      await recordActivity(event, [{ studentId: this.studentId, eventsRegistered: 1 }]);
+      return;
+    }
+
+    if (previousStatus === 'waitlisted' && this.registrationStatus !== 'waitlisted') {
+      await leaveWaitlist(this.eventId, 1);
+    }
+
+    const delta = registrationWeight(this.registrationStatus) - registrationWeight(previousStatus);
+    await incrementEventCounters(this.eventId, { totalRegistrations: delta }, this.studentId);
+    if (delta < 0) await fillFromWaitlist(this.eventId);
+  } catch (error) {
+    logger.error('Error updating event registration count', { err: error });
+  }
+});
 
-    await Event.findByIdAndUpdate(this.eventId, { totalRegistrations });
+// Hand back a seat or waitlist place taken in pre-save if the write itself failed
+registrationSchema.post('save', async function(error, doc, next) {
+  try {
+    if (this.$locals.seatClaimed) {
+      await releaseSeats(this.eventId, 1);
+      await fillFromWaitlist(this.eventId);
+    } else if (this.$locals.enqueued) {
+      await leaveWaitlist(this.eventId, 1);
+    }
+  } catch (releaseError) {
+    logger.error('Error releasing claimed seat', { err: releaseError });
+  }
+  this.$locals.seatClaimed = false;
+  this.$locals.enqueued = false;
+  next(error);
+});
+
+// Post-delete middleware to release the registration from the event count
+registrationSchema.post('deleteOne', { document: true, query: false }, async function() {
+  try {
+    const status = this.$locals.persistedStatus || this.registrationStatus;
+    const seats = registrationWeight(status);
+    if (status === 'waitlisted') await leaveWaitlist(this.eventId, 1);
+    await incrementEventCounters(this.eventId, { totalRegistrations: -seats }, this.studentId);
+    if (seats > 0) await fillFromWaitlist(this.eventId);
+  } catch (error) {
+    logger.error('Error updating event registration count', { err: error });
+  }
+});
+
+registrationSchema.post('findOneAndDelete', async function(doc) {
+  if (!doc) return;
+
+  try {
+    const seats = registrationWeight(doc.registrationStatus);
+    if (doc.registrationStatus === 'waitlisted') await leaveWaitlist(doc.eventId, 1);
+    await incrementEventCounters(doc.eventId, { totalRegistrations: -seats }, doc.studentId);
+    if (seats > 0) await fillFromWaitlist(doc.eventId);
   } catch (error) {
-    console.error('Error updating event registration count:', error);
+    logger.error('Error updating event registration count', { err: error });
   }
 });
 
-module.exports = mongoose.model('Registration', registrationSchema);
+module.exports = compileModel('Registration', registrationSchema);
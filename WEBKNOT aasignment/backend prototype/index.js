@@ -1,3 +1,6 @@
+// Query profiling is a global plugin, so it is installed before any model is compiled
+require('../utils/queryProfiler').installQueryProfiler();
+
 // Export all models for easy importing
 module.exports = {
   College: require('./College'),
@@ -5,5 +8,9 @@ module.exports = {
   Event: require('./Event'),
   Registration: require('./Registration'),
   Attendance: require('./Attendance'),
-  Feedback: require('./Feedback')
+  Feedback: require('./Feedback'),
+  Counter: require('./Counter'),
+  StudentRollup: require('./StudentRollup'),
+  CollegeTypeRollup: require('./CollegeTypeRollup'),
+  RateLimitBucket: require('./RateLimitBucket')
 };
@@ -1,4 +1,14 @@
+const crypto = require('crypto');
 const jwt = require('jsonwebtoken');
+const LRUCache = require('../utils/lruCache');
+
+// Verified claims keyed by token digest; entries expire exactly at the token's exp
+const verifiedTokenCache = new LRUCache({
+  max: process.env.JWT_CACHE_MAX === undefined ? 20000 : parseInt(process.env.JWT_CACHE_MAX),
+  ttl: 5 * 60 * 1000 // fallback for tokens without an exp claim
+});
+
+const tokenDigest = (token) => crypto.createHash('sha256').update(token).digest('base64');
 
 const generateToken = (payload) => {
   return jwt.sign(payload, process.env.JWT_SECRET, {
@@ -8,7 +18,7 @@ const generateToken = (payload) => {
   });
 };
 
-const verifyToken = (token) => {
+const verifyTokenUncached = (token) => {
   try {
     return jwt.verify(token, process.env.JWT_SECRET, {
       issuer: 'campus-events-api',
@@ -19,6 +29,25 @@ const verifyToken = (token) => {
   }
 };
 
+const verifyToken = (token) => {
+  const key = tokenDigest(token);
+  const cached = verifiedTokenCache.get(key);
+  if (cached) return cached;
+
+  const decoded = Object.freeze(verifyTokenUncached(token));
+
+  if (decoded.exp) {
+    const ttl = decoded.exp * 1000 - Date.now();
+    if (ttl > 0) verifiedTokenCache.set(key, decoded, ttl);
+  } else {
+    verifiedTokenCache.set(key, decoded);
+  }
+
+  return decoded;
+};
+
+const getTokenCacheStats = () => verifiedTokenCache.getStats();
+
 const extractToken = (req) => {
   const authHeader = req.headers.authorization;
 
@@ -32,5 +61,7 @@ const extractToken = (req) => {
 module.exports = {
   generateToken,
   verifyToken,
-  extractToken
+  verifyTokenUncached,
+  extractToken,
+  getTokenCacheStats
 };
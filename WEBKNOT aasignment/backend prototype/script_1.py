@@ -6,9 +6,27 @@ package_json = {
     "main": "server.js",
     "scripts": {
         "start": "node server.js",
+        "start:cluster": "node cluster.js",
         "dev": "nodemon server.js",
         "test": "jest",
-        "seed": "node utils/seedDatabase.js"
+        "seed": "node utils/seedDatabase.js",
+        "reconcile:counters": "node utils/eventCounters.js",
+        "migrate:counters": "node utils/seedCounters.js",
+        "rebuild:rollups": "node utils/rebuildRollups.js",
+        "bench:ids": "node benchmarks/idAllocator.bench.js",
+        "bench:auth": "node benchmarks/authPrincipal.bench.js",
+        "bench:jwt": "node benchmarks/jwtVerify.bench.js",
+        "bench:checkin": "node benchmarks/checkIn.bench.js",
+        "bench:cluster": "node benchmarks/cluster.bench.js",
+        "bench:pagination": "node benchmarks/pagination.bench.js",
+        "bench:metrics": "node benchmarks/metrics.bench.js",
+        "bench:lean": "node --expose-gc --max-semi-space-size=64 benchmarks/leanReads.bench.js",
+        "bench:passwords": "node benchmarks/passwordPool.bench.js",
+        "bench:validators": "node benchmarks/compiledValidators.bench.js",
+        "check:plans": "node benchmarks/queryPlans.check.js",
+        "stress:registrations": "node benchmarks/registrationCapacity.stress.js",
+        "load": "node benchmarks/scenarios.load.js",
+        "load:baseline": "node benchmarks/scenarios.load.js --update-baseline"
     },
     "keywords": ["campus", "event", "management", "node", "express", "mongodb"],
     "author": "Campus Event Management Team",
@@ -21,9 +39,7 @@ package_json = {
         "cors": "^2.8.5",
         "dotenv": "^16.3.1",
         "joi": "^17.9.2",
-        "express-rate-limit": "^6.8.1",
         "helmet": "^7.0.0",
-        "morgan": "^1.10.0",
         "moment": "^2.29.4"
     },
     "devDependencies": {
@@ -32,7 +48,7 @@ package_json = {
         "supertest": "^6.3.3"
     },
     "engines": {
-        "node": ">=14.0.0"
+        "node": ">=16.0.0"
     }
 }
 
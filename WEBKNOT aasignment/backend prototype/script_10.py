@@ -2,19 +2,31 @@
 
 # Validation middleware
 validation_js = '''const Joi = require('joi');
+const { FALLBACK, compileSchema } = require('./compiledValidators');
 
-// Generic validation middleware
+// Schema -> precompiled validator (filled in once the schemas below exist)
+const compiledBySchema = new Map();
+
+// Generic validation middleware. Schemas the compiler supports run their
+// compiled validator first and only fall back to Joi when Joi would have to
+// convert the input.
 const validate = (schema) => {
+  const compiled = compiledBySchema.get(schema);
+
   return (req, res, next) => {
-    const { error } = schema.validate(req.body);
+    let details = compiled ? compiled(req.body) : FALLBACK;
+    if (details === FALLBACK) {
+      const { error } = schema.validate(req.body);
+      details = error ? error.details[0].message : null;
+    }
     
-    if (error) {
+    if (details) {
       return res.status(400).json({
         success: false,
         message: 'Validation error',
         error: {
           code: 'VALIDATION_ERROR',
-          details: error.details[0].message
+          details
         }
       });
     }
@@ -141,6 +153,12 @@ const registrationSchemas = {
   
   cancel: Joi.object({
     cancellationReason: Joi.string().max(500).allow('')
+  }),
+  
+  bulk: Joi.object({
+    eventId: Joi.string().required(),
+    studentIds: Joi.array().items(Joi.string()).min(1).max(5000).unique().required(),
+    specialRequirements: Joi.string().max(500).allow('')
   })
 };
 
@@ -148,6 +166,7 @@ const registrationSchemas = {
 const attendanceSchemas = {
   checkIn: Joi.object({
     eventId: Joi.string().required(),
+    studentId: Joi.string(), // scanned student; only honoured for admin scanners
     checkInMethod: Joi.string().valid('qr_code', 'manual', 'mobile_app').default('mobile_app'),
     checkInLocation: Joi.string().allow('')
   }),
@@ -215,6 +234,16 @@ const collegeSchemas = {
   })
 };
 
+// Compile every schema from its Joi description; ones using features the
+// compiler does not reproduce are validated by Joi alone
+const schemaGroups = { userSchemas, eventSchemas, registrationSchemas, attendanceSchemas, feedbackSchemas, collegeSchemas };
+for (const schemas of Object.values(schemaGroups)) {
+  for (const schema of Object.values(schemas)) {
+    const compiled = compileSchema(schema);
+    if (compiled) compiledBySchema.set(schema, compiled);
+  }
+}
+
 module.exports = {
   validate,
   userSchemas,
@@ -230,18 +259,29 @@ with open('middleware/validation.js', 'w') as f:
     f.write(validation_js)
 
 # Error handler middleware
-errorHandler_js = '''const errorHandler = (err, req, res, next) => {
+errorHandler_js = '''const { logger } = require('../utils/logger');
+
+const CLIENT_ERRORS = new Set(['CastError', 'ValidationError', 'JsonWebTokenError', 'TokenExpiredError']);
+
+// Expected client errors (validation, bad IDs, duplicates, auth, 4xx AppErrors)
+// are logged at warn without a stack; anything else is logged as an error
+// with its stack (rate-limited per distinct error by the logger)
+const logError = (err, req) => {
+  const isClientError = CLIENT_ERRORS.has(err.name) || err.code === 11000 || (err.statusCode || 500) < 500;
+  const fields = { method: req.method, url: req.originalUrl };
+
+  if (isClientError) {
+    logger.warn(err.message, { ...fields, name: err.name, code: err.code });
+  } else {
+    logger.error(err.message, { ...fields, err });
+  }
+};
+
+const errorHandler = (err, req, res, next) => {
   let error = { ...err };
   error.message = err.message;
 
-  // Log error
-  console.error('Error:', {
-    message: err.message,
-    stack: err.stack,
-    url: req.originalUrl,
-    method: req.method,
-    timestamp: new Date().toISOString()
-  });
+  logError(err, req);
 
   // Mongoose bad ObjectId
   if (err.name === 'CastError') {
@@ -0,0 +1,340 @@
+# Create the shared ID allocator (counters collection + block reservation)
+os.makedirs('utils', exist_ok=True)
+os.makedirs('benchmarks', exist_ok=True)
+
+# Counter model
+counter_js = '''const mongoose = require('mongoose');
+
+// utils/idAllocator loads this model directly, often before models/index.js
+// (server.js requires it at startup), so the profiler plugin must be
+// installed here too or the ID and content-version counters go unprofiled
+require('../utils/queryProfiler').installQueryProfiler();
+
+// One document per ID sequence, e.g. 'user:STU' or 'registration:EVT001_CLG001'
+const counterSchema = new mongoose.Schema({
+  _id: {
+    type: String,
+    required: true
+  },
+  seq: {
+    type: Number,
+    required: true,
+    default: 0,
+    min: 0
+  }
+}, {
+  versionKey: false
+});
+
+module.exports = mongoose.model('Counter', counterSchema);
+'''
+
+with open('models/Counter.js', 'w') as f:
+    f.write(counter_js)
+
+# ID allocator service
+id_allocator_js = '''const Counter = require('../models/Counter');
+
+const DEFAULT_BLOCK_SIZE = parseInt(process.env.ID_BLOCK_SIZE) || 20;
+
+// Format a sequence number the same way the models always have (STU001, EVT001_CLG001, ...)
+const formatId = (prefix, seq, suffix) => {
+  const id = `${prefix}${String(seq).padStart(3, '0')}`;
+  return suffix ? `${id}_${suffix}` : id;
+};
+
+// Hands out sequence numbers from blocks reserved atomically in the counters
+// collection, so an insert costs one $inc per block instead of a countDocuments
+// per document, and concurrent writers can never compute the same number.
+class IdAllocator {
+  constructor(options = {}) {
+    this.blockSize = options.blockSize || DEFAULT_BLOCK_SIZE;
+    this.blocks = new Map();
+    this.pending = new Map();
+    this.stats = {
+      issued: 0,
+      blocksReserved: 0
+    };
+  }
+
+  async reserveBlock(key, size) {
+    const counter = await Counter.findOneAndUpdate(
+      { _id: key },
+      { $inc: { seq: size } },
+      { upsert: true, new: true, lean: true }
+    );
+
+    this.stats.blocksReserved++;
+    return { next: counter.seq - size + 1, end: counter.seq };
+  }
+
+  async next(key) {
+    for (;;) {
+      const block = this.blocks.get(key);
+      if (block && block.next <= block.end) {
+        this.stats.issued++;
+        return block.next++;
+      }
+
+      // Concurrent callers share a single in-flight reservation per key
+      if (!this.pending.has(key)) {
+        const refill = this.reserveBlock(key, this.blockSize)
+          .then((reserved) => {
+            this.blocks.set(key, reserved);
+          })
+          .finally(() => {
+            this.pending.delete(key);
+          });
+        this.pending.set(key, refill);
+      }
+
+      await this.pending.get(key);
+    }
+  }
+
+  // Reserve `count` sequence numbers at once: drain the cached block first, then
+  // take the remainder with a single $inc (used by bulk inserts)
+  async nextMany(key, count) {
+    const seqs = [];
+    const block = this.blocks.get(key);
+    while (block && block.next <= block.end && seqs.length < count) {
+      seqs.push(block.next++);
+    }
+
+    if (seqs.length < count) {
+      const reserved = await this.reserveBlock(key, count - seqs.length);
+      for (let seq = reserved.next; seq <= reserved.end; seq++) {
+        seqs.push(seq);
+      }
+    }
+
+    this.stats.issued += seqs.length;
+    return seqs;
+  }
+
+  async nextId(key, prefix, suffix) {
+    const seq = await this.next(key);
+    return formatId(prefix, seq, suffix);
+  }
+
+  // Raise a counter to at least `value` (used when migrating collections that
+  // were numbered with countDocuments before the counters collection existed)
+  async ensureAtLeast(key, value) {
+    await this.ensureAtLeastMany([[key, value]]);
+  }
+
+  // Same for many [key, value] pairs, with one unordered bulkWrite per batch.
+  // $max never lowers a counter, so running it again is harmless.
+  async ensureAtLeastMany(pairs, batchSize = 1000) {
+    const result = { raised: 0 };
+    for (let i = 0; i < pairs.length; i += batchSize) {
+      const write = await Counter.bulkWrite(pairs.slice(i, i + batchSize).map(([key, value]) => ({
+        updateOne: { filter: { _id: key }, update: { $max: { seq: value } }, upsert: true }
+      })), { ordered: false });
+      result.raised += write.modifiedCount + write.upsertedCount;
+    }
+
+    // Cached blocks may predate the raise; drop them so the next ID comes from the counter
+    for (const [key] of pairs) this.blocks.delete(key);
+    return result;
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      blockSize: this.blockSize,
+      cachedKeys: this.blocks.size
+    };
+  }
+}
+
+// Shared per-process instance used by the model hooks
+const idAllocator = new IdAllocator();
+
+module.exports = {
+  IdAllocator,
+  idAllocator,
+  formatId
+};
+'''
+
+with open('utils/idAllocator.js', 'w') as f:
+    f.write(id_allocator_js)
+
+# Migration: start every counter after the highest ID already in the database
+seed_counters_js = '''const mongoose = require('mongoose');
+const { idAllocator } = require('./idAllocator');
+
+// Highest numeric part of `field` per counter key. `pattern` captures the
+// number and the key part; `seqAt`/`keyAt` say which capture is which.
+const maxByCapture = (model, field, pattern, keyPrefix, { seqAt, keyAt }) => model.aggregate([
+  { $project: { found: { $regexFind: { input: `$${field}`, regex: pattern } } } },
+  { $match: { found: { $ne: null } } },
+  {
+    $group: {
+      _id: { $concat: [keyPrefix, { $arrayElemAt: ['$found.captures', keyAt] }] },
+      seq: { $max: { $toLong: { $arrayElemAt: ['$found.captures', seqAt] } } }
+    }
+  }
+]);
+
+// Same for IDs numbered per event (REG/ATT/FBK): grouped by the event's
+// ObjectId, then keyed by the event's human-readable eventId
+const maxPerEvent = (model, field, prefix, keyPrefix) => model.aggregate([
+  { $project: { eventId: 1, found: { $regexFind: { input: `$${field}`, regex: `^${prefix}(\\\\d+)_` } } } },
+  { $match: { found: { $ne: null } } },
+  { $group: { _id: '$eventId', seq: { $max: { $toLong: { $arrayElemAt: ['$found.captures', 0] } } } } },
+  { $lookup: { from: mongoose.model('Event').collection.name, localField: '_id', foreignField: '_id', as: 'event' } },
+  { $unwind: '$event' },
+  { $project: { _id: { $concat: [keyPrefix, '$event.eventId'] }, seq: 1 } }
+]);
+
+// Raise every ID counter to the highest sequence already used in its
+// collection. Needed once for databases created before the counters
+// collection (IDs were numbered with countDocuments), or restored from a
+// dump without it; otherwise the allocator would start again at 001 and
+// collide with existing unique IDs. Safe to re-run.
+const seedCounters = async () => {
+  const groups = await Promise.all([
+    // STU001 -> user:STU, ADM001 -> user:ADM
+    maxByCapture(mongoose.model('User'), 'userId', '^([A-Z]+)(\\\\d+)$', 'user:', { keyAt: 0, seqAt: 1 }),
+    // EVT001_CLG001 -> event:CLG001
+    maxByCapture(mongoose.model('Event'), 'eventId', '^EVT(\\\\d+)_(.+)$', 'event:', { seqAt: 0, keyAt: 1 }),
+    maxPerEvent(mongoose.model('Registration'), 'registrationId', 'REG', 'registration:'),
+    maxPerEvent(mongoose.model('Attendance'), 'attendanceId', 'ATT', 'attendance:'),
+    maxPerEvent(mongoose.model('Feedback'), 'feedbackId', 'FBK', 'feedback:')
+  ]);
+
+  const pairs = groups.flat().map((row) => [row._id, Number(row.seq)]);
+  const { raised } = await idAllocator.ensureAtLeastMany(pairs);
+  return { checked: pairs.length, raised };
+};
+
+// Usage: node utils/seedCounters.js
+if (require.main === module) {
+  require('dotenv').config();
+  require('../models');
+
+  mongoose.connect(process.env.MONGODB_URI)
+    .then(() => seedCounters())
+    .then((result) => {
+      console.log(`✅ Checked ${result.checked} counters, raised ${result.raised}`);
+      return mongoose.connection.close();
+    })
+    .catch((error) => {
+      console.error('❌ Error seeding counters:', error);
+      process.exit(1);
+    });
+}
+
+module.exports = {
+  seedCounters
+};
+'''
+
+with open('utils/seedCounters.js', 'w') as f:
+    f.write(seed_counters_js)
+
+# Benchmark: legacy countDocuments numbering vs block allocator as the collection grows
+id_allocator_bench_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const { IdAllocator, formatId } = require('../utils/idAllocator');
+const Counter = require('../models/Counter');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const SIZES = [1000, 10000, 100000, 1000000];
+const INSERTS_PER_SIZE = parseInt(process.env.BENCH_INSERTS) || 2000;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 16;
+const FILL_BATCH = 10000;
+
+const collectionName = 'bench_users';
+
+const fillTo = async (collection, target) => {
+  let current = await collection.countDocuments();
+  while (current < target) {
+    const batch = [];
+    const upto = Math.min(target, current + FILL_BATCH);
+    for (let i = current + 1; i <= upto; i++) {
+      batch.push({ userId: formatId('FIL', i), role: 'student' });
+    }
+    await collection.insertMany(batch, { ordered: false });
+    current = upto;
+  }
+};
+
+const runInserts = async (collection, nextUserId) => {
+  let remaining = INSERTS_PER_SIZE;
+  let collisions = 0;
+
+  const worker = async () => {
+    while (remaining > 0) {
+      remaining--;
+      const userId = await nextUserId();
+      try {
+        await collection.insertOne({ userId, role: 'student' });
+      } catch (error) {
+        if (error.code !== 11000) throw error;
+        collisions++;
+      }
+    }
+  };
+
+  const start = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+
+  return { insertsPerSec: Math.round(INSERTS_PER_SIZE / seconds), collisions };
+};
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  const collection = mongoose.connection.collection(collectionName);
+  await collection.drop().catch(() => {});
+  await Counter.deleteMany({ _id: /^bench:/ });
+  await collection.createIndex({ userId: 1 }, { unique: true });
+  await collection.createIndex({ role: 1 });
+
+  const allocator = new IdAllocator();
+  const results = [];
+
+  for (const size of SIZES) {
+    await fillTo(collection, size);
+
+    const legacy = await runInserts(collection, async () => {
+      const count = await collection.countDocuments({ role: 'student' });
+      return formatId('LEG', count + 1);
+    });
+
+    const blocks = await runInserts(collection, () => allocator.nextId('bench:STU', 'STU'));
+
+    results.push({
+      collectionSize: size,
+      countDocumentsInsertsPerSec: legacy.insertsPerSec,
+      countDocumentsCollisions: legacy.collisions,
+      allocatorInsertsPerSec: blocks.insertsPerSec,
+      allocatorCollisions: blocks.collisions
+    });
+  }
+
+  console.table(results);
+  console.log('Allocator stats:', allocator.getStats());
+
+  await collection.drop().catch(() => {});
+  await Counter.deleteMany({ _id: /^bench:/ });
+  await mongoose.connection.close();
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/idAllocator.bench.js', 'w') as f:
+    f.write(id_allocator_bench_js)
+
+print("✅ Created models/Counter.js - Counters collection for ID sequences")
+print("✅ Created utils/idAllocator.js - Block-reserving ID allocator shared by all models")
+print("✅ Created utils/seedCounters.js - Migration that seeds counters from existing IDs")
+print("✅ Created benchmarks/idAllocator.bench.js - Insert throughput vs collection size")
@@ -0,0 +1,139 @@
+# Create event counter maintenance utilities (atomic deltas + reconciliation)
+
+event_counters_js = '''const mongoose = require('mongoose');
+const { recordActivity } = require('./rollups');
+const { bumpAllVersions } = require('./contentVersions');
+
+const RECONCILE_BATCH_SIZE = 1000;
+
+// Only 'registered' registrations occupy a seat in Event.totalRegistrations
+const registrationWeight = (status) => (status === 'registered' ? 1 : 0);
+
+// Apply counter deltas with a single atomic $inc (zero deltas are skipped) and
+// carry the same change into the student and college/event-type rollups
+const incrementEventCounters = async (eventId, deltas, studentId) => {
+  const inc = {};
+  for (const [field, value] of Object.entries(deltas)) {
+    if (value) inc[field] = value;
+  }
+
+  if (Object.keys(inc).length === 0) return;
+
+  const Event = mongoose.model('Event');
+  const event = await Event.findOneAndUpdate(
+    { _id: eventId },
+    { $inc: inc },
+    { projection: { collegeId: 1, eventType: 1 } }
+  ).lean();
+
+  if (event && studentId) {
+    await recordActivity(event, [{
+      studentId,
+      eventsRegistered: inc.totalRegistrations,
+      eventsAttended: inc.totalAttendance
+    }]);
+  }
+};
+
+const countByEvent = async (model, match) => {
+  const rows = await model.aggregate([
+    { $match: match },
+    { $group: { _id: '$eventId', count: { $sum: 1 } } }
+  ]);
+  return new Map(rows.map((row) => [String(row._id), row.count]));
+};
+
+// Recompute totalRegistrations/totalAttendance/waitlistLength from the source
+// collections and fix any event whose stored counters have drifted (this also
+// fills in waitlistLength on events created before it existed). Pass eventIds
+// to limit the scope.
+const reconcileEventCounters = async (eventIds = null) => {
+  const Event = mongoose.model('Event');
+  const Registration = mongoose.model('Registration');
+  const Attendance = mongoose.model('Attendance');
+
+  const ids = eventIds ? eventIds.map((id) => new mongoose.Types.ObjectId(id)) : null;
+  const scope = ids ? { eventId: { $in: ids } } : {};
+
+  const [registrations, waitlists, attendance] = await Promise.all([
+    countByEvent(Registration, { ...scope, registrationStatus: 'registered' }),
+    countByEvent(Registration, { ...scope, registrationStatus: 'waitlisted' }),
+    countByEvent(Attendance, scope)
+  ]);
+
+  const cursor = Event.find(ids ? { _id: { $in: ids } } : {})
+    .select('totalRegistrations totalAttendance waitlistLength')
+    .lean()
+    .cursor();
+
+  const result = { checked: 0, corrected: 0 };
+  let ops = [];
+
+  for await (const event of cursor) {
+    result.checked++;
+    const totalRegistrations = registrations.get(String(event._id)) || 0;
+    const totalAttendance = attendance.get(String(event._id)) || 0;
+    const waitlistLength = waitlists.get(String(event._id)) || 0;
+
+    if (
+      event.totalRegistrations !== totalRegistrations ||
+      event.totalAttendance !== totalAttendance ||
+      event.waitlistLength !== waitlistLength
+    ) {
+      ops.push({
+        updateOne: {
+          filter: { _id: event._id },
+          update: { $set: { totalRegistrations, totalAttendance, waitlistLength } }
+        }
+      });
+    }
+
+    if (ops.length >= RECONCILE_BATCH_SIZE) {
+      await Event.bulkWrite(ops, { ordered: false });
+      result.corrected += ops.length;
+      ops = [];
+    }
+  }
+
+  if (ops.length > 0) {
+    await Event.bulkWrite(ops, { ordered: false });
+    result.corrected += ops.length;
+  }
+
+  if (result.corrected > 0) {
+    await bumpAllVersions();
+  }
+
+  return result;
+};
+
+// Usage: node utils/eventCounters.js [eventObjectId ...]
+if (require.main === module) {
+  require('dotenv').config();
+  require('../models');
+
+  const eventIds = process.argv.slice(2);
+
+  mongoose.connect(process.env.MONGODB_URI)
+    .then(() => reconcileEventCounters(eventIds.length > 0 ? eventIds : null))
+    .then((result) => {
+      console.log(`✅ Checked ${result.checked} events, corrected ${result.corrected}`);
+      return mongoose.connection.close();
+    })
+    .catch((error) => {
+      console.error('❌ Error reconciling event counters:', error);
+      process.exit(1);
+    });
+}
+
+module.exports = {
+  registrationWeight,
+  incrementEventCounters,
+  reconcileEventCounters
+};
+'''
+
+with open('utils/eventCounters.js', 'w') as f:
+    f.write(event_counters_js)
+
+print("✅ Created utils/eventCounters.js - Atomic event counter deltas and reconciliation")
@@ -0,0 +1,120 @@
+# Create running feedback statistics utilities (sum, count and 1-5 histogram per rating)
+
+feedback_stats_js = '''const mongoose = require('mongoose');
+const { recordFeedback } = require('./rollups');
+
+// Rating dimensions tracked on Event.feedbackStats and where each lives on a Feedback document
+const RATING_DIMENSIONS = {
+  overall: (feedback) => feedback.overallRating,
+  content: (feedback) => feedback.categories?.content?.rating,
+  speaker: (feedback) => feedback.categories?.speaker?.rating,
+  organization: (feedback) => feedback.categories?.organization?.rating,
+  venue: (feedback) => feedback.categories?.venue?.rating
+};
+
+const RATING_VALUES = [1, 2, 3, 4, 5];
+
+// Capture the ratings a feedback document contributes to the event statistics
+const ratingSnapshot = (feedback) => {
+  const snapshot = {};
+  for (const [dimension, read] of Object.entries(RATING_DIMENSIONS)) {
+    const rating = read(feedback);
+    if (rating) snapshot[dimension] = Math.round(rating);
+  }
+  return snapshot;
+};
+
+// Work out the per-field increments needed to move from one snapshot to another
+const ratingDeltas = (removed, added) => {
+  const deltas = {};
+  const bump = (path, value) => {
+    if (value) deltas[path] = (deltas[path] || 0) + value;
+  };
+
+  for (const dimension of Object.keys(RATING_DIMENSIONS)) {
+    const before = removed ? removed[dimension] : undefined;
+    const after = added ? added[dimension] : undefined;
+    if (before === after) continue;
+
+    const base = `feedbackStats.${dimension}`;
+    bump(`${base}.sum`, (after || 0) - (before || 0));
+    bump(`${base}.count`, (after ? 1 : 0) - (before ? 1 : 0));
+    if (before) bump(`${base}.histogram.r${before}`, -1);
+    if (after) bump(`${base}.histogram.r${after}`, 1);
+  }
+
+  return deltas;
+};
+
+// Apply a feedback insert/edit/delete to the event in one atomic pipeline update,
+// refreshing averageRating from the running sum and count in the same write, and
+// to the submitting student's rollup
+const applyFeedbackDelta = async (eventId, studentId, removed, added) => {
+  const deltas = ratingDeltas(removed, added);
+  if (Object.keys(deltas).length === 0) return;
+
+  const increments = {};
+  for (const [path, value] of Object.entries(deltas)) {
+    increments[path] = { $add: [{ $ifNull: [`$${path}`, 0] }, value] };
+  }
+
+  const Event = mongoose.model('Event');
+  await Event.updateOne({ _id: eventId }, [
+    { $set: increments },
+    {
+      $set: {
+        averageRating: {
+          $cond: [
+            { $gt: ['$feedbackStats.overall.count', 0] },
+            { $round: [{ $divide: ['$feedbackStats.overall.sum', '$feedbackStats.overall.count'] }, 1] },
+            0
+          ]
+        }
+      }
+    }
+  ]);
+
+  await recordFeedback(
+    studentId,
+    deltas['feedbackStats.overall.sum'] || 0,
+    deltas['feedbackStats.overall.count'] || 0
+  );
+};
+
+// Turn stored running totals into an average and a full 1-5 distribution without aggregating
+const summarizeRatingStats = (stats) => {
+  const count = stats?.count || 0;
+  const distribution = {};
+  for (const value of RATING_VALUES) {
+    distribution[value] = stats?.histogram?.[`r${value}`] || 0;
+  }
+
+  return {
+    average: count > 0 ? Math.round((stats.sum / count) * 10) / 10 : null,
+    count,
+    distribution
+  };
+};
+
+const summarizeFeedbackStats = (feedbackStats) => {
+  const summary = {};
+  for (const dimension of Object.keys(RATING_DIMENSIONS)) {
+    summary[dimension] = summarizeRatingStats(feedbackStats?.[dimension]);
+  }
+  return summary;
+};
+
+module.exports = {
+  RATING_DIMENSIONS,
+  ratingSnapshot,
+  ratingDeltas,
+  applyFeedbackDelta,
+  summarizeRatingStats,
+  summarizeFeedbackStats
+};
+'''
+
+with open('utils/feedbackStats.js', 'w') as f:
+    f.write(feedback_stats_js)
+
+print("✅ Created utils/feedbackStats.js - Running feedback sums, counts and rating histograms")
@@ -0,0 +1,327 @@
+# Create the bounded LRU/TTL cache and the principal cache used by the auth middleware
+
+# Generic LRU cache with optional per-entry TTL
+lru_cache_js = '''// Bounded LRU cache with optional TTL. Map iteration order doubles as recency
+// order: reads move an entry to the back, evictions take from the front.
+class LRUCache {
+  constructor(options = {}) {
+    this.max = options.max === undefined ? 1000 : options.max;
+    this.ttl = options.ttl || 0;
+    this.map = new Map();
+    this.stats = {
+      hits: 0,
+      misses: 0,
+      evictions: 0,
+      expirations: 0
+    };
+  }
+
+  get(key) {
+    const entry = this.map.get(key);
+
+    if (!entry) {
+      this.stats.misses++;
+      return undefined;
+    }
+
+    if (entry.expiresAt && entry.expiresAt <= Date.now()) {
+      this.map.delete(key);
+      this.stats.expirations++;
+      this.stats.misses++;
+      return undefined;
+    }
+
+    this.map.delete(key);
+    this.map.set(key, entry);
+    this.stats.hits++;
+    return entry.value;
+  }
+
+  set(key, value, ttl = this.ttl) {
+    if (this.max <= 0) return;
+
+    if (this.map.has(key)) {
+      this.map.delete(key);
+    } else if (this.map.size >= this.max) {
+      this.map.delete(this.map.keys().next().value);
+      this.stats.evictions++;
+    }
+
+    this.map.set(key, {
+      value,
+      expiresAt: ttl > 0 ? Date.now() + ttl : 0
+    });
+  }
+
+  delete(key) {
+    return this.map.delete(key);
+  }
+
+  clear() {
+    this.map.clear();
+  }
+
+  get size() {
+    return this.map.size;
+  }
+
+  getStats() {
+    const lookups = this.stats.hits + this.stats.misses;
+    return {
+      ...this.stats,
+      size: this.map.size,
+      max: this.max,
+      hitRate: lookups > 0 ? this.stats.hits / lookups : 0
+    };
+  }
+}
+
+module.exports = LRUCache;
+'''
+
+with open('utils/lruCache.js', 'w') as f:
+    f.write(lru_cache_js)
+
+# Principal cache for authenticate/optionalAuth
+principal_cache_js = '''const mongoose = require('mongoose');
+const LRUCache = require('./lruCache');
+const { logger } = require('./logger');
+
+const principalCache = new LRUCache({
+  max: process.env.PRINCIPAL_CACHE_MAX === undefined ? 50000 : parseInt(process.env.PRINCIPAL_CACHE_MAX),
+  ttl: parseInt(process.env.PRINCIPAL_CACHE_TTL_MS) || 60 * 1000
+});
+
+// Invalidations are published to the counters collection as
+// { _id: 'principals', seq, recent: [userId | '*', ...] } and every process
+// polls that one document, so a deactivation or password change made by any
+// worker reaches all of them within SYNC_MS. The TTL is only a backstop.
+const SYNC_MS = parseInt(process.env.PRINCIPAL_CACHE_SYNC_MS) || 1000;
+const INVALIDATIONS_KEY = 'principals';
+const RECENT_MAX = 200;
+const ALL = '*';
+
+// Concurrent misses for the same user share one database load
+const inflight = new Map();
+
+// Bumped on every local invalidation, so a load that raced one is not cached
+let generation = 0;
+let seenSeq = null;
+let syncTimer = null;
+
+// Load a lean user snapshot with its college populated (never includes secrets)
+const fetchPrincipal = (userId) => {
+  const User = mongoose.model('User');
+  return User.findById(userId)
+    .select('-password -passwordResetToken -passwordResetExpires')
+    .populate({ path: 'collegeId', select: 'collegeId name isActive settings' })
+    .lean();
+};
+
+// Cached principals are shared by every request for that user, so they are
+// frozen (plain objects and arrays; ObjectIds and Dates are left alone)
+const freezeDeep = (value) => {
+  if (Array.isArray(value) || (value && Object.getPrototypeOf(value) === Object.prototype)) {
+    Object.values(value).forEach(freezeDeep);
+    Object.freeze(value);
+  }
+  return value;
+};
+
+const dropLocal = (key) => {
+  generation++;
+  if (key === ALL) principalCache.clear();
+  else principalCache.delete(key);
+};
+
+const publish = (key) => {
+  mongoose.model('Counter').collection.updateOne(
+    { _id: INVALIDATIONS_KEY },
+    { $inc: { seq: 1 }, $push: { recent: { $each: [key], $slice: -RECENT_MAX } } },
+    { upsert: true }
+  ).catch((error) => logger.error('Error publishing principal invalidation', { err: error }));
+};
+
+// Apply invalidations published since the last poll; if more happened than
+// the recent list keeps, drop everything
+const syncInvalidations = async () => {
+  const doc = await mongoose.model('Counter').collection.findOne({ _id: INVALIDATIONS_KEY });
+  const seq = doc ? doc.seq : 0;
+
+  if (seenSeq !== null && seq !== seenSeq) {
+    const missed = seq - seenSeq;
+    const recent = doc.recent || [];
+    if (missed > 0 && missed <= recent.length) {
+      recent.slice(-missed).forEach(dropLocal);
+    } else {
+      dropLocal(ALL);
+    }
+  }
+  seenSeq = seq;
+};
+
+const ensureSync = () => {
+  if (syncTimer) return;
+  syncTimer = setInterval(() => {
+    syncInvalidations().catch((error) => logger.error('Error syncing principal invalidations', { err: error }));
+  }, SYNC_MS);
+  syncTimer.unref();
+  syncInvalidations().catch((error) => logger.error('Error syncing principal invalidations', { err: error }));
+};
+
+const stopPrincipalSync = () => {
+  if (syncTimer) clearInterval(syncTimer);
+  syncTimer = null;
+  seenSeq = null;
+};
+
+const getPrincipal = async (userId) => {
+  ensureSync();
+  const key = String(userId);
+  const cached = principalCache.get(key);
+  if (cached) return cached;
+
+  if (!inflight.has(key)) {
+    const startedAt = generation;
+    const load = fetchPrincipal(key)
+      .then((principal) => {
+        if (principal) {
+          freezeDeep(principal);
+          if (generation === startedAt) principalCache.set(key, principal);
+        }
+        return principal;
+      })
+      .finally(() => {
+        inflight.delete(key);
+      });
+    inflight.set(key, load);
+  }
+
+  return inflight.get(key);
+};
+
+// Drop a user here at once and in every other process within SYNC_MS
+const invalidatePrincipal = (userId) => {
+  if (!userId) return;
+  dropLocal(String(userId));
+  publish(String(userId));
+};
+
+const clearPrincipals = () => {
+  dropLocal(ALL);
+  publish(ALL);
+};
+
+const getPrincipalCacheStats = () => principalCache.getStats();
+
+module.exports = {
+  getPrincipal,
+  fetchPrincipal,
+  invalidatePrincipal,
+  clearPrincipals,
+  stopPrincipalSync,
+  getPrincipalCacheStats
+};
+'''
+
+with open('utils/principalCache.js', 'w') as f:
+    f.write(principal_cache_js)
+
+# Auth overhead load test: cached vs uncached principal lookups for 25k students
+auth_principal_bench_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const { User, College } = require('../models');
+const { getPrincipal, fetchPrincipal, clearPrincipals, getPrincipalCacheStats } = require('../utils/principalCache');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const ACTIVE_STUDENTS = parseInt(process.env.BENCH_STUDENTS) || 25000;
+const REQUESTS = parseInt(process.env.BENCH_REQUESTS) || 200000;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 64;
+
+const percentile = (sorted, p) => sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))];
+
+// Skewed picks: a small share of students generate most dashboard traffic
+const pickStudent = (ids) => ids[Math.floor(ids.length * Math.pow(Math.random(), 3))];
+
+const seedStudents = async () => {
+  await User.collection.deleteMany({ userId: /^BENCH/ });
+  await College.collection.deleteMany({ collegeId: 'CLG999' });
+
+  const { insertedId: collegeId } = await College.collection.insertOne({
+    collegeId: 'CLG999',
+    name: 'Benchmark College',
+    isActive: true,
+    settings: { academicYear: '2025-26', currentSemester: 'Fall' }
+  });
+
+  const ids = [];
+  for (let offset = 0; offset < ACTIVE_STUDENTS; offset += 5000) {
+    const batch = [];
+    for (let i = offset; i < Math.min(ACTIVE_STUDENTS, offset + 5000); i++) {
+      batch.push({
+        userId: `BENCH${i}`,
+        name: `Student ${i}`,
+        email: `bench${i}@bench.edu`,
+        password: 'not-a-real-hash',
+        role: 'student',
+        collegeId,
+        studentId: `B${i}`,
+        isActive: true
+      });
+    }
+    const result = await User.collection.insertMany(batch, { ordered: false });
+    ids.push(...Object.values(result.insertedIds));
+  }
+  return ids;
+};
+
+const measure = async (ids, load) => {
+  const samples = new Float64Array(REQUESTS);
+  let next = 0;
+
+  const worker = async () => {
+    while (next < REQUESTS) {
+      const index = next++;
+      const start = process.hrtime.bigint();
+      await load(pickStudent(ids));
+      samples[index] = Number(process.hrtime.bigint() - start) / 1e6;
+    }
+  };
+
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  const sorted = Array.from(samples).sort((a, b) => a - b);
+  return {
+    p50Ms: percentile(sorted, 0.5).toFixed(3),
+    p99Ms: percentile(sorted, 0.99).toFixed(3)
+  };
+};
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  const ids = await seedStudents();
+
+  const uncached = await measure(ids, fetchPrincipal);
+  clearPrincipals();
+  const cached = await measure(ids, getPrincipal);
+
+  console.table({ uncached, cached });
+  console.log('Principal cache:', getPrincipalCacheStats());
+
+  await User.collection.deleteMany({ userId: /^BENCH/ });
+  await College.collection.deleteMany({ collegeId: 'CLG999' });
+  await mongoose.connection.close();
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/authPrincipal.bench.js', 'w') as f:
+    f.write(auth_principal_bench_js)
+
+print("✅ Created utils/lruCache.js - Bounded LRU cache with TTL and hit/miss counters")
+print("✅ Created utils/principalCache.js - Cached lean user/college snapshots for auth")
+print("✅ Created benchmarks/authPrincipal.bench.js - Auth overhead with and without the cache")
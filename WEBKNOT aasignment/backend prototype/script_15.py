@@ -0,0 +1,37 @@
+# Create the JWT verification microbenchmark (cached vs uncached)
+
+jwt_verify_bench_js = '''require('dotenv').config();
+process.env.JWT_SECRET = process.env.JWT_SECRET || 'benchmark-secret';
+
+const { generateToken, verifyToken, verifyTokenUncached, getTokenCacheStats } = require('../config/jwt');
+
+const DISTINCT_TOKENS = parseInt(process.env.BENCH_TOKENS) || 1000;
+const ITERATIONS = parseInt(process.env.BENCH_ITERATIONS) || 200000;
+
+const tokens = Array.from({ length: DISTINCT_TOKENS }, (_, i) =>
+  generateToken({ userId: `user${i}`, role: 'student' })
+);
+
+const run = (verify) => {
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < ITERATIONS; i++) {
+    verify(tokens[i % DISTINCT_TOKENS]);
+  }
+  const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+  return Math.round(ITERATIONS / seconds);
+};
+
+const uncached = run(verifyTokenUncached);
+const cached = run(verifyToken);
+
+console.table({
+  uncached: { verificationsPerSec: uncached },
+  cached: { verificationsPerSec: cached, speedup: `${(cached / uncached).toFixed(1)}x` }
+});
+console.log('Token cache:', getTokenCacheStats());
+'''
+
+with open('benchmarks/jwtVerify.bench.js', 'w') as f:
+    f.write(jwt_verify_bench_js)
+
+print("✅ Created benchmarks/jwtVerify.bench.js - Cached vs uncached JWT verification throughput")
@@ -0,0 +1,372 @@
+# Create controllers and routes for registrations
+os.makedirs('controllers', exist_ok=True)
+os.makedirs('routes', exist_ok=True)
+
+# Registration controller
+registration_controller_js = '''const mongoose = require('mongoose');
+const { User, Event, Registration } = require('../models');
+const { AppError, asyncHandler } = require('../middleware/errorHandler');
+const { idAllocator, formatId } = require('../utils/idAllocator');
+const { paginate } = require('../utils/pagination');
+const { REGISTRATION_DERIVED, USER_DERIVED, leanProjection } = require('../utils/leanViews');
+const {
+  claimSeats,
+  releaseSeats,
+  enqueueWaitlist,
+  leaveWaitlist,
+  fillFromWaitlist,
+  loadOpenEvent,
+  registerStudent,
+  cancelRegistration
+} = require('../utils/registrationService');
+const { recordActivity } = require('../utils/rollups');
+
+const OBJECT_ID_PATTERN = /^[0-9a-f]{24}$/i;
+
+// Only the { studentId, eventId } index means the student is already registered;
+// a clash on registrationId is an ID allocation fault and is reported as failed
+const isDuplicateRegistration = (writeError) => {
+  if (writeError.code !== 11000) return false;
+  const { keyValue } = writeError.err || writeError;
+  return keyValue ? 'studentId' in keyValue : !String(writeError.errmsg).includes('registrationId');
+};
+
+// Register the current student for an event (or place them on the waitlist when full)
+const register = asyncHandler(async (req, res) => {
+  const { eventId, specialRequirements } = req.body;
+
+  const registration = await registerStudent(eventId, req.user, { specialRequirements });
+  const waitlisted = registration.registrationStatus === 'waitlisted';
+
+  res.status(201).json({
+    success: true,
+    message: waitlisted
+      ? `Event is full. You are number ${registration.waitlistPosition} on the waitlist`
+      : 'Successfully registered for the event',
+    data: registration
+  });
+});
+
+// Cancel a registration; students may only cancel their own, college admins
+// only those of their own college
+const cancel = asyncHandler(async (req, res) => {
+  let scope = {};
+  if (req.user.role === 'student') {
+    scope = { studentId: req.user._id };
+  } else if (req.user.adminLevel !== 'super_admin') {
+    scope = { collegeId: req.user.collegeId._id || req.user.collegeId };
+  }
+  const { promoted } = await cancelRegistration(req.params.id, req.body.cancellationReason, scope);
+
+  res.status(200).json({
+    success: true,
+    message: 'Registration cancelled successfully',
+    data: {
+      promoted: promoted.map((reg) => reg.registrationId)
+    }
+  });
+});
+
+// Enrol many students into one event in a single pass. Students are validated
+// with one $in query, registration IDs are reserved up front and documents are
+// written with one unordered insertMany, so the per-document save hooks
+// (lookups, ID generation, counter updates) are bypassed. Seats are claimed with
+// one conditional update on the event and the overflow joins the waitlist.
+const bulkRegister = asyncHandler(async (req, res) => {
+  const { eventId, studentIds, specialRequirements } = req.body;
+
+  const event = await loadOpenEvent(eventId);
+
+  const userCollegeId = req.user.collegeId._id || req.user.collegeId;
+  if (req.user.adminLevel !== 'super_admin' && userCollegeId.toString() !== event.collegeId.toString()) {
+    throw new AppError('Cannot manage registrations for another college', 403, 'FORBIDDEN');
+  }
+
+  // Results keep the caller's strings in order; lookups go through the
+  // canonical lowercase hex form that ObjectId.toString() produces, so an
+  // uppercase ID still matches its student and registration
+  const results = studentIds.map((id) => ({ studentId: id, status: 'invalid_id' }));
+  const byId = new Map();
+  for (const result of results) {
+    if (!OBJECT_ID_PATTERN.test(result.studentId)) continue;
+    const id = result.studentId.toLowerCase();
+    if (byId.has(id)) {
+      result.status = 'duplicate';
+    } else {
+      result.status = 'not_found';
+      byId.set(id, result);
+    }
+  }
+  const validIds = [...byId.keys()];
+
+  const [students, existing] = await Promise.all([
+    User.find({ _id: { $in: validIds }, role: 'student', isActive: true, collegeId: event.collegeId })
+      .select('userId collegeId')
+      .lean(),
+    Registration.find({ eventId: event._id, studentId: { $in: validIds } }).select('studentId registrationId').lean()
+  ]);
+
+  const alreadyRegistered = new Map(existing.map((reg) => [reg.studentId.toString(), reg.registrationId]));
+  const toInsert = [];
+
+  for (const student of students) {
+    const id = student._id.toString();
+    if (alreadyRegistered.has(id)) {
+      Object.assign(byId.get(id), { status: 'duplicate', registrationId: alreadyRegistered.get(id) });
+    } else {
+      toInsert.push(student);
+    }
+  }
+
+  let inserted = 0;
+
+  if (toInsert.length > 0) {
+    const seated = await claimSeats(event._id, toInsert.length);
+    const waitlistPositions = seated < toInsert.length
+      ? await enqueueWaitlist(event._id, toInsert.length - seated)
+      : [];
+    const seqs = await idAllocator.nextMany(`registration:${event.eventId}`, toInsert.length);
+    const now = new Date();
+
+    const docs = toInsert.map((student, i) => new Registration({
+      registrationId: formatId('REG', seqs[i], `${event.eventId}_${student.userId}`),
+      studentId: student._id,
+      eventId: event._id,
+      collegeId: student.collegeId,
+      registrationStatus: i < seated ? 'registered' : 'waitlisted',
+      waitlistPosition: i < seated ? undefined : waitlistPositions[i - seated],
+      registrationSource: 'admin',
+      specialRequirements,
+      createdAt: now,
+      updatedAt: now
+    }).toObject({ virtuals: false }));
+
+    const failed = new Map();
+    try {
+      await Registration.collection.insertMany(docs, { ordered: false });
+    } catch (error) {
+      if (!error.writeErrors) throw error;
+      for (const writeError of [].concat(error.writeErrors)) {
+        failed.set(writeError.index, isDuplicateRegistration(writeError) ? 'duplicate' : 'failed');
+      }
+    }
+
+    let unusedSeats = 0;
+    let unusedPlaces = 0;
+    const seatedStudents = [];
+    docs.forEach((doc, i) => {
+      const result = byId.get(doc.studentId.toString());
+      if (failed.has(i)) {
+        result.status = failed.get(i);
+        if (i < seated) unusedSeats++;
+        else unusedPlaces++;
+      } else {
+        Object.assign(result, { status: doc.registrationStatus, registrationId: doc.registrationId });
+        if (doc.waitlistPosition) result.waitlistPosition = doc.waitlistPosition;
+        if (i < seated) seatedStudents.push({ studentId: doc.studentId, eventsRegistered: 1 });
+        inserted++;
+      }
+    });
+
+    await recordActivity(event, seatedStudents);
+
+    await leaveWaitlist(event._id, unusedPlaces);
+    await releaseSeats(event._id, unusedSeats);
+
+    // Returned seats, or seats freed while the batch was being written, go to
+    // the head of the waitlist, which may include students from this batch
+    if (unusedSeats > 0 || seated < toInsert.length) {
+      const promoted = await fillFromWaitlist(event._id);
+      for (const reg of promoted) {
+        const result = byId.get(reg.studentId.toString());
+        if (result && result.registrationId === reg.registrationId) {
+          result.status = 'registered';
+          delete result.waitlistPosition;
+        }
+      }
+    }
+  }
+
+  const summary = { requested: studentIds.length, registered: 0, waitlisted: 0, duplicate: 0, not_found: 0, invalid_id: 0, failed: 0 };
+  for (const result of results) {
+    summary[result.status]++;
+  }
+
+  res.status(inserted > 0 ? 201 : 200).json({
+    success: true,
+    message: `Registered ${inserted} of ${studentIds.length} students`,
+    data: {
+      summary,
+      results
+    }
+  });
+});
+
+const sameCollege = (user, collegeId) =>
+  user.adminLevel === 'super_admin' || String(user.collegeId._id || user.collegeId) === String(collegeId);
+
+// Attach referenced documents to a page of rows with one $in lookup
+const attach = async (rows, model, localField, as, select, derived) => {
+  const docs = await model.aggregate([
+    { $match: { _id: { $in: rows.map((row) => row[localField]) } } },
+    { $project: leanProjection(select, derived) }
+  ]);
+  const byId = new Map(docs.map((doc) => [String(doc._id), doc]));
+
+  return rows.map(({ [localField]: id, ...row }) => ({ ...row, [as]: byId.get(String(id)) || null }));
+};
+
+// GET /registrations/student/:studentId?limit=&cursor=
+// Newest first by (registrationDate, _id) on the { studentId, registrationDate, _id } index
+const listForStudent = asyncHandler(async (req, res) => {
+  const { studentId } = req.params;
+
+  if (!mongoose.isValidObjectId(studentId)) {
+    throw new AppError('Invalid student ID', 400, 'INVALID_ID');
+  }
+
+  if (req.user.role === 'student') {
+    if (String(req.user._id) !== studentId) {
+      throw new AppError('Students can only view their own registrations', 403, 'FORBIDDEN');
+    }
+  } else {
+    const student = await User.findById(studentId).select('collegeId').lean();
+    if (!student || !sameCollege(req.user, student.collegeId)) {
+      throw new AppError('Student not found', 404, 'NOT_FOUND');
+    }
+  }
+
+  const { items, pagination } = await paginate(Registration, { studentId: new mongoose.Types.ObjectId(studentId) }, {
+    sortField: 'registrationDate',
+    direction: -1,
+    limit: req.query.limit,
+    cursor: req.query.cursor,
+    select: 'registrationId registrationStatus registrationDate waitlistPosition eventId',
+    derived: REGISTRATION_DERIVED
+  });
+
+  res.status(200).json({
+    success: true,
+    data: {
+      registrations: await attach(items, Event, 'eventId', 'event', 'name date venue'),
+      pagination
+    }
+  });
+});
+
+// GET /registrations/event/:eventId?status=&limit=&cursor=
+// First come first listed by (registrationDate, _id) on the { eventId, registrationDate, _id } index
+const listForEvent = asyncHandler(async (req, res) => {
+  const { eventId } = req.params;
+
+  if (!mongoose.isValidObjectId(eventId)) {
+    throw new AppError('Invalid event ID', 400, 'INVALID_ID');
+  }
+
+  const event = await Event.findById(eventId).select('name capacity totalRegistrations collegeId').lean();
+  if (!event || !sameCollege(req.user, event.collegeId)) {
+    throw new AppError('Event not found', 404, 'NOT_FOUND');
+  }
+
+  const filter = { eventId: event._id };
+  if (req.query.status) filter.registrationStatus = String(req.query.status);
+
+  const { items, pagination } = await paginate(Registration, filter, {
+    sortField: 'registrationDate',
+    direction: 1,
+    limit: req.query.limit,
+    cursor: req.query.cursor,
+    select: 'registrationId registrationStatus registrationDate waitlistPosition studentId',
+    derived: REGISTRATION_DERIVED
+  });
+
+  res.status(200).json({
+    success: true,
+    data: {
+      event: { _id: event._id, name: event.name, capacity: event.capacity },
+      registrations: await attach(items, User, 'studentId', 'student', 'name email studentId', USER_DERIVED),
+      stats: {
+        totalRegistrations: event.totalRegistrations,
+        availableSpots: Math.max(0, event.capacity - event.totalRegistrations)
+      },
+      pagination
+    }
+  });
+});
+
+module.exports = {
+  register,
+  cancel,
+  bulkRegister,
+  listForStudent,
+  listForEvent
+};
+'''
+
+with open('controllers/registrationController.js', 'w') as f:
+    f.write(registration_controller_js)
+
+# Registration routes
+registration_routes_js = '''const express = require('express');
+const { authenticate, authorize, checkPermission } = require('../middleware/auth');
+const { validate, registrationSchemas } = require('../middleware/validation');
+const { rateLimit } = require('../middleware/rateLimit');
+const {
+  register,
+  cancel,
+  bulkRegister,
+  listForStudent,
+  listForEvent
+} = require('../controllers/registrationController');
+
+const router = express.Router();
+
+// Register the current student (joins the waitlist when the event is full)
+router.post(
+  '/',
+  authenticate,
+  authorize('student'),
+  rateLimit('registration'),
+  validate(registrationSchemas.create),
+  register
+);
+
+// Enrol a list of students into an event (admin only)
+router.post(
+  '/bulk',
+  authenticate,
+  authorize('admin'),
+  checkPermission('manage_registrations'),
+  rateLimit('registration'),
+  validate(registrationSchemas.bulk),
+  bulkRegister
+);
+
+// List a student's registrations (the student themself or their college's admins)
+router.get('/student/:studentId', authenticate, listForStudent);
+
+// List an event's registrations (admin only)
+router.get(
+  '/event/:eventId',
+  authenticate,
+  authorize('admin'),
+  checkPermission('manage_registrations'),
+  listForEvent
+);
+
+// Cancel a registration and promote the next waitlisted student
+router.delete(
+  '/:id',
+  authenticate,
+  validate(registrationSchemas.cancel),
+  cancel
+);
+
+module.exports = router;
+'''
+
+with open('routes/registrations.js', 'w') as f:
+    f.write(registration_routes_js)
+
+print("✅ Created controllers/registrationController.js - Registration, cancellation and bulk enrolment")
+print("✅ Created routes/registrations.js - Register, cancel and bulk enrolment routes")
@@ -0,0 +1,363 @@
+# Create the registration service (atomic seat claiming + FIFO waitlist)
+
+registration_service_js = '''const mongoose = require('mongoose');
+const { AppError } = require('../middleware/errorHandler');
+const { idAllocator, formatId } = require('./idAllocator');
+const { recordActivity } = require('./rollups');
+
+const isRegistrationOpen = (event) =>
+  event.status === 'active' && event.isRegistrationOpen && event.registrationDeadline > new Date();
+
+// Atomically take up to `count` seats for newcomers with one conditional
+// pipeline update. The filter only matches while seats remain and nobody is
+// waiting, and $min caps the new total at capacity, so concurrent claims can
+// never oversell or overtake the waitlist. Returns the seats granted.
+const claimSeats = async (eventId, count) => {
+  const Event = mongoose.model('Event');
+  const before = await Event.findOneAndUpdate(
+    {
+      _id: eventId,
+      status: 'active',
+      waitlistLength: { $not: { $gt: 0 } },
+      $expr: { $lt: ['$totalRegistrations', '$capacity'] }
+    },
+    [{ $set: { totalRegistrations: { $min: ['$capacity', { $add: ['$totalRegistrations', count] }] } } }],
+    { new: false, projection: { capacity: 1, totalRegistrations: 1 } }
+  ).lean();
+
+  if (!before) return 0;
+  return Math.min(count, before.capacity - before.totalRegistrations);
+};
+
+// Give seats back; returns the event's college/type so callers can update rollups
+const releaseSeats = async (eventId, count) => {
+  if (count <= 0) return null;
+  const Event = mongoose.model('Event');
+  return Event.findOneAndUpdate(
+    { _id: eventId },
+    { $inc: { totalRegistrations: -count } },
+    { projection: { collegeId: 1, eventType: 1 } }
+  ).lean();
+};
+
+// Take one free seat on behalf of the waitlist. Only matches while someone is
+// waiting, and moves them off the waitlist count in the same update.
+const claimWaitlistSeat = async (eventId) => {
+  const Event = mongoose.model('Event');
+  const result = await Event.updateOne(
+    {
+      _id: eventId,
+      status: 'active',
+      waitlistLength: { $gt: 0 },
+      $expr: { $lt: ['$totalRegistrations', '$capacity'] }
+    },
+    { $inc: { totalRegistrations: 1, waitlistLength: -1 } }
+  );
+  return result.modifiedCount === 1;
+};
+
+// Hand out `count` consecutive waitlist positions for the event
+const enqueueWaitlist = async (eventId, count) => {
+  const Event = mongoose.model('Event');
+  const event = await Event.findOneAndUpdate(
+    { _id: eventId },
+    { $inc: { waitlistTail: count, waitlistLength: count } },
+    { new: true, projection: { waitlistTail: 1 } }
+  ).lean();
+
+  const first = event.waitlistTail - count + 1;
+  return Array.from({ length: count }, (_, i) => first + i);
+};
+
+// Drop students who left the waitlist without taking a seat (cancelled,
+// deleted or never inserted) from the event's waitlist count
+const leaveWaitlist = async (eventId, count) => {
+  if (count <= 0) return;
+  const Event = mongoose.model('Event');
+  await Event.updateOne({ _id: eventId }, { $inc: { waitlistLength: -count } });
+};
+
+// Move waitlisted students into free seats in FIFO order. Each promotion is one
+// conditional seat claim plus one index-backed update of the queue head
+// ({ eventId, registrationStatus, waitlistPosition }), independent of queue length.
+// Newcomers cannot claim while waitlistLength > 0, so freed seats always go to
+// the head of the queue.
+const fillFromWaitlist = async (eventId) => {
+  const Event = mongoose.model('Event');
+  const Registration = mongoose.model('Registration');
+  const promoted = [];
+
+  while (await claimWaitlistSeat(eventId)) {
+    const next = await Registration.findOneAndUpdate(
+      { eventId, registrationStatus: 'waitlisted' },
+      { $set: { registrationStatus: 'registered' }, $unset: { waitlistPosition: '' } },
+      { sort: { waitlistPosition: 1 }, new: true }
+    ).lean();
+
+    // The counted entry is not visible yet (still being inserted) or is
+    // being cancelled; hand the seat and the count back to whoever finishes last
+    if (!next) {
+      await Event.updateOne({ _id: eventId }, { $inc: { totalRegistrations: -1, waitlistLength: 1 } });
+      break;
+    }
+
+    promoted.push(next);
+  }
+
+  if (promoted.length > 0) {
+    const event = await Event.findById(eventId).select('collegeId eventType').lean();
+    await recordActivity(event, promoted.map((reg) => ({ studentId: reg.studentId, eventsRegistered: 1 })));
+  }
+
+  return promoted;
+};
+
+const loadOpenEvent = async (eventId) => {
+  const Event = mongoose.model('Event');
+
+  if (!mongoose.isValidObjectId(eventId)) {
+    throw new AppError('Invalid event ID', 400, 'INVALID_ID');
+  }
+
+  const event = await Event.findById(eventId)
+    .select('eventId collegeId eventType status isRegistrationOpen registrationDeadline')
+    .lean();
+
+  if (!event) {
+    throw new AppError('Event not found', 404, 'NOT_FOUND');
+  }
+
+  if (!isRegistrationOpen(event)) {
+    throw new AppError('Registration is closed for this event', 400, 'REGISTRATION_CLOSED');
+  }
+
+  return event;
+};
+
+// Register one student: claim a seat or join the waitlist, then insert the
+// registration. The seat or waitlist place is handed back if the insert fails
+// (e.g. duplicate). A new waitlist entry is offered any seat freed meanwhile.
+const registerStudent = async (eventId, student, details = {}) => {
+  const Registration = mongoose.model('Registration');
+  const event = await loadOpenEvent(eventId);
+
+  const seated = (await claimSeats(event._id, 1)) === 1;
+  const [waitlistPosition] = seated ? [] : await enqueueWaitlist(event._id, 1);
+  const seq = await idAllocator.next(`registration:${event.eventId}`);
+
+  const registration = new Registration({
+    ...details,
+    registrationId: formatId('REG', seq, `${event.eventId}_${student.userId}`),
+    studentId: student._id,
+    eventId: event._id,
+    collegeId: student.collegeId._id || student.collegeId,
+    registrationStatus: seated ? 'registered' : 'waitlisted',
+    waitlistPosition
+  });
+  registration.$locals.skipCounters = true;
+
+  try {
+    await registration.save();
+  } catch (error) {
+    if (seated) {
+      await releaseSeats(event._id, 1);
+      await fillFromWaitlist(event._id);
+    } else {
+      await leaveWaitlist(event._id, 1);
+    }
+    throw error;
+  }
+
+  if (seated) {
+    await recordActivity(event, [{ studentId: student._id, eventsRegistered: 1 }]);
+  } else {
+    const promoted = await fillFromWaitlist(event._id);
+    if (promoted.some((reg) => reg._id.equals(registration._id))) {
+      registration.registrationStatus = 'registered';
+      registration.waitlistPosition = undefined;
+    }
+  }
+
+  return registration;
+};
+
+// Cancel a registration (optionally restricted by `scope`, e.g. { studentId })
+// and promote the next waitlisted student into the freed seat
+const cancelRegistration = async (registrationId, reason, scope = {}) => {
+  const Registration = mongoose.model('Registration');
+
+  if (!mongoose.isValidObjectId(registrationId)) {
+    throw new AppError('Invalid registration ID', 400, 'INVALID_ID');
+  }
+
+  const previous = await Registration.findOneAndUpdate(
+    { ...scope, _id: registrationId, registrationStatus: { $ne: 'cancelled' } },
+    {
+      $set: { registrationStatus: 'cancelled', cancellationDate: new Date(), cancellationReason: reason },
+      $unset: { waitlistPosition: '' }
+    },
+    { new: false }
+  ).lean();
+
+  if (!previous) {
+    throw new AppError('Registration not found or already cancelled', 404, 'NOT_FOUND');
+  }
+
+  let promoted = [];
+  if (previous.registrationStatus === 'waitlisted') {
+    await leaveWaitlist(previous.eventId, 1);
+  } else if (previous.registrationStatus === 'registered') {
+    const event = await releaseSeats(previous.eventId, 1);
+    await recordActivity(event, [{ studentId: previous.studentId, eventsRegistered: -1 }]);
+    promoted = await fillFromWaitlist(previous.eventId);
+  }
+
+  return { registration: previous, promoted };
+};
+
+module.exports = {
+  isRegistrationOpen,
+  claimSeats,
+  claimWaitlistSeat,
+  releaseSeats,
+  enqueueWaitlist,
+  leaveWaitlist,
+  fillFromWaitlist,
+  loadOpenEvent,
+  registerStudent,
+  cancelRegistration
+};
+'''
+
+with open('utils/registrationService.js', 'w') as f:
+    f.write(registration_service_js)
+
+# Concurrency stress test: 10k simultaneous registrations against a 500-seat event
+registration_capacity_stress_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const { College, User, Event, Registration } = require('../models');
+const { registerStudent, cancelRegistration } = require('../utils/registrationService');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const STUDENTS = parseInt(process.env.STRESS_STUDENTS) || 10000;
+const CAPACITY = parseInt(process.env.STRESS_CAPACITY) || 500;
+const CANCELLATIONS = 50;
+
+const check = (condition, message) => {
+  console.log(`${condition ? '✅' : '❌'} ${message}`);
+  if (!condition) process.exitCode = 1;
+};
+
+const cleanup = async (collegeId) => {
+  await Registration.collection.deleteMany({ collegeId });
+  await Event.collection.deleteMany({ collegeId });
+  await User.collection.deleteMany({ collegeId });
+  await College.collection.deleteMany({ _id: collegeId });
+};
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  await Promise.all([Registration.syncIndexes(), Event.syncIndexes()]);
+
+  const collegeId = new mongoose.Types.ObjectId();
+  await College.collection.insertOne({ _id: collegeId, collegeId: 'CLG998', name: 'Stress College' });
+
+  const students = Array.from({ length: STUDENTS }, (_, i) => ({
+    _id: new mongoose.Types.ObjectId(),
+    userId: `STRESS${i}`,
+    collegeId
+  }));
+  await User.collection.insertMany(students.map((s) => ({ ...s, role: 'student', isActive: true })));
+
+  const eventDate = new Date(Date.now() + 7 * 24 * 60 * 60 * 1000);
+  const { insertedId: eventId } = await Event.collection.insertOne({
+    eventId: 'EVT999_CLG998',
+    name: 'Stress Test Workshop',
+    eventType: 'workshop',
+    collegeId,
+    capacity: CAPACITY,
+    date: eventDate,
+    registrationDeadline: new Date(eventDate.getTime() - 24 * 60 * 60 * 1000),
+    status: 'active',
+    isRegistrationOpen: true,
+    totalRegistrations: 0,
+    waitlistTail: 0,
+    waitlistLength: 0
+  });
+
+  const start = Date.now();
+  const outcomes = await Promise.allSettled(students.map((student) => registerStudent(eventId, student)));
+  console.log(`Fired ${STUDENTS} concurrent registrations in ${Date.now() - start}ms`);
+
+  const rejected = outcomes.filter((o) => o.status === 'rejected');
+  check(rejected.length === 0, `no registration failed (${rejected.length} failures)`);
+
+  const event = await Event.findById(eventId).lean();
+  const registered = await Registration.countDocuments({ eventId, registrationStatus: 'registered' });
+  const waitlisted = await Registration.countDocuments({ eventId, registrationStatus: 'waitlisted' });
+
+  check(registered === CAPACITY, `exactly ${CAPACITY} seats taken (got ${registered})`);
+  check(event.totalRegistrations === CAPACITY, `event counter matches capacity (got ${event.totalRegistrations})`);
+  check(waitlisted === STUDENTS - CAPACITY, `overflow waitlisted (got ${waitlisted})`);
+
+  const positions = await Registration.distinct('waitlistPosition', { eventId, registrationStatus: 'waitlisted' });
+  check(positions.length === waitlisted, 'waitlist positions are unique');
+
+  const head = await Registration.find({ eventId, registrationStatus: 'waitlisted' })
+    .sort({ waitlistPosition: 1 })
+    .limit(CANCELLATIONS)
+    .select('_id')
+    .lean();
+  const seated = await Registration.find({ eventId, registrationStatus: 'registered' })
+    .limit(CANCELLATIONS)
+    .select('_id')
+    .lean();
+
+  await Promise.all(seated.map((reg) => cancelRegistration(reg._id, 'stress test')));
+
+  const promotedIds = new Set(head.map((reg) => reg._id.toString()));
+  const nowRegistered = await Registration.find({ _id: { $in: head.map((reg) => reg._id) }, registrationStatus: 'registered' }).lean();
+  const afterCancel = await Event.findById(eventId).lean();
+
+  check(nowRegistered.length === promotedIds.size, `first ${CANCELLATIONS} waitlisted students promoted in FIFO order`);
+  check(afterCancel.totalRegistrations === CAPACITY, `no oversell after promotions (got ${afterCancel.totalRegistrations})`);
+  check(
+    afterCancel.waitlistLength === waitlisted - CANCELLATIONS,
+    `waitlist count follows promotions (got ${afterCancel.waitlistLength})`
+  );
+
+  // Seats freed while newcomers arrive must still go to the queue head
+  const latecomers = Array.from({ length: CANCELLATIONS }, (_, i) => ({
+    _id: new mongoose.Types.ObjectId(),
+    userId: `STRESSLATE${i}`,
+    collegeId
+  }));
+  await User.collection.insertMany(latecomers.map((s) => ({ ...s, role: 'student', isActive: true })));
+  const moreSeated = await Registration.find({ eventId, registrationStatus: 'registered' })
+    .limit(CANCELLATIONS)
+    .select('_id')
+    .lean();
+
+  const [lateOutcomes] = await Promise.all([
+    Promise.allSettled(latecomers.map((student) => registerStudent(eventId, student))),
+    Promise.all(moreSeated.map((reg) => cancelRegistration(reg._id, 'stress test')))
+  ]);
+  const lateSeated = lateOutcomes.filter((o) => o.status === 'fulfilled' && o.value.registrationStatus === 'registered');
+  check(lateSeated.length === 0, `no newcomer overtook the waitlist (${lateSeated.length} did)`);
+
+  await cleanup(collegeId);
+  await mongoose.connection.close();
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/registrationCapacity.stress.js', 'w') as f:
+    f.write(registration_capacity_stress_js)
+
+print("✅ Created utils/registrationService.js - Atomic seat claiming with FIFO waitlist promotion")
+print("✅ Created benchmarks/registrationCapacity.stress.js - 10k concurrent registrations vs 500 seats")
@@ -0,0 +1,537 @@
+# Create the report rollup store (per-student and per-college/event-type summaries)
+
+# Student rollup model
+student_rollup_js = '''const mongoose = require('mongoose');
+
+// Per-student participation summary, keyed by the student's User _id
+const studentRollupSchema = new mongoose.Schema({
+  _id: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: 'User'
+  },
+  collegeId: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: 'College'
+  },
+  eventsRegistered: {
+    type: Number,
+    default: 0
+  },
+  eventsAttended: {
+    type: Number,
+    default: 0
+  },
+  feedbackCount: {
+    type: Number,
+    default: 0
+  },
+  ratingSum: {
+    type: Number,
+    default: 0
+  }
+}, {
+  versionKey: false
+});
+
+studentRollupSchema.index({ collegeId: 1, eventsAttended: -1, eventsRegistered: -1 });
+studentRollupSchema.index({ eventsAttended: -1, eventsRegistered: -1 });
+
+module.exports = mongoose.model('StudentRollup', studentRollupSchema);
+'''
+
+with open('models/StudentRollup.js', 'w') as f:
+    f.write(student_rollup_js)
+
+# College/event-type rollup model
+college_type_rollup_js = '''const mongoose = require('mongoose');
+
+// Per-(college, eventType) totals, keyed by "<collegeId>:<eventType>"
+const collegeTypeRollupSchema = new mongoose.Schema({
+  _id: String,
+  collegeId: {
+    type: mongoose.Schema.Types.ObjectId,
+    ref: 'College',
+    required: true
+  },
+  eventType: {
+    type: String,
+    required: true
+  },
+  totalEvents: {
+    type: Number,
+    default: 0
+  },
+  totalRegistrations: {
+    type: Number,
+    default: 0
+  },
+  totalAttendance: {
+    type: Number,
+    default: 0
+  }
+}, {
+  versionKey: false
+});
+
+collegeTypeRollupSchema.index({ eventType: 1, collegeId: 1 });
+
+module.exports = mongoose.model('CollegeTypeRollup', collegeTypeRollupSchema);
+'''
+
+with open('models/CollegeTypeRollup.js', 'w') as f:
+    f.write(college_type_rollup_js)
+
+# Rollup maintenance
+rollups_js = '''const mongoose = require('mongoose');
+
+const typeRollupKey = (collegeId, eventType) => `${collegeId}:${eventType}`;
+
+const nonZero = (fields) => {
+  const result = {};
+  for (const [field, value] of Object.entries(fields)) {
+    if (value) result[field] = value;
+  }
+  return Object.keys(result).length > 0 ? result : null;
+};
+
+// $inc the (college, eventType) totals for an event
+const incrementTypeRollup = async (event, fields) => {
+  const inc = nonZero(fields);
+  if (!inc) return;
+
+  const CollegeTypeRollup = mongoose.model('CollegeTypeRollup');
+  await CollegeTypeRollup.updateOne(
+    { _id: typeRollupKey(event.collegeId, event.eventType) },
+    { $inc: inc, $setOnInsert: { collegeId: event.collegeId, eventType: event.eventType } },
+    { upsert: true }
+  );
+};
+
+// $inc per-student totals in one unordered bulkWrite
+const incrementStudentRollups = async (collegeId, entries) => {
+  const ops = [];
+  for (const { studentId, ...fields } of entries) {
+    const inc = nonZero(fields);
+    if (!inc) continue;
+
+    const update = { $inc: inc };
+    if (collegeId) update.$setOnInsert = { collegeId };
+    ops.push({ updateOne: { filter: { _id: studentId }, update, upsert: true } });
+  }
+
+  if (ops.length === 0) return;
+
+  const StudentRollup = mongoose.model('StudentRollup');
+  await StudentRollup.bulkWrite(ops, { ordered: false });
+};
+
+// Record registration/attendance changes for an event ({ _id, collegeId, eventType }).
+// Each entry is { studentId, eventsRegistered?, eventsAttended? } with +/- deltas.
+const recordActivity = async (event, entries) => {
+  let totalRegistrations = 0;
+  let totalAttendance = 0;
+  for (const entry of entries) {
+    totalRegistrations += entry.eventsRegistered || 0;
+    totalAttendance += entry.eventsAttended || 0;
+  }
+
+  await Promise.all([
+    incrementTypeRollup(event, { totalRegistrations, totalAttendance }),
+    incrementStudentRollups(event.collegeId, entries)
+  ]);
+};
+
+// Record a change to a student's overall feedback rating contribution
+const recordFeedback = (studentId, ratingSum, feedbackCount) =>
+  incrementStudentRollups(null, [{ studentId, ratingSum, feedbackCount }]);
+
+// Record events being created (+1) or removed (-1), carrying their totals with them
+const recordEvent = (event, direction) =>
+  incrementTypeRollup(event, {
+    totalEvents: direction,
+    totalRegistrations: direction * (event.totalRegistrations || 0),
+    totalAttendance: direction * (event.totalAttendance || 0)
+  });
+
+module.exports = {
+  typeRollupKey,
+  recordActivity,
+  recordFeedback,
+  recordEvent
+};
+'''
+
+with open('utils/rollups.js', 'w') as f:
+    f.write(rollups_js)
+
+# Rebuild command: regenerate every summary from the source collections
+rebuild_rollups_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const { Event, Registration, Attendance, Feedback, StudentRollup, CollegeTypeRollup } = require('../models');
+const { RATING_DIMENSIONS, ratingSnapshot, ratingDeltas } = require('./feedbackStats');
+const { typeRollupKey } = require('./rollups');
+const { bumpAllVersions } = require('./contentVersions');
+
+const BATCH_SIZE = 1000;
+
+const writeInBatches = async (model, ops) => {
+  for (let i = 0; i < ops.length; i += BATCH_SIZE) {
+    await model.bulkWrite(ops.slice(i, i + BATCH_SIZE), { ordered: false });
+  }
+};
+
+// Replace a summary collection without an empty window: the documents are
+// streamed into a scratch collection, which then replaces the live one in a
+// single $out (the live collection keeps its indexes and serves the old
+// summaries until the swap)
+const replaceCollection = async (model, docs) => {
+  const live = model.collection.collectionName;
+  const scratch = mongoose.connection.db.collection(`${live}_rebuild`);
+  await scratch.drop().catch(() => {}); // left over from an interrupted rebuild
+
+  let batch = [];
+  for (const doc of docs) {
+    batch.push(doc);
+    if (batch.length === BATCH_SIZE) {
+      await scratch.insertMany(batch, { ordered: false });
+      batch = [];
+    }
+  }
+  if (batch.length > 0) await scratch.insertMany(batch, { ordered: false });
+
+  await scratch.aggregate([{ $out: live }]).toArray();
+  await scratch.drop();
+};
+
+const emptyEventTotals = () => ({ totalRegistrations: 0, totalAttendance: 0, feedback: {} });
+const emptyStudentTotals = () => ({ eventsRegistered: 0, eventsAttended: 0, feedbackCount: 0, ratingSum: 0 });
+
+// Expand accumulated 'feedbackStats.<dimension>.<field>' increments into a full feedbackStats object
+const feedbackStatsFrom = (paths) => {
+  const stats = {};
+  for (const dimension of Object.keys(RATING_DIMENSIONS)) {
+    const base = `feedbackStats.${dimension}`;
+    const histogram = {};
+    for (let value = 1; value <= 5; value++) {
+      histogram[`r${value}`] = paths[`${base}.histogram.r${value}`] || 0;
+    }
+    stats[dimension] = {
+      sum: paths[`${base}.sum`] || 0,
+      count: paths[`${base}.count`] || 0,
+      histogram
+    };
+  }
+  return stats;
+};
+
+// Stream each source collection once through a lean cursor, accumulate the
+// totals in memory (bounded by #events + #students) and rewrite every summary.
+// Like the incremental path, a student's rollup takes its collegeId from the
+// event the activity belongs to (students only take part in their own
+// college's events), never from the registration.
+const rebuildRollups = async () => {
+  const events = new Map();
+  const students = new Map();
+  const eventTotals = (id) => {
+    const key = String(id);
+    if (!events.has(key)) events.set(key, emptyEventTotals());
+    return events.get(key);
+  };
+  const studentTotals = (id, eventId) => {
+    const key = String(id);
+    if (!students.has(key)) students.set(key, { _id: id, collegeId: eventCollege(eventId), ...emptyStudentTotals() });
+    return students.get(key);
+  };
+
+  const eventInfo = new Map();
+  for await (const event of Event.find().select('collegeId eventType').lean().cursor({ batchSize: BATCH_SIZE })) {
+    eventInfo.set(String(event._id), event);
+  }
+  const eventCollege = (id) => eventInfo.get(String(id))?.collegeId;
+
+  const registrations = Registration.find({ registrationStatus: 'registered' })
+    .select('studentId eventId')
+    .lean()
+    .cursor({ batchSize: BATCH_SIZE });
+  for await (const reg of registrations) {
+    eventTotals(reg.eventId).totalRegistrations++;
+    studentTotals(reg.studentId, reg.eventId).eventsRegistered++;
+  }
+
+  const attendance = Attendance.find().select('studentId eventId').lean().cursor({ batchSize: BATCH_SIZE });
+  for await (const record of attendance) {
+    eventTotals(record.eventId).totalAttendance++;
+    studentTotals(record.studentId, record.eventId).eventsAttended++;
+  }
+
+  const feedback = Feedback.find().select('studentId eventId overallRating categories').lean().cursor({ batchSize: BATCH_SIZE });
+  for await (const entry of feedback) {
+    const totals = eventTotals(entry.eventId);
+    for (const [path, value] of Object.entries(ratingDeltas(null, ratingSnapshot(entry)))) {
+      totals.feedback[path] = (totals.feedback[path] || 0) + value;
+    }
+    const student = studentTotals(entry.studentId, entry.eventId);
+    student.feedbackCount++;
+    student.ratingSum += entry.overallRating;
+  }
+
+  // Per-event summaries live on the event documents themselves
+  const types = new Map();
+  const eventOps = [];
+  for (const event of eventInfo.values()) {
+    const totals = events.get(String(event._id)) || emptyEventTotals();
+    const feedbackStats = feedbackStatsFrom(totals.feedback);
+    const { sum, count } = feedbackStats.overall;
+
+    eventOps.push({
+      updateOne: {
+        filter: { _id: event._id },
+        update: {
+          $set: {
+            totalRegistrations: totals.totalRegistrations,
+            totalAttendance: totals.totalAttendance,
+            averageRating: count > 0 ? Math.round((sum / count) * 10) / 10 : 0,
+            feedbackStats
+          }
+        }
+      }
+    });
+
+    const key = typeRollupKey(event.collegeId, event.eventType);
+    if (!types.has(key)) {
+      types.set(key, { _id: key, collegeId: event.collegeId, eventType: event.eventType, totalEvents: 0, totalRegistrations: 0, totalAttendance: 0 });
+    }
+    const type = types.get(key);
+    type.totalEvents++;
+    type.totalRegistrations += totals.totalRegistrations;
+    type.totalAttendance += totals.totalAttendance;
+  }
+
+  await writeInBatches(Event, eventOps);
+
+  await replaceCollection(StudentRollup, students.values());
+  await replaceCollection(CollegeTypeRollup, types.values());
+
+  // Event counters and rating stats were rewritten in bulk
+  await bumpAllVersions();
+
+  return {
+    events: eventInfo.size,
+    students: students.size,
+    collegeTypes: types.size
+  };
+};
+
+if (require.main === module) {
+  mongoose.connect(process.env.MONGODB_URI)
+    .then(() => rebuildRollups())
+    .then((result) => {
+      console.log(`✅ Rebuilt rollups: ${result.events} events, ${result.students} students, ${result.collegeTypes} college/type pairs`);
+      return mongoose.connection.close();
+    })
+    .catch((error) => {
+      console.error('❌ Error rebuilding rollups:', error);
+      process.exit(1);
+    });
+}
+
+module.exports = {
+  feedbackStatsFrom,
+  rebuildRollups
+};
+'''
+
+with open('utils/rebuildRollups.js', 'w') as f:
+    f.write(rebuild_rollups_js)
+
+# Report controller
+report_controller_js = '''const mongoose = require('mongoose');
+const { Event, User, StudentRollup, CollegeTypeRollup } = require('../models');
+const { AppError, asyncHandler } = require('../middleware/errorHandler');
+
+const EVENT_TYPES = Event.schema.path('eventType').enumValues;
+
+// College admins are always scoped to their own college; super admins may pick one
+const collegeScope = (req) => {
+  if (req.user.adminLevel !== 'super_admin') {
+    return req.user.collegeId._id || req.user.collegeId;
+  }
+
+  const { collegeId } = req.query;
+  if (!collegeId) return null;
+  if (!mongoose.isValidObjectId(collegeId)) {
+    throw new AppError('Invalid college ID', 400, 'INVALID_ID');
+  }
+  return new mongoose.Types.ObjectId(collegeId);
+};
+
+const parseLimit = (value, fallback, max = 500) => Math.min(max, Math.max(1, parseInt(value) || fallback));
+
+const attendanceRate = (rollup) =>
+  rollup.eventsRegistered > 0 ? Math.round((rollup.eventsAttended / rollup.eventsRegistered) * 100) : 0;
+
+// Attach name/studentId/department to student rollups with one $in lookup
+const withStudents = async (rollups) => {
+  const users = await User.find({ _id: { $in: rollups.map((r) => r._id) } })
+    .select('name studentId department')
+    .lean();
+  const byId = new Map(users.map((user) => [String(user._id), user]));
+
+  return rollups.map((rollup) => ({
+    student: byId.get(String(rollup._id)) || { _id: rollup._id },
+    eventsRegistered: rollup.eventsRegistered,
+    eventsAttended: rollup.eventsAttended,
+    attendanceRate: attendanceRate(rollup),
+    averageFeedbackRating: rollup.feedbackCount > 0
+      ? Math.round((rollup.ratingSum / rollup.feedbackCount) * 10) / 10
+      : null
+  }));
+};
+
+// GET /reports/events/popularity
+const eventPopularity = asyncHandler(async (req, res) => {
+  const collegeId = collegeScope(req);
+  const events = await Event.find(collegeId ? { collegeId } : {})
+    .sort({ totalRegistrations: -1 })
+    .limit(parseLimit(req.query.limit, 10))
+    .select('name eventType date totalRegistrations totalAttendance averageRating')
+    .lean();
+
+  res.status(200).json({
+    success: true,
+    data: events.map(({ totalRegistrations, totalAttendance, averageRating, ...event }) => ({
+      event,
+      totalRegistrations,
+      totalAttendance,
+      averageRating
+    }))
+  });
+});
+
+// GET /reports/students/participation
+const studentParticipation = asyncHandler(async (req, res) => {
+  const collegeId = collegeScope(req);
+  const filter = collegeId ? { collegeId } : {};
+
+  if (req.query.studentId) {
+    if (!mongoose.isValidObjectId(req.query.studentId)) {
+      throw new AppError('Invalid student ID', 400, 'INVALID_ID');
+    }
+    filter._id = new mongoose.Types.ObjectId(req.query.studentId);
+  }
+
+  const rollups = await StudentRollup.find(filter)
+    .sort({ eventsAttended: -1, eventsRegistered: -1 })
+    .limit(parseLimit(req.query.limit, 100))
+    .lean();
+
+  res.status(200).json({
+    success: true,
+    data: await withStudents(rollups)
+  });
+});
+
+// GET /reports/students/top-active
+const topActiveStudents = asyncHandler(async (req, res) => {
+  const collegeId = collegeScope(req);
+  const rollups = await StudentRollup.find(collegeId ? { collegeId } : {})
+    .sort({ eventsAttended: -1, eventsRegistered: -1 })
+    .limit(3)
+    .lean();
+
+  const data = (await withStudents(rollups)).map(({ averageFeedbackRating, ...entry }) => entry);
+
+  res.status(200).json({
+    success: true,
+    data
+  });
+});
+
+// GET /reports/events/by-type
+const eventsByType = asyncHandler(async (req, res) => {
+  const { eventType } = req.query;
+  if (!EVENT_TYPES.includes(eventType)) {
+    throw new AppError(`eventType must be one of ${EVENT_TYPES.join(', ')}`, 400, 'VALIDATION_ERROR');
+  }
+
+  const collegeId = collegeScope(req);
+  const filter = collegeId ? { eventType, collegeId } : { eventType };
+
+  const [events, rollups] = await Promise.all([
+    Event.find(filter)
+      .sort({ date: -1 })
+      .limit(parseLimit(req.query.limit, 100))
+      .select('name date totalRegistrations totalAttendance')
+      .lean(),
+    CollegeTypeRollup.find(filter).lean()
+  ]);
+
+  const stats = { totalEvents: 0, totalRegistrations: 0, totalAttendance: 0 };
+  for (const rollup of rollups) {
+    stats.totalEvents += rollup.totalEvents;
+    stats.totalRegistrations += rollup.totalRegistrations;
+    stats.totalAttendance += rollup.totalAttendance;
+  }
+  stats.averageAttendanceRate = stats.totalRegistrations > 0
+    ? Math.round((stats.totalAttendance / stats.totalRegistrations) * 100)
+    : 0;
+
+  res.status(200).json({
+    success: true,
+    data: {
+      eventType,
+      events,
+      stats
+    }
+  });
+});
+
+module.exports = {
+  collegeScope,
+  eventPopularity,
+  studentParticipation,
+  topActiveStudents,
+  eventsByType
+};
+'''
+
+with open('controllers/reportController.js', 'w') as f:
+    f.write(report_controller_js)
+
+# Report routes
+report_routes_js = '''const express = require('express');
+const { authenticate, authorize, checkPermission, checkCollegeAccess } = require('../middleware/auth');
+const { rateLimit } = require('../middleware/rateLimit');
+const {
+  eventPopularity,
+  studentParticipation,
+  topActiveStudents,
+  eventsByType
+} = require('../controllers/reportController');
+const { exportDataset } = require('../controllers/exportController');
+
+const router = express.Router();
+
+// All reports are admin only and read from the rollup summaries; they share
+// their own per-admin and per-college request budget
+router.use(authenticate, authorize('admin'), checkPermission('view_reports'), checkCollegeAccess, rateLimit('reports'));
+
+router.get('/events/popularity', eventPopularity);
+router.get('/students/participation', studentParticipation);
+router.get('/students/top-active', topActiveStudents);
+router.get('/events/by-type', eventsByType);
+
+// Streaming CSV/NDJSON exports of registrations, attendance and feedback
+router.get('/exports/:dataset', exportDataset);
+
+module.exports = router;
+'''
+
+with open('routes/reports.js', 'w') as f:
+    f.write(report_routes_js)
+
+print("✅ Created models/StudentRollup.js & models/CollegeTypeRollup.js - Report summary documents")
+print("✅ Created utils/rollups.js - Incremental rollup maintenance")
+print("✅ Created utils/rebuildRollups.js - Streaming rebuild of all report summaries")
+print("✅ Created controllers/reportController.js & routes/reports.js - Reports served from rollups")
@@ -0,0 +1,400 @@
+# Create the write-coalescing check-in pipeline, attendance controller and routes
+
+# Check-in batcher
+check_in_batcher_js = '''const mongoose = require('mongoose');
+const { idAllocator, formatId } = require('./idAllocator');
+const { recordActivity } = require('./rollups');
+const { bumpCollegeVersion } = require('./contentVersions');
+
+const DEFAULT_MAX_DELAY_MS = parseInt(process.env.CHECKIN_BATCH_DELAY_MS) || 5;
+const DEFAULT_MAX_BATCH_SIZE = parseInt(process.env.CHECKIN_BATCH_SIZE) || 500;
+
+const pairKey = (eventId, studentId) => `${eventId}:${studentId}`;
+
+// Buffers check-ins for a few milliseconds and writes each batch with:
+//   - one $in query against registrations (plus batched event/student lookups),
+//   - one unordered insertMany into attendance,
+//   - one bulkWrite of $inc totalAttendance per event touched.
+// Every caller still gets its own result.
+class CheckInBatcher {
+  constructor(options = {}) {
+    this.maxDelayMs = options.maxDelayMs || DEFAULT_MAX_DELAY_MS;
+    this.maxBatchSize = options.maxBatchSize || DEFAULT_MAX_BATCH_SIZE;
+    this.pending = new Map();
+    this.timer = null;
+    this.stats = {
+      submitted: 0,
+      batches: 0,
+      checkedIn: 0,
+      duplicates: 0,
+      rejected: 0,
+      forbidden: 0,
+      failed: 0
+    };
+  }
+
+  // Queue a check-in; resolves with { status, attendance? } once its batch is written.
+  // status is 'checked_in', 'already_checked_in', 'not_registered' or, when
+  // `collegeId` restricts the check-in to one college's events, 'forbidden'.
+  submit({ eventId, studentId, checkInMethod, checkInLocation, collegeId = null }) {
+    this.stats.submitted++;
+    const key = pairKey(eventId, studentId);
+
+    return new Promise((resolve, reject) => {
+      // Repeated scans of the same student within a batch share one write
+      if (!this.pending.has(key)) {
+        this.pending.set(key, {
+          eventId: String(eventId),
+          studentId: String(studentId),
+          checkInMethod,
+          checkInLocation,
+          checkInTime: new Date(),
+          waiters: []
+        });
+      }
+      this.pending.get(key).waiters.push({ resolve, reject, collegeId: collegeId && String(collegeId) });
+
+      if (this.pending.size >= this.maxBatchSize) {
+        this.flush();
+      } else if (!this.timer) {
+        this.timer = setTimeout(() => this.flush(), this.maxDelayMs);
+      }
+    });
+  }
+
+  flush() {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (this.pending.size === 0) return Promise.resolve();
+
+    const batch = Array.from(this.pending.values());
+    this.pending = new Map();
+    this.stats.batches++;
+
+    return this.writeBatch(batch).catch((error) => {
+      for (const entry of batch) {
+        for (const waiter of entry.waiters) waiter.reject(error);
+      }
+    });
+  }
+
+  async writeBatch(batch) {
+    const { Event, User, Registration, Attendance } = mongoose.models;
+    const eventIds = [...new Set(batch.map((entry) => entry.eventId))];
+    const studentIds = [...new Set(batch.map((entry) => entry.studentId))];
+
+    const [registrations, events, students] = await Promise.all([
+      Registration.find({
+        eventId: { $in: eventIds },
+        studentId: { $in: studentIds },
+        registrationStatus: 'registered'
+      }).select('eventId studentId').lean(),
+      Event.find({ _id: { $in: eventIds } }).select('eventId collegeId eventType').lean(),
+      User.find({ _id: { $in: studentIds } }).select('userId').lean()
+    ]);
+
+    const registrationByPair = new Map(registrations.map((reg) => [pairKey(reg.eventId, reg.studentId), reg._id]));
+    const eventById = new Map(events.map((event) => [String(event._id), event]));
+    const userIdById = new Map(students.map((student) => [String(student._id), student.userId]));
+
+    const accepted = [];
+    for (const entry of batch) {
+      entry.registrationId = registrationByPair.get(pairKey(entry.eventId, entry.studentId));
+      entry.event = eventById.get(entry.eventId);
+
+      // Scanners scoped to another college are turned away before anything is
+      // written; the remaining waiters for the same student still go ahead
+      if (entry.event) {
+        const collegeId = String(entry.event.collegeId);
+        entry.waiters = entry.waiters.filter((waiter) => {
+          if (!waiter.collegeId || waiter.collegeId === collegeId) return true;
+          this.stats.forbidden++;
+          waiter.resolve({ status: 'forbidden' });
+          return false;
+        });
+        if (entry.waiters.length === 0) continue;
+      }
+
+      if (entry.registrationId && entry.event && userIdById.has(entry.studentId)) {
+        accepted.push(entry);
+      } else {
+        this.settle(entry, { status: 'not_registered' });
+        this.stats.rejected++;
+      }
+    }
+
+    if (accepted.length === 0) return;
+
+    // Reserve attendance IDs per event in one allocation each
+    const byEvent = new Map();
+    for (const entry of accepted) {
+      if (!byEvent.has(entry.eventId)) byEvent.set(entry.eventId, []);
+      byEvent.get(entry.eventId).push(entry);
+    }
+    for (const entries of byEvent.values()) {
+      const { eventId: eventCode } = entries[0].event;
+      const seqs = await idAllocator.nextMany(`attendance:${eventCode}`, entries.length);
+      entries.forEach((entry, i) => {
+        entry.attendanceId = formatId('ATT', seqs[i], `${eventCode}_${userIdById.get(entry.studentId)}`);
+      });
+    }
+
+    const docs = accepted.map((entry) => new Attendance({
+      attendanceId: entry.attendanceId,
+      studentId: entry.studentId,
+      eventId: entry.eventId,
+      registrationId: entry.registrationId,
+      checkInTime: entry.checkInTime,
+      checkInMethod: entry.checkInMethod,
+      checkInLocation: entry.checkInLocation,
+      createdAt: entry.checkInTime,
+      updatedAt: entry.checkInTime
+    }).toObject({ virtuals: false }));
+
+    // An unordered insertMany writes every row it can, so on a partial failure
+    // the counters and rollups are still applied for the rows that went in,
+    // and only the rows that failed are rejected
+    const duplicates = new Set();
+    const failures = new Map();
+    try {
+      await Attendance.collection.insertMany(docs, { ordered: false });
+    } catch (error) {
+      if (!error.writeErrors) throw error;
+      for (const writeError of [].concat(error.writeErrors)) {
+        if (writeError.code === 11000) duplicates.add(writeError.index);
+        else failures.set(writeError.index, error);
+      }
+    }
+
+    const checkedInByEvent = new Map();
+    accepted.forEach((entry, i) => {
+      if (failures.has(i)) return;
+      if (duplicates.has(i)) {
+        this.stats.duplicates++;
+        this.settle(entry, { status: 'already_checked_in' });
+        return;
+      }
+      if (!checkedInByEvent.has(entry.eventId)) checkedInByEvent.set(entry.eventId, []);
+      checkedInByEvent.get(entry.eventId).push(entry);
+    });
+
+    if (checkedInByEvent.size > 0) {
+      await Event.bulkWrite(Array.from(checkedInByEvent, ([eventId, entries]) => ({
+        updateOne: {
+          filter: { _id: eventId },
+          update: { $inc: { totalAttendance: entries.length } }
+        }
+      })), { ordered: false });
+
+      await Promise.all(Array.from(checkedInByEvent.values(), (entries) =>
+        recordActivity(entries[0].event, entries.map((entry) => ({ studentId: entry.studentId, eventsAttended: 1 })))
+      ));
+
+      const collegeIds = new Set(Array.from(checkedInByEvent.values(), (entries) => String(entries[0].event.collegeId)));
+      await Promise.all(Array.from(collegeIds, bumpCollegeVersion));
+    }
+
+    accepted.forEach((entry, i) => {
+      if (failures.has(i)) {
+        this.stats.failed++;
+        for (const waiter of entry.waiters) waiter.reject(failures.get(i));
+        return;
+      }
+      if (duplicates.has(i)) return;
+      this.stats.checkedIn++;
+      this.settle(entry, { status: 'checked_in', attendance: docs[i] });
+    });
+  }
+
+  settle(entry, result) {
+    for (const waiter of entry.waiters) waiter.resolve(result);
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      queued: this.pending.size,
+      averageBatchSize: this.stats.batches > 0 ? this.stats.submitted / this.stats.batches : 0
+    };
+  }
+}
+
+// Shared per-process instance used by the check-in endpoint
+const checkInBatcher = new CheckInBatcher();
+
+module.exports = {
+  CheckInBatcher,
+  checkInBatcher
+};
+'''
+
+with open('utils/checkInBatcher.js', 'w') as f:
+    f.write(check_in_batcher_js)
+
+# Attendance controller
+attendance_controller_js = '''const { AppError, asyncHandler } = require('../middleware/errorHandler');
+const { checkInBatcher } = require('../utils/checkInBatcher');
+const mongoose = require('mongoose');
+
+// Check a student in. Students check themselves in; admins operating a
+// scanner pass the scanned studentId. Requests are coalesced into batches.
+const checkIn = asyncHandler(async (req, res) => {
+  const { eventId, checkInMethod, checkInLocation } = req.body;
+  const isAdmin = req.user.role === 'admin';
+  const studentId = isAdmin ? req.body.studentId : req.user._id;
+  // Admin scanners may only check students in to their own college's events
+  const collegeId = isAdmin && req.user.adminLevel !== 'super_admin'
+    ? req.user.collegeId._id || req.user.collegeId
+    : null;
+
+  if (!mongoose.isValidObjectId(eventId) || !mongoose.isValidObjectId(studentId)) {
+    throw new AppError('Invalid event or student ID', 400, 'INVALID_ID');
+  }
+
+  const result = await checkInBatcher.submit({ eventId, studentId, checkInMethod, checkInLocation, collegeId });
+
+  if (result.status === 'forbidden') {
+    throw new AppError('Cannot check in students for another college', 403, 'FORBIDDEN');
+  }
+
+  if (result.status === 'not_registered') {
+    throw new AppError('Student is not registered for this event', 400, 'NOT_REGISTERED');
+  }
+
+  if (result.status === 'already_checked_in') {
+    throw new AppError('Student has already checked in to this event', 409, 'ALREADY_ATTENDED');
+  }
+
+  res.status(201).json({
+    success: true,
+    message: 'Successfully checked in to the event',
+    data: result.attendance
+  });
+});
+
+module.exports = {
+  checkIn
+};
+'''
+
+with open('controllers/attendanceController.js', 'w') as f:
+    f.write(attendance_controller_js)
+
+# Attendance routes
+attendance_routes_js = '''const express = require('express');
+const { authenticate, authorize } = require('../middleware/auth');
+const { validate, attendanceSchemas } = require('../middleware/validation');
+const { checkIn } = require('../controllers/attendanceController');
+
+const router = express.Router();
+
+// Check in to an event (student self check-in or admin scanner)
+router.post(
+  '/checkin',
+  authenticate,
+  authorize('student', 'admin'),
+  validate(attendanceSchemas.checkIn),
+  checkIn
+);
+
+module.exports = router;
+'''
+
+with open('routes/attendance.js', 'w') as f:
+    f.write(attendance_routes_js)
+
+# Check-in throughput benchmark
+check_in_bench_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const { College, User, Event, Registration, Attendance } = require('../models');
+const { CheckInBatcher } = require('../utils/checkInBatcher');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const CHECK_INS = parseInt(process.env.BENCH_CHECKINS) || 25000;
+const RATE = parseInt(process.env.BENCH_RATE) || 5000; // check-ins offered per second
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  await Attendance.syncIndexes();
+
+  const collegeId = new mongoose.Types.ObjectId();
+  const eventId = new mongoose.Types.ObjectId();
+  await College.collection.insertOne({ _id: collegeId, collegeId: 'CLG997', name: 'Check-in Bench College' });
+  await Event.collection.insertOne({
+    _id: eventId,
+    eventId: 'EVT997_CLG997',
+    eventType: 'fest',
+    collegeId,
+    capacity: CHECK_INS,
+    totalRegistrations: CHECK_INS,
+    totalAttendance: 0
+  });
+
+  const students = Array.from({ length: CHECK_INS }, (_, i) => ({
+    _id: new mongoose.Types.ObjectId(),
+    userId: `CHK${i}`,
+    role: 'student',
+    collegeId
+  }));
+  await User.collection.insertMany(students);
+  await Registration.collection.insertMany(students.map((student, i) => ({
+    registrationId: `REG${i}_EVT997_CLG997_CHK${i}`,
+    studentId: student._id,
+    eventId,
+    collegeId,
+    registrationStatus: 'registered'
+  })));
+
+  const batcher = new CheckInBatcher();
+  const latencies = [];
+  const pending = [];
+  const start = Date.now();
+
+  // Offer check-ins at a fixed rate in 10ms ticks, like scanners at the doors
+  const perTick = Math.max(1, Math.round(RATE / 100));
+  for (let i = 0; i < CHECK_INS; i += perTick) {
+    for (const student of students.slice(i, i + perTick)) {
+      const submitted = process.hrtime.bigint();
+      pending.push(batcher.submit({ eventId, studentId: student._id, checkInMethod: 'qr_code' })
+        .then(() => latencies.push(Number(process.hrtime.bigint() - submitted) / 1e6)));
+    }
+    await new Promise((resolve) => setTimeout(resolve, 10));
+  }
+  await Promise.all(pending);
+
+  const seconds = (Date.now() - start) / 1000;
+  latencies.sort((a, b) => a - b);
+  const event = await Event.findById(eventId).lean();
+
+  console.table({
+    checkIns: CHECK_INS,
+    checkInsPerSec: Math.round(CHECK_INS / seconds),
+    p50Ms: latencies[Math.floor(latencies.length * 0.5)].toFixed(2),
+    p99Ms: latencies[Math.floor(latencies.length * 0.99)].toFixed(2),
+    totalAttendance: event.totalAttendance
+  });
+  console.log('Batcher:', batcher.getStats());
+
+  await Attendance.collection.deleteMany({ eventId });
+  await Registration.collection.deleteMany({ eventId });
+  await User.collection.deleteMany({ collegeId });
+  await Event.collection.deleteMany({ _id: eventId });
+  await College.collection.deleteMany({ _id: collegeId });
+  await mongoose.connection.close();
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/checkIn.bench.js', 'w') as f:
+    f.write(check_in_bench_js)
+
+print("✅ Created utils/checkInBatcher.js - Write-coalescing check-in pipeline")
+print("✅ Created controllers/attendanceController.js & routes/attendance.js - POST /attendance/checkin")
+print("✅ Created benchmarks/checkIn.bench.js - Sustained check-in throughput")
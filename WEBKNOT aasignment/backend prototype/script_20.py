@@ -0,0 +1,261 @@
+# Create streaming CSV/NDJSON exports for registrations, attendance and feedback
+
+export_stream_js = '''const mongoose = require('mongoose');
+
+const EXPORT_BATCH_SIZE = parseInt(process.env.EXPORT_BATCH_SIZE) || 1000;
+
+const studentColumns = [
+  ['studentUserId', (row, student) => student?.userId],
+  ['studentName', (row, student) => student?.name],
+  ['studentEmail', (row, student) => student?.email],
+  ['studentNumber', (row, student) => student?.studentId],
+  ['department', (row, student) => student?.department]
+];
+
+const eventColumns = [
+  ['eventCode', (row, student, event) => event?.eventId],
+  ['eventName', (row, student, event) => event?.name]
+];
+
+// What each dataset exports: source model, filterable fields and CSV columns.
+// Columns read from the lean row plus the student/event it references.
+const EXPORT_DATASETS = {
+  registrations: {
+    model: 'Registration',
+    dateField: 'registrationDate',
+    collegeField: 'collegeId',
+    select: 'registrationId studentId eventId registrationDate registrationStatus paymentStatus registrationSource specialRequirements',
+    columns: [
+      ['registrationId', (row) => row.registrationId],
+      ...studentColumns,
+      ...eventColumns,
+      ['registrationDate', (row) => row.registrationDate],
+      ['registrationStatus', (row) => row.registrationStatus],
+      ['paymentStatus', (row) => row.paymentStatus],
+      ['registrationSource', (row) => row.registrationSource],
+      ['specialRequirements', (row) => row.specialRequirements]
+    ]
+  },
+  attendance: {
+    model: 'Attendance',
+    dateField: 'checkInTime',
+    select: 'attendanceId studentId eventId checkInTime checkInMethod checkInLocation checkOutTime actualDuration isVerified',
+    columns: [
+      ['attendanceId', (row) => row.attendanceId],
+      ...studentColumns,
+      ...eventColumns,
+      ['checkInTime', (row) => row.checkInTime],
+      ['checkInMethod', (row) => row.checkInMethod],
+      ['checkInLocation', (row) => row.checkInLocation],
+      ['checkOutTime', (row) => row.checkOutTime],
+      ['actualDuration', (row) => row.actualDuration],
+      ['isVerified', (row) => row.isVerified]
+    ]
+  },
+  feedback: {
+    model: 'Feedback',
+    dateField: 'submissionDate',
+    select: 'feedbackId studentId eventId isAnonymous overallRating contentRating organizationRating venueRating wouldRecommend comments suggestions submissionDate',
+    columns: [
+      ['feedbackId', (row) => row.feedbackId],
+      ...studentColumns,
+      ...eventColumns,
+      ['overallRating', (row) => row.overallRating],
+      ['contentRating', (row) => row.contentRating],
+      ['organizationRating', (row) => row.organizationRating],
+      ['venueRating', (row) => row.venueRating],
+      ['wouldRecommend', (row) => row.wouldRecommend],
+      ['comments', (row) => row.comments],
+      ['suggestions', (row) => row.suggestions],
+      ['submissionDate', (row) => row.submissionDate]
+    ]
+  }
+};
+
+const EXPORT_FORMATS = {
+  csv: 'text/csv; charset=utf-8',
+  ndjson: 'application/x-ndjson; charset=utf-8'
+};
+
+// Quote CSV fields when needed and neutralise spreadsheet formulas
+const csvField = (value) => {
+  if (value === undefined || value === null) return '';
+  let text = value instanceof Date ? value.toISOString() : String(value);
+  if (/^[=+\\-@\\t\\r]/.test(text)) text = `'${text}`;
+  return /[",\\r\\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const csvLine = (values) => values.map(csvField).join(',') + '\\n';
+
+// Resolve the students and events referenced by one batch with two $in lookups
+const loadReferences = async (rows) => {
+  const User = mongoose.model('User');
+  const Event = mongoose.model('Event');
+  const studentIds = [...new Set(rows.map((row) => String(row.studentId)))];
+  const eventIds = [...new Set(rows.map((row) => String(row.eventId)))];
+
+  const [students, events] = await Promise.all([
+    User.find({ _id: { $in: studentIds } }).select('userId name email studentId department').lean(),
+    Event.find({ _id: { $in: eventIds } }).select('eventId name').lean()
+  ]);
+
+  return {
+    students: new Map(students.map((student) => [String(student._id), student])),
+    events: new Map(events.map((event) => [String(event._id), event]))
+  };
+};
+
+const formatBatch = async (dataset, format, rows) => {
+  const { students, events } = await loadReferences(rows);
+  let chunk = '';
+
+  for (const row of rows) {
+    const student = row.isAnonymous ? null : students.get(String(row.studentId));
+    const event = events.get(String(row.eventId));
+    const values = dataset.columns.map(([, read]) => read(row, student, event));
+
+    if (format === 'csv') {
+      chunk += csvLine(values);
+    } else {
+      const record = {};
+      dataset.columns.forEach(([name], i) => {
+        if (values[i] !== undefined && values[i] !== null) record[name] = values[i];
+      });
+      chunk += JSON.stringify(record) + '\\n';
+    }
+  }
+
+  return chunk;
+};
+
+// Yield the export one batch at a time from a lean cursor. Used with
+// Readable.from + pipeline, the cursor only advances when the response has
+// drained, so memory stays at one batch regardless of the export size.
+async function* exportRows(datasetName, filter, format) {
+  const dataset = EXPORT_DATASETS[datasetName];
+  const cursor = mongoose.model(dataset.model)
+    .find(filter)
+    .select(dataset.select)
+    .lean()
+    .cursor({ batchSize: EXPORT_BATCH_SIZE });
+
+  if (format === 'csv') {
+    yield csvLine(dataset.columns.map(([name]) => name));
+  }
+
+  let rows = [];
+  try {
+    for await (const row of cursor) {
+      rows.push(row);
+      if (rows.length >= EXPORT_BATCH_SIZE) {
+        yield await formatBatch(dataset, format, rows);
+        rows = [];
+      }
+    }
+
+    if (rows.length > 0) {
+      yield await formatBatch(dataset, format, rows);
+    }
+  } finally {
+    await cursor.close();
+  }
+}
+
+module.exports = {
+  EXPORT_DATASETS,
+  EXPORT_FORMATS,
+  csvField,
+  exportRows
+};
+'''
+
+with open('utils/exportStream.js', 'w') as f:
+    f.write(export_stream_js)
+
+# Export controller
+export_controller_js = '''const mongoose = require('mongoose');
+const { Readable, pipeline } = require('stream');
+const { Event } = require('../models');
+const { AppError, asyncHandler } = require('../middleware/errorHandler');
+const { collegeScope } = require('./reportController');
+const { EXPORT_DATASETS, EXPORT_FORMATS, exportRows } = require('../utils/exportStream');
+const { logger } = require('../utils/logger');
+
+const parseDate = (value, name) => {
+  const date = new Date(value);
+  if (Number.isNaN(date.getTime())) {
+    throw new AppError(`Invalid ${name} date`, 400, 'INVALID_DATE');
+  }
+  return date;
+};
+
+// Build the cursor filter from ?eventId, the admin's college scope and ?from/?to
+const buildExportFilter = async (dataset, req) => {
+  const collegeId = collegeScope(req);
+  const { eventId, from, to } = req.query;
+  const filter = {};
+
+  if (eventId) {
+    if (!mongoose.isValidObjectId(eventId)) {
+      throw new AppError('Invalid event ID', 400, 'INVALID_ID');
+    }
+    if (collegeId && !(await Event.exists({ _id: eventId, collegeId }))) {
+      throw new AppError('Event not found', 404, 'NOT_FOUND');
+    }
+    filter.eventId = new mongoose.Types.ObjectId(eventId);
+  } else if (collegeId) {
+    // Attendance and feedback carry no collegeId; scope them through the college's events
+    if (dataset.collegeField) {
+      filter[dataset.collegeField] = collegeId;
+    } else {
+      filter.eventId = { $in: await Event.distinct('_id', { collegeId }) };
+    }
+  }
+
+  if (from || to) {
+    filter[dataset.dateField] = {};
+    if (from) filter[dataset.dateField].$gte = parseDate(from, 'from');
+    if (to) filter[dataset.dateField].$lte = parseDate(to, 'to');
+  }
+
+  return filter;
+};
+
+// GET /reports/exports/:dataset?format=csv|ndjson&eventId=&collegeId=&from=&to=
+const exportDataset = asyncHandler(async (req, res) => {
+  const datasetName = req.params.dataset;
+  const format = req.query.format || 'csv';
+
+  if (!EXPORT_DATASETS[datasetName]) {
+    throw new AppError('Unknown export dataset', 404, 'NOT_FOUND');
+  }
+
+  if (!EXPORT_FORMATS[format]) {
+    throw new AppError('Format must be csv or ndjson', 400, 'INVALID_FORMAT');
+  }
+
+  const filter = await buildExportFilter(EXPORT_DATASETS[datasetName], req);
+  const filename = `${datasetName}-${new Date().toISOString().slice(0, 10)}.${format}`;
+
+  res.status(200);
+  res.setHeader('Content-Type', EXPORT_FORMATS[format]);
+  res.setHeader('Content-Disposition', `attachment; filename="${filename}"`);
+  res.setHeader('Cache-Control', 'no-store');
+
+  pipeline(Readable.from(exportRows(datasetName, filter, format), { highWaterMark: 1 }), res, (error) => {
+    if (error && error.code !== 'ERR_STREAM_PREMATURE_CLOSE') {
+      logger.error('Error streaming export', { err: error });
+    }
+  });
+});
+
+module.exports = {
+  exportDataset
+};
+'''
+
+with open('controllers/exportController.js', 'w') as f:
+    f.write(export_controller_js)
+
+print("✅ Created utils/exportStream.js - Cursor-backed CSV/NDJSON export streams")
+print("✅ Created controllers/exportController.js - GET /reports/exports/:dataset")
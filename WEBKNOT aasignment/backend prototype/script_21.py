@@ -0,0 +1,287 @@
+# Create keyset (cursor) pagination, the event listing endpoint and its benchmark
+
+pagination_js = '''const mongoose = require('mongoose');
+const { AppError } = require('../middleware/errorHandler');
+const { leanProjection } = require('./leanViews');
+
+const DEFAULT_PAGE_SIZE = 10;
+const MAX_PAGE_SIZE = 100;
+
+const parsePageSize = (value) => Math.min(MAX_PAGE_SIZE, Math.max(1, parseInt(value) || DEFAULT_PAGE_SIZE));
+
+// Opaque cursor: base64url of [sort value as epoch ms, _id] of the last row returned
+const encodeCursor = (doc, sortField) =>
+  Buffer.from(JSON.stringify([new Date(doc[sortField]).getTime(), String(doc._id)])).toString('base64url');
+
+const decodeCursor = (token) => {
+  try {
+    const [time, id] = JSON.parse(Buffer.from(token, 'base64url').toString('utf8'));
+    if (Number.isFinite(time) && mongoose.isValidObjectId(id)) {
+      return { value: new Date(time), id: new mongoose.Types.ObjectId(id) };
+    }
+  } catch (error) {
+    // fall through to the error below
+  }
+  throw new AppError('Invalid pagination cursor', 400, 'INVALID_CURSOR');
+};
+
+// Fetch one page ordered by (sortField, _id). Instead of skipping rows, the
+// cursor becomes a range condition: the $gte/$lte bounds the index scan to
+// start at the previous page's last key and the $or only drops the ties
+// already returned. With an index on (filter fields..., sortField, _id) every
+// page costs the same however deep it is. Rows come back as plain objects
+// holding only the `select` fields plus any `derived` expressions.
+// The filter is passed to MongoDB as-is, so values must already be cast.
+const paginate = async (model, filter, options) => {
+  const { sortField, direction = 1, cursor, select, derived } = options;
+  const limit = parsePageSize(options.limit);
+  const query = { ...filter };
+
+  if (cursor) {
+    const { value, id } = decodeCursor(cursor);
+    const [bound, beyond] = direction === 1 ? ['$gte', '$gt'] : ['$lte', '$lt'];
+    query.$and = [
+      { [sortField]: { [bound]: value } },
+      { $or: [{ [sortField]: { [beyond]: value } }, { _id: { [beyond]: id } }] }
+    ];
+  }
+
+  const rows = await model.aggregate([
+    { $match: query },
+    { $sort: { [sortField]: direction, _id: direction } },
+    { $limit: limit + 1 },
+    { $project: leanProjection(select, derived) }
+  ]);
+
+  const hasMore = rows.length > limit;
+  const items = hasMore ? rows.slice(0, limit) : rows;
+
+  return {
+    items,
+    pagination: {
+      limit,
+      hasMore,
+      nextCursor: hasMore ? encodeCursor(items[items.length - 1], sortField) : null
+    }
+  };
+};
+
+module.exports = {
+  DEFAULT_PAGE_SIZE,
+  MAX_PAGE_SIZE,
+  parsePageSize,
+  encodeCursor,
+  decodeCursor,
+  paginate
+};
+'''
+
+with open('utils/pagination.js', 'w') as f:
+    f.write(pagination_js)
+
+# Event controller
+event_controller_js = '''const mongoose = require('mongoose');
+const { College, Event } = require('../models');
+const { AppError, asyncHandler } = require('../middleware/errorHandler');
+const { paginate } = require('../utils/pagination');
+const { EVENT_DERIVED, leanProjection } = require('../utils/leanViews');
+const { rememberEventCollege } = require('../utils/contentVersions');
+
+const EVENT_LIST_FIELDS = 'eventId name description eventType date startTime endTime venue capacity totalRegistrations status';
+const EVENT_DETAIL_FIELDS = `${EVENT_LIST_FIELDS} registrationDeadline registrationFee isVirtual virtualLink tags totalAttendance averageRating collegeId`;
+
+// GET /events?collegeId=&eventType=&status=&date=YYYY-MM-DD&limit=&cursor=
+// Ordered by (date, _id); served by the { collegeId, date, _id },
+// { status, date, _id } and { date, _id } indexes.
+const listEvents = asyncHandler(async (req, res) => {
+  const { collegeId, eventType, status, date, limit, cursor } = req.query;
+  const filter = {};
+
+  if (collegeId) {
+    if (!mongoose.isValidObjectId(collegeId)) {
+      throw new AppError('Invalid college ID', 400, 'INVALID_ID');
+    }
+    filter.collegeId = new mongoose.Types.ObjectId(collegeId);
+  }
+  if (eventType) filter.eventType = String(eventType);
+  if (status) filter.status = String(status);
+
+  if (date) {
+    const day = new Date(`${date}T00:00:00.000Z`);
+    if (Number.isNaN(day.getTime())) {
+      throw new AppError('Date must be YYYY-MM-DD', 400, 'INVALID_DATE');
+    }
+    filter.date = { $gte: day, $lt: new Date(day.getTime() + 24 * 60 * 60 * 1000) };
+  }
+
+  const { items, pagination } = await paginate(Event, filter, {
+    sortField: 'date',
+    direction: 1,
+    limit,
+    cursor,
+    select: EVENT_LIST_FIELDS,
+    derived: EVENT_DERIVED
+  });
+
+  res.status(200).json({
+    success: true,
+    data: {
+      events: items,
+      pagination
+    }
+  });
+});
+
+// GET /events/:id
+const getEvent = asyncHandler(async (req, res) => {
+  if (!mongoose.isValidObjectId(req.params.id)) {
+    throw new AppError('Invalid event ID', 400, 'INVALID_ID');
+  }
+
+  const [event] = await Event.aggregate([
+    { $match: { _id: new mongoose.Types.ObjectId(req.params.id) } },
+    { $project: leanProjection(EVENT_DETAIL_FIELDS, EVENT_DERIVED) }
+  ]);
+
+  if (!event) {
+    throw new AppError('Event not found', 404, 'NOT_FOUND');
+  }
+
+  rememberEventCollege(event._id, event.collegeId);
+  const { collegeId, ...details } = event;
+  const college = await College.findById(collegeId).select('name collegeId').lean();
+
+  res.status(200).json({
+    success: true,
+    data: {
+      ...details,
+      college
+    }
+  });
+});
+
+module.exports = {
+  listEvents,
+  getEvent
+};
+'''
+
+with open('controllers/eventController.js', 'w') as f:
+    f.write(event_controller_js)
+
+# Event routes
+event_routes_js = '''const express = require('express');
+const { listEvents, getEvent } = require('../controllers/eventController');
+const {
+  cacheByContentVersion,
+  collegeFromQuery,
+  collegeFromEventParam
+} = require('../middleware/responseCache');
+
+const router = express.Router();
+
+// Browse events (cursor paginated). Both reads are answered from the college
+// content version when possible: 304 on a matching ETag, else a cached body.
+router.get('/', cacheByContentVersion(collegeFromQuery), listEvents);
+
+// Event details
+router.get('/:id', cacheByContentVersion(collegeFromEventParam), getEvent);
+
+module.exports = router;
+'''
+
+with open('routes/events.js', 'w') as f:
+    f.write(event_routes_js)
+
+# Deep-page benchmark: skip/limit vs keyset cursor at page 1 and page 500
+pagination_bench_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const { Event } = require('../models');
+const { paginate } = require('../utils/pagination');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const COLLEGES = 50;
+const EVENTS_PER_COLLEGE = parseInt(process.env.BENCH_EVENTS_PER_COLLEGE) || 400;
+const PAGE_SIZE = 10;
+const DEEP_PAGE = 500;
+const RUNS = parseInt(process.env.BENCH_RUNS) || 50;
+
+const SELECT = 'eventId name eventType date venue capacity totalRegistrations status';
+
+const time = async (fn) => {
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < RUNS; i++) await fn();
+  return Number(process.hrtime.bigint() - start) / 1e6 / RUNS;
+};
+
+const skipPage = (page) => Event.find({})
+  .sort({ date: 1, _id: 1 })
+  .skip((page - 1) * PAGE_SIZE)
+  .limit(PAGE_SIZE)
+  .select(SELECT)
+  .lean();
+
+const cursorPage = (cursor) => paginate(Event, {}, { sortField: 'date', direction: 1, limit: PAGE_SIZE, cursor, select: SELECT });
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  await Event.syncIndexes();
+
+  const collegeIds = Array.from({ length: COLLEGES }, () => new mongoose.Types.ObjectId());
+  const start = Date.now();
+  const events = [];
+  collegeIds.forEach((collegeId, c) => {
+    for (let i = 0; i < EVENTS_PER_COLLEGE; i++) {
+      events.push({
+        eventId: `BENCHEVT${i}_CLG${c}`,
+        name: `Benchmark Event ${c}-${i}`,
+        eventType: 'seminar',
+        collegeId,
+        // Several events share each day so (date, _id) tie-breaking is exercised
+        date: new Date(start + Math.floor(i / 4) * 24 * 60 * 60 * 1000),
+        capacity: 100,
+        totalRegistrations: 0,
+        status: 'active'
+      });
+    }
+  });
+  await Event.collection.insertMany(events);
+
+  // Walk the cursor to the page before the deep page to obtain its token
+  let deepCursor = null;
+  for (let page = 1; page < DEEP_PAGE; page++) {
+    deepCursor = (await cursorPage(deepCursor)).pagination.nextCursor;
+  }
+
+  const [skipDeep, cursorDeep] = await Promise.all([skipPage(DEEP_PAGE), cursorPage(deepCursor)]);
+  const samePage = skipDeep.every((event, i) => String(event._id) === String(cursorDeep.items[i]._id));
+
+  console.table({
+    'skip/limit': {
+      page1Ms: (await time(() => skipPage(1))).toFixed(2),
+      [`page${DEEP_PAGE}Ms`]: (await time(() => skipPage(DEEP_PAGE))).toFixed(2)
+    },
+    keyset: {
+      page1Ms: (await time(() => cursorPage(null))).toFixed(2),
+      [`page${DEEP_PAGE}Ms`]: (await time(() => cursorPage(deepCursor))).toFixed(2)
+    }
+  });
+  console.log(`${events.length} events; page ${DEEP_PAGE} identical in both modes: ${samePage}`);
+
+  await Event.collection.deleteMany({ collegeId: { $in: collegeIds } });
+  await mongoose.connection.close();
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/pagination.bench.js', 'w') as f:
+    f.write(pagination_bench_js)
+
+print("✅ Created utils/pagination.js - Opaque keyset cursors over (sortField, _id)")
+print("✅ Created controllers/eventController.js & routes/events.js - Cursor-paginated event listing")
+print("✅ Created benchmarks/pagination.bench.js - Page 1 vs page 500 latency, skip vs keyset")
@@ -0,0 +1,185 @@
+# Create lean read views: projections that compute the schema virtuals inside the query
+
+lean_views_js = '''// Aggregation expressions mirroring the schema virtuals, so list endpoints can
+// return plain projected objects straight from MongoDB instead of hydrating
+// documents and running the virtual getters row by row. $$NOW is evaluated
+// once per query, so time-based values are consistent across a page.
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// "HH:MM" -> minutes since midnight
+const minutesOf = (path) => ({
+  $let: {
+    vars: { parts: { $split: [path, ':'] } },
+    in: {
+      $add: [
+        { $multiply: [{ $toInt: { $arrayElemAt: ['$$parts', 0] } }, 60] },
+        { $toInt: { $arrayElemAt: ['$$parts', 1] } }
+      ]
+    }
+  }
+});
+
+// Event virtuals: availableSpots, registrationStatus, eventDuration
+const EVENT_DERIVED = {
+  availableSpots: { $max: [0, { $subtract: ['$capacity', '$totalRegistrations'] }] },
+  registrationStatus: {
+    $switch: {
+      branches: [
+        { case: { $lt: ['$registrationDeadline', '$$NOW'] }, then: 'closed' },
+        { case: { $gte: ['$totalRegistrations', '$capacity'] }, then: 'full' },
+        { case: { $not: ['$isRegistrationOpen'] }, then: 'closed' }
+      ],
+      default: 'open'
+    }
+  },
+  // duration is stored on save; like the virtual, a missing or zero duration
+  // falls back to startTime/endTime ($cond treats null, missing and 0 as false)
+  eventDuration: { $cond: ['$duration', '$duration', { $subtract: [minutesOf('$endTime'), minutesOf('$startTime')] }] }
+};
+
+// Registration virtual: daysSinceRegistration
+const REGISTRATION_DERIVED = {
+  daysSinceRegistration: { $floor: { $divide: [{ $subtract: ['$$NOW', '$registrationDate'] }, DAY_MS] } }
+};
+
+// User virtual: displayName
+const USER_DERIVED = {
+  displayName: {
+    $cond: [
+      { $eq: ['$role', 'student'] },
+      { $concat: ['$name', ' (', { $ifNull: ['$studentId', ''] }, ')'] },
+      { $concat: ['$name', ' (Admin)'] }
+    ]
+  }
+};
+
+// Build a $project stage from a space separated field list plus derived
+// expressions. `id` mirrors the id virtual that toJSON adds to every document.
+const leanProjection = (fields, derived = {}) => {
+  const projection = { id: '$_id' };
+  for (const field of fields.split(' ').filter(Boolean)) {
+    projection[field] = 1;
+  }
+  return { ...projection, ...derived };
+};
+
+module.exports = {
+  EVENT_DERIVED,
+  REGISTRATION_DERIVED,
+  USER_DERIVED,
+  leanProjection
+};
+'''
+
+with open('utils/leanViews.js', 'w') as f:
+    f.write(lean_views_js)
+
+# Lean vs hydrated listing benchmark (1,000 events)
+lean_reads_bench_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const { Event } = require('../models');
+const { EVENT_DERIVED, leanProjection } = require('../utils/leanViews');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const EVENTS = 1000;
+const RUNS = parseInt(process.env.BENCH_RUNS) || 50;
+
+const FIELDS = 'eventId name description eventType date startTime endTime venue capacity totalRegistrations status';
+
+if (typeof global.gc !== 'function') {
+  console.error('Run with node --expose-gc (npm run bench:lean)');
+  process.exit(1);
+}
+
+// Previous read path: full documents, virtuals applied when serialised
+const hydrated = async (collegeId) => {
+  const events = await Event.find({ collegeId }).sort({ date: 1, _id: 1 }).limit(EVENTS);
+  return JSON.stringify(events);
+};
+
+// Lean read path: projected plain objects with the virtuals computed by MongoDB
+const lean = async (collegeId) => {
+  const events = await Event.aggregate([
+    { $match: { collegeId } },
+    { $sort: { date: 1, _id: 1 } },
+    { $limit: EVENTS },
+    { $project: leanProjection(FIELDS, EVENT_DERIVED) }
+  ]);
+  return JSON.stringify(events);
+};
+
+const measure = async (read, collegeId) => {
+  await read(collegeId); // warm up
+
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < RUNS; i++) await read(collegeId);
+  const latencyMs = Number(process.hrtime.bigint() - start) / 1e6 / RUNS;
+
+  // Heap allocated by one listing: no GC can run between the two samples
+  // because the young generation is sized well above a single listing
+  global.gc();
+  const before = process.memoryUsage().heapUsed;
+  const body = await read(collegeId);
+  const allocatedKB = (process.memoryUsage().heapUsed - before) / 1024;
+
+  return { latencyMs: latencyMs.toFixed(2), allocatedKB: Math.round(allocatedKB), body };
+};
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  await Event.syncIndexes();
+
+  const collegeId = new mongoose.Types.ObjectId();
+  const now = Date.now();
+  await Event.collection.insertMany(Array.from({ length: EVENTS }, (_, i) => ({
+    eventId: `LEANEVT${i}_CLG996`,
+    name: `Lean Benchmark Event ${i}`,
+    description: 'An event used to compare hydrated and lean list reads',
+    eventType: 'seminar',
+    date: new Date(now + (i + 2) * 60 * 60 * 1000),
+    startTime: '10:00',
+    endTime: '12:30',
+    duration: i % 2 === 0 ? 150 : undefined,
+    venue: 'Main Hall',
+    capacity: 100,
+    registrationDeadline: new Date(now + (i % 3 === 0 ? -1 : 1) * 60 * 60 * 1000),
+    collegeId,
+    createdBy: new mongoose.Types.ObjectId(),
+    status: 'active',
+    isRegistrationOpen: true,
+    totalRegistrations: i % 120
+  })));
+
+  const full = await measure(hydrated, collegeId);
+  const projected = await measure(lean, collegeId);
+
+  // The lean rows must carry the same derived values the virtuals produced
+  const expected = JSON.parse(full.body);
+  const actual = JSON.parse(projected.body);
+  const mismatches = expected.filter((event, i) =>
+    ['availableSpots', 'registrationStatus', 'eventDuration'].some((key) => event[key] !== actual[i][key])
+  ).length;
+
+  console.table({
+    hydrated: { latencyMs: full.latencyMs, allocatedKB: full.allocatedKB, responseKB: Math.round(full.body.length / 1024) },
+    lean: { latencyMs: projected.latencyMs, allocatedKB: projected.allocatedKB, responseKB: Math.round(projected.body.length / 1024) }
+  });
+  console.log(`${EVENTS} events; rows whose derived values differ: ${mismatches}`);
+
+  await Event.collection.deleteMany({ collegeId });
+  await mongoose.connection.close();
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/leanReads.bench.js', 'w') as f:
+    f.write(lean_reads_bench_js)
+
+print("✅ Created utils/leanViews.js - Query-side equivalents of the schema virtuals")
+print("✅ Created benchmarks/leanReads.bench.js - Hydrated vs lean 1,000-event listing")
@@ -0,0 +1,263 @@
+# Create per-college content versions, conditional GET (ETag/304) and the response cache
+
+content_versions_js = '''const mongoose = require('mongoose');
+const LRUCache = require('./lruCache');
+const { logger } = require('./logger');
+
+// How stale another instance's writes can look here: 1s by default and never
+// more than MAX_REFRESH_MS, whatever the environment says
+const MAX_REFRESH_MS = 10 * 1000;
+const REFRESH_MS = Math.min(parseInt(process.env.CONTENT_VERSION_REFRESH_MS) || 1000, MAX_REFRESH_MS);
+const BUMP_DELAY_MS = parseInt(process.env.CONTENT_VERSION_BUMP_DELAY_MS) || 5;
+const KEY_PREFIX = 'content:';
+const ALL = 'all';
+
+// collegeId -> latest content version seen by this process. Versions live in
+// the counters collection ({ _id: 'content:<collegeId>', seq }) so every
+// process agrees on them; bumps made here apply as soon as they are written,
+// bumps made by other processes are picked up by the periodic refresh.
+// 'content:all' is bumped by writes that may touch every college and is
+// added to each college's version.
+const versions = new Map();
+let allVersion = 0;
+let totalVersion = 0;
+
+let dirty = new Set();
+let pendingBump = null;
+
+// Events never move between colleges, so eventId -> collegeId can be cached for good
+const eventColleges = new LRUCache({ max: parseInt(process.env.EVENT_COLLEGE_CACHE_MAX) || 100000 });
+
+let refreshTimer = null;
+let firstRefresh = null;
+
+// Versions only move forward; the total is the version of "all colleges"
+const setVersion = (collegeId, version) => {
+  const key = String(collegeId);
+  const current = key === ALL ? allVersion : versions.get(key) || 0;
+  if (version > current) {
+    if (key === ALL) allVersion = version;
+    else versions.set(key, version);
+    totalVersion += version - current;
+  }
+};
+
+const getCollegeVersion = (collegeId) => (versions.get(String(collegeId)) || 0) + allVersion;
+
+const getTotalVersion = () => totalVersion;
+
+const writeBumps = (keys) => {
+  const Counter = mongoose.model('Counter');
+  return Promise.all(Array.from(keys, async (key) => {
+    const counter = await Counter.findOneAndUpdate(
+      { _id: `${KEY_PREFIX}${key}` },
+      { $inc: { seq: 1 } },
+      { upsert: true, new: true }
+    ).lean();
+    setVersion(key, counter.seq);
+  }));
+};
+
+// Bumps requested within BUMP_DELAY_MS of each other share one $inc per
+// college, so a registration rush writes the college's content doc once per
+// window instead of once per counter change. Callers wait for the write, so
+// a process always sees its own changes before it answers.
+const scheduleBump = (key) => {
+  dirty.add(key);
+  if (!pendingBump) {
+    pendingBump = new Promise((resolve) => setTimeout(resolve, BUMP_DELAY_MS)).then(() => {
+      const keys = dirty;
+      dirty = new Set();
+      pendingBump = null;
+      return writeBumps(keys);
+    });
+  }
+  return pendingBump;
+};
+
+const bumpCollegeVersion = async (collegeId) => {
+  if (!collegeId) return;
+  await scheduleBump(String(collegeId));
+};
+
+const rememberEventCollege = (eventId, collegeId) => {
+  eventColleges.set(String(eventId), String(collegeId));
+};
+
+const collegeOfEvent = async (eventId) => {
+  const key = String(eventId);
+  const cached = eventColleges.get(key);
+  if (cached) return cached;
+
+  const event = await mongoose.model('Event').findById(key).select('collegeId').lean();
+  if (!event) return null;
+  rememberEventCollege(key, event.collegeId);
+  return String(event.collegeId);
+};
+
+// For writes whose college is unknown (multi-event updates, maintenance jobs):
+// one shared version that every college's version includes
+const bumpAllVersions = async () => {
+  await scheduleBump(ALL);
+};
+
+// An event that can no longer be found (already deleted) bumps every college
+const bumpEventVersion = async (eventId) => {
+  const collegeId = await collegeOfEvent(eventId);
+  await (collegeId ? bumpCollegeVersion(collegeId) : bumpAllVersions());
+};
+
+const refreshVersions = async () => {
+  const Counter = mongoose.model('Counter');
+  const counters = await Counter.find({ _id: { $regex: `^${KEY_PREFIX}` } }).lean();
+  for (const counter of counters) {
+    setVersion(counter._id.slice(KEY_PREFIX.length), counter.seq);
+  }
+};
+
+// Start polling on first use; resolves once the initial versions are loaded
+const ensureVersionRefresh = () => {
+  if (!firstRefresh) {
+    // A failed first load is retried by the next caller instead of being
+    // cached as a permanent rejection
+    firstRefresh = refreshVersions().catch((error) => {
+      firstRefresh = null;
+      throw error;
+    });
+  }
+  if (!refreshTimer) {
+    refreshTimer = setInterval(() => {
+      refreshVersions().catch((error) => logger.error('Error refreshing content versions', { err: error }));
+    }, REFRESH_MS);
+    refreshTimer.unref();
+  }
+  return firstRefresh;
+};
+
+const stopVersionRefresh = () => {
+  if (refreshTimer) clearInterval(refreshTimer);
+  refreshTimer = null;
+  firstRefresh = null;
+};
+
+module.exports = {
+  getCollegeVersion,
+  getTotalVersion,
+  bumpCollegeVersion,
+  bumpEventVersion,
+  bumpAllVersions,
+  rememberEventCollege,
+  collegeOfEvent,
+  refreshVersions,
+  ensureVersionRefresh,
+  stopVersionRefresh
+};
+'''
+
+with open('utils/contentVersions.js', 'w') as f:
+    f.write(content_versions_js)
+
+# Conditional GET + response cache middleware
+response_cache_js = '''const crypto = require('crypto');
+const mongoose = require('mongoose');
+const LRUCache = require('../utils/lruCache');
+const {
+  getCollegeVersion,
+  getTotalVersion,
+  collegeOfEvent,
+  ensureVersionRefresh
+} = require('../utils/contentVersions');
+const { logger } = require('../utils/logger');
+
+// Time-derived fields (e.g. registrationStatus after a deadline) change without
+// a write, so cached bodies and ETags also roll over every RESPONSE_CACHE_TTL_MS
+const CACHE_TTL_MS = parseInt(process.env.RESPONSE_CACHE_TTL_MS) || 30000;
+
+const responseCache = new LRUCache({
+  max: process.env.RESPONSE_CACHE_MAX === undefined ? 5000 : parseInt(process.env.RESPONSE_CACHE_MAX),
+  ttl: CACHE_TTL_MS
+});
+
+const digest = (value) => crypto.createHash('sha1').update(value).digest('base64url').slice(0, 16);
+
+const matchesETag = (header, etag) =>
+  Boolean(header) && header.split(',').some((tag) => tag.trim() === etag || tag.trim() === '*');
+
+// Scope resolvers: which college's version covers the response.
+// null means every college; undefined means "do not cache this request".
+const collegeFromQuery = (req) => {
+  const { collegeId } = req.query;
+  if (!collegeId) return null;
+  return mongoose.isValidObjectId(collegeId) ? String(collegeId) : undefined;
+};
+
+const collegeFromEventParam = async (req) => {
+  if (!mongoose.isValidObjectId(req.params.id)) return undefined;
+  return (await collegeOfEvent(req.params.id)) || undefined;
+};
+
+// Serve GETs from the college content version: a strong ETag derived from the
+// version answers If-None-Match with 304, and bodies are cached per
+// (college, URL) until the version moves. Neither path touches MongoDB.
+const cacheByContentVersion = (resolveCollege) => async (req, res, next) => {
+  let collegeId;
+  try {
+    await ensureVersionRefresh();
+    collegeId = await resolveCollege(req);
+  } catch (error) {
+    // Without versions (e.g. MongoDB briefly unavailable) the request is
+    // served uncached rather than failed
+    logger.warn('Content versions unavailable, response cache bypassed', { err: error });
+    return next();
+  }
+  if (collegeId === undefined) return next();
+
+  try {
+    const version = collegeId ? getCollegeVersion(collegeId) : getTotalVersion();
+    const epoch = Math.floor(Date.now() / CACHE_TTL_MS);
+    const key = `${collegeId || '*'}:${req.originalUrl}`;
+    const etag = `"${version}.${epoch}-${digest(key)}"`;
+
+    res.setHeader('ETag', etag);
+    res.setHeader('Cache-Control', 'no-cache');
+
+    if (matchesETag(req.headers['if-none-match'], etag)) {
+      return res.status(304).end();
+    }
+
+    const cached = responseCache.get(key);
+    if (cached && cached.etag === etag) {
+      return res.status(200).type('application/json').send(cached.body);
+    }
+
+    // The version was read before the handler queries MongoDB, so a write that
+    // lands mid-request bumps past it and the entry is never served as current
+    res.json = (body) => {
+      const payload = JSON.stringify(body);
+      if (res.statusCode === 200) {
+        responseCache.set(key, { etag, body: payload });
+      }
+      return res.type('application/json').send(payload);
+    };
+
+    next();
+  } catch (error) {
+    next(error);
+  }
+};
+
+const getResponseCacheStats = () => responseCache.getStats();
+
+module.exports = {
+  cacheByContentVersion,
+  collegeFromQuery,
+  collegeFromEventParam,
+  getResponseCacheStats
+};
+'''
+
+with open('middleware/responseCache.js', 'w') as f:
+    f.write(response_cache_js)
+
+print("✅ Created utils/contentVersions.js - Per-college content versions shared through the counters collection")
+print("✅ Created middleware/responseCache.js - Strong ETags, 304s and a version-keyed response cache")
@@ -0,0 +1,388 @@
+# Compile fast request validators from the Joi schemas, and test them against Joi
+#
+# middleware/compiledValidators.js walks each schema's describe() output at
+# startup and builds a plain JavaScript function for it, so the fast path is
+# always derived from the Joi schemas in middleware/validation.js (script_10.py)
+# rather than from a copy of them. Schemas that use anything the compiler does
+# not understand are simply left to Joi.
+
+compiled_validators_js = '''// Builds plain JavaScript validators from Joi schema descriptions. A compiled
+// validator checks keys in Joi's order (declared keys first, then unknown keys)
+// and returns null when the payload is valid, Joi's first error message, or
+// FALLBACK when Joi's type conversion would be involved (e.g. "4" for a number,
+// a JSON string for an object, an unsafe number) so the caller defers to Joi.
+
+const FALLBACK = Symbol('fallback');
+
+const isPlainObject = (value) => value !== null && typeof value === 'object' && !Array.isArray(value);
+
+const isSafeNumber = (value) => value <= Number.MAX_SAFE_INTEGER && value >= Number.MIN_SAFE_INTEGER;
+
+// Thrown while walking a description that uses a feature the compiler does not
+// reproduce exactly; the schema is then validated by Joi alone
+class UnsupportedSchema extends Error {}
+
+const literal = (value) => JSON.stringify(value);
+const message = (label, text) => literal(`"${label}" ${text}`);
+
+// Only these parts of a description are understood, per type
+const KNOWN_PARTS = {
+  string: { parts: ['type', 'flags', 'allow', 'rules'], flags: ['presence', 'default', 'only'], rules: ['max'] },
+  number: { parts: ['type', 'flags', 'rules'], flags: ['presence', 'default'], rules: ['min', 'max'] },
+  boolean: { parts: ['type', 'flags'], flags: ['presence', 'default'], rules: [] },
+  object: { parts: ['type', 'flags', 'keys'], flags: ['presence', 'default'], rules: [] }
+};
+
+const assertSupported = (description) => {
+  const known = KNOWN_PARTS[description.type];
+  if (!known) throw new UnsupportedSchema(`type ${description.type}`);
+
+  for (const part of Object.keys(description)) {
+    if (!known.parts.includes(part)) throw new UnsupportedSchema(`${description.type} ${part}`);
+  }
+  for (const [flag, value] of Object.entries(description.flags || {})) {
+    if (!known.flags.includes(flag)) throw new UnsupportedSchema(`flag ${flag}`);
+    if (flag === 'presence' && value !== 'required' && value !== 'optional') throw new UnsupportedSchema(`presence ${value}`);
+  }
+  for (const rule of description.rules || []) {
+    if (!known.rules.includes(rule.name) || typeof (rule.args && rule.args.limit) !== 'number') {
+      throw new UnsupportedSchema(`rule ${rule.name}`);
+    }
+  }
+  if ((description.allow || []).some((value) => typeof value !== 'string')) {
+    throw new UnsupportedSchema('non-string allow');
+  }
+};
+
+class ValidatorWriter {
+  constructor() {
+    this.lines = [];
+    this.keySets = [];
+  }
+
+  emit(depth, line) {
+    this.lines.push('  '.repeat(depth) + line);
+  }
+
+  variable() {
+    return `v${this.lines.length}`;
+  }
+
+  field(description, expr, label, depth) {
+    if (description.flags && description.flags.presence === 'required') {
+      this.emit(depth, `if (${expr} === undefined) return ${message(label, 'is required')};`);
+      this.check(description, expr, label, depth);
+    } else {
+      this.emit(depth, `if (${expr} !== undefined) {`);
+      this.check(description, expr, label, depth + 1);
+      this.emit(depth, '}');
+    }
+  }
+
+  check(description, expr, label, depth) {
+    assertSupported(description);
+    this[description.type](description, expr, label, depth);
+  }
+
+  string(description, expr, label, depth) {
+    const allow = description.allow || [];
+    const rules = description.rules || [];
+
+    if (description.flags && description.flags.only) {
+      if (rules.length > 0) throw new UnsupportedSchema('string valid() with rules');
+      const condition = allow.map((value) => `${expr} !== ${literal(value)}`).join(' && ') || 'true';
+      this.emit(depth, `if (${condition}) return ${message(label, `must be one of [${allow.join(', ')}]`)};`);
+      return;
+    }
+
+    if (allow.length > 0) {
+      this.emit(depth, `if (${allow.map((value) => `${expr} !== ${literal(value)}`).join(' && ')}) {`);
+      depth++;
+    }
+
+    this.emit(depth, `if (typeof ${expr} !== 'string') return ${message(label, 'must be a string')};`);
+    if (!allow.includes('')) {
+      this.emit(depth, `if (${expr} === '') return ${message(label, 'is not allowed to be empty')};`);
+    }
+    for (const { args } of rules) {
+      const text = message(label, `length must be less than or equal to ${args.limit} characters long`);
+      this.emit(depth, `if (${expr}.length > ${args.limit}) return ${text};`);
+    }
+
+    if (allow.length > 0) this.emit(depth - 1, '}');
+  }
+
+  number(description, expr, label, depth) {
+    this.emit(depth, `if (typeof ${expr} !== 'number') return typeof ${expr} === 'string' ? FALLBACK : ${message(label, 'must be a number')};`);
+    this.emit(depth, `if (!isSafeNumber(${expr})) return FALLBACK;`);
+    for (const { name, args } of description.rules || []) {
+      const [operator, text] = name === 'min'
+        ? ['<', `must be greater than or equal to ${args.limit}`]
+        : ['>', `must be less than or equal to ${args.limit}`];
+      this.emit(depth, `if (${expr} ${operator} ${args.limit}) return ${message(label, text)};`);
+    }
+  }
+
+  boolean(description, expr, label, depth) {
+    this.emit(depth, `if (typeof ${expr} !== 'boolean') return typeof ${expr} === 'string' ? FALLBACK : ${message(label, 'must be a boolean')};`);
+  }
+
+  object(description, expr, label, depth) {
+    if (!description.keys) throw new UnsupportedSchema('object without keys');
+    this.emit(depth, `if (!isPlainObject(${expr})) return typeof ${expr} === 'string' ? FALLBACK : ${message(label, 'must be of type object')};`);
+
+    const keys = Object.keys(description.keys);
+    for (const key of keys) {
+      const variable = this.variable();
+      this.emit(depth, `const ${variable} = ${expr}[${literal(key)}];`);
+      this.field(description.keys[key], variable, label === 'value' ? key : `${label}.${key}`, depth);
+    }
+
+    const keySet = `KEYS_${this.keySets.push(keys)}`;
+    const prefix = label === 'value' ? '' : `${label}.`;
+    this.emit(depth, `for (const key of Object.keys(${expr})) {`);
+    this.emit(depth + 1, `if (!${keySet}.has(key)) return ${literal(`"${prefix}`)} + key + '" is not allowed';`);
+    this.emit(depth, '}');
+  }
+}
+
+// Source of the validator for a Joi object schema; throws UnsupportedSchema
+const compileSource = (schema) => {
+  const writer = new ValidatorWriter();
+  writer.check(schema.describe(), 'value', 'value', 1);
+
+  return [
+    ...writer.keySets.map((keys, i) => `const KEYS_${i + 1} = new Set(${literal(keys)});`),
+    'return (value) => {',
+    ...writer.lines,
+    '  return null;',
+    '};'
+  ].join('\\n');
+};
+
+// Compiled validator for `schema`, or null when it must be left to Joi
+const compileSchema = (schema) => {
+  let source;
+  try {
+    source = compileSource(schema);
+  } catch (error) {
+    if (error instanceof UnsupportedSchema) return null;
+    throw error;
+  }
+  return new Function('FALLBACK', 'isPlainObject', 'isSafeNumber', source)(FALLBACK, isPlainObject, isSafeNumber);
+};
+
+module.exports = {
+  FALLBACK,
+  compileSchema,
+  compileSource
+};
+'''
+
+with open('middleware/compiledValidators.js', 'w') as f:
+    f.write(compiled_validators_js)
+
+# Differential test (jest): compiled validators vs Joi on generated and mutated payloads
+os.makedirs('tests', exist_ok=True)
+compiled_validators_test_js = '''const Joi = require('joi');
+const validation = require('../middleware/validation');
+const { FALLBACK, compileSchema } = require('../middleware/compiledValidators');
+
+const RANDOM_CASES = parseInt(process.env.CHECK_RANDOM_CASES) || 5000;
+
+// The endpoints the compiled validators exist for; they must never silently
+// drop back to Joi because of a schema change
+const HOT_SCHEMAS = [
+  'registrationSchemas.create',
+  'registrationSchemas.cancel',
+  'attendanceSchemas.checkIn',
+  'feedbackSchemas.create'
+];
+
+// Small deterministic PRNG so failures are reproducible
+let seed = parseInt(process.env.CHECK_SEED) || 42;
+const random = () => {
+  seed = (seed * 1103515245 + 12345) % 2147483648;
+  return seed / 2147483648;
+};
+const pick = (values) => values[Math.floor(random() * values.length)];
+
+// Bodies are plain JSON, so a JSON round trip is a deep copy (and works on
+// every Node version in package.json engines)
+const clone = (value) => JSON.parse(JSON.stringify(value));
+
+const SAMPLE_VALUES = [
+  undefined, null, '', ' ', 'x', 'qr_code', 'manual', 'mobile_app', 'QR_CODE', '66f5e8d2a1b2c3d4e5f67892',
+  'a'.repeat(500), 'a'.repeat(501), 'a'.repeat(1000), 'a'.repeat(1001),
+  0, 1, 3, 4.5, 5, 5.0001, 6, -1, 0.5, Number.MAX_SAFE_INTEGER + 2,
+  '1', '4', ' 4 ', '4.0', '1e0', '6', 'abc', 'true', 'false', 'TRUE', 'yes',
+  true, false, [], ['x'], {}, { rating: 4 }, { rating: 9 }, { comment: '' }, { other: 1 },
+  { rating: '4', comment: 'ok' }, { content: { rating: 5 } }, { content: 'x' }, '{"rating":4}'
+];
+
+// Every key path of a schema description
+const keyPaths = (description, prefix = []) => {
+  const paths = [];
+  for (const [key, child] of Object.entries(description.keys || {})) {
+    paths.push([...prefix, key]);
+    if (child.type === 'object') paths.push(...keyPaths(child, [...prefix, key]));
+  }
+  return paths;
+};
+
+// A payload with every key set to a valid value, built from the description
+const validBody = (description) => {
+  const limit = (name) => (description.rules || []).find((rule) => rule.name === name)?.args.limit;
+  switch (description.type) {
+    case 'object':
+      return Object.fromEntries(Object.entries(description.keys).map(([key, child]) => [key, validBody(child)]));
+    case 'string':
+      return description.flags?.only ? description.allow[0] : '66f5e8d2a1b2c3d4e5f67892'.slice(0, limit('max'));
+    case 'number':
+      return limit('min') ?? limit('max') ?? 1;
+    default:
+      return true;
+  }
+};
+
+const setPath = (target, path, value) => {
+  let node = target;
+  for (const key of path.slice(0, -1)) {
+    if (node[key] === null || typeof node[key] !== 'object' || Array.isArray(node[key])) node[key] = {};
+    node = node[key];
+  }
+  if (value === undefined) {
+    delete node[path[path.length - 1]];
+  } else {
+    node[path[path.length - 1]] = value;
+  }
+};
+
+const joiMessage = (schema, body) => {
+  const { error } = schema.validate(body);
+  return error ? error.details[0].message : null;
+};
+
+const SCHEMA_GROUPS = ['userSchemas', 'eventSchemas', 'registrationSchemas', 'attendanceSchemas', 'feedbackSchemas', 'collegeSchemas'];
+const compiled = SCHEMA_GROUPS.flatMap((group) => Object.entries(validation[group]).map(([key, schema]) => ({
+  name: `${group}.${key}`,
+  schema,
+  validator: compileSchema(schema)
+}))).filter(({ validator }) => validator);
+
+describe('compiled validators', () => {
+  test('compile every hot schema', () => {
+    expect(compiled.map(({ name }) => name)).toEqual(expect.arrayContaining(HOT_SCHEMAS));
+  });
+
+  test('leave schemas with unsupported features to Joi', () => {
+    expect(compileSchema(Joi.object({ email: Joi.string().email() }))).toBeNull();
+    expect(compileSchema(Joi.object({ ids: Joi.array().items(Joi.string()) }))).toBeNull();
+    expect(compileSchema(Joi.object({ count: Joi.number().integer() }))).toBeNull();
+    expect(compileSchema(Joi.object({ name: Joi.string().label('Name') }))).toBeNull();
+  });
+
+  describe.each(compiled)('$name', ({ schema, validator }) => {
+    const description = schema.describe();
+    const valid = validBody(description);
+    const paths = keyPaths(description);
+
+    // Payloads the validator defers on are checked by Joi itself, so only the
+    // ones it decides must agree with Joi
+    const expectAgreement = (body) => {
+      const result = validator(body);
+      if (result === FALLBACK) return;
+      expect({ body, message: result }).toEqual({ body, message: joiMessage(schema, body) });
+    };
+
+    test('accepts a fully populated valid payload', () => {
+      expect(joiMessage(schema, valid)).toBeNull();
+      expect(validator(valid)).toBeNull();
+    });
+
+    test('matches Joi on empty, array and unknown-key payloads', () => {
+      [{}, [], { ...valid, unexpected: true }].forEach(expectAgreement);
+    });
+
+    test('matches Joi for every sample value at every key path', () => {
+      for (const path of paths) {
+        for (const sample of SAMPLE_VALUES) {
+          const body = clone(valid);
+          setPath(body, path, sample);
+          expectAgreement(body);
+        }
+      }
+    });
+
+    test('matches Joi on random multi-field mutations', () => {
+      for (let i = 0; i < RANDOM_CASES; i++) {
+        const body = clone(valid);
+        const edits = 1 + Math.floor(random() * 3);
+        for (let e = 0; e < edits; e++) {
+          const path = random() < 0.1 ? [...pick(paths).slice(0, -1), 'extra'] : pick(paths);
+          setPath(body, path, pick(SAMPLE_VALUES));
+        }
+        expectAgreement(body);
+      }
+    });
+  });
+});
+'''
+
+with open('tests/compiledValidators.test.js', 'w') as f:
+    f.write(compiled_validators_test_js)
+
+# Throughput benchmark: Joi vs compiled validators
+compiled_validators_bench_js = '''const validation = require('../middleware/validation');
+const { compileSchema } = require('../middleware/compiledValidators');
+
+const ITERATIONS = parseInt(process.env.BENCH_ITERATIONS) || 200000;
+
+const CASES = {
+  'feedbackSchemas.create (valid)': {
+    eventId: '66f5e8d2a1b2c3d4e5f67892',
+    overallRating: 5,
+    contentRating: 4,
+    organizationRating: 4,
+    venueRating: 3,
+    comments: 'Great event',
+    wouldRecommend: true,
+    categories: {
+      content: { rating: 5, comment: 'Clear' },
+      speaker: { rating: 4, comment: 'Engaging' },
+      organization: { rating: 4 },
+      venue: { rating: 3, comment: '' }
+    }
+  },
+  'feedbackSchemas.create (invalid)': { eventId: '66f5e8d2a1b2c3d4e5f67892', overallRating: 7 },
+  'attendanceSchemas.checkIn (valid)': { eventId: '66f5e8d2a1b2c3d4e5f67892', checkInMethod: 'qr_code' },
+  'registrationSchemas.create (valid)': { eventId: '66f5e8d2a1b2c3d4e5f67892' }
+};
+
+const run = (check, body) => {
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < ITERATIONS; i++) check(body);
+  return Math.round(ITERATIONS / (Number(process.hrtime.bigint() - start) / 1e9));
+};
+
+const results = {};
+for (const [label, body] of Object.entries(CASES)) {
+  const name = label.split(' ')[0];
+  const [group, key] = name.split('.');
+  const schema = validation[group][key];
+
+  const joi = run((payload) => schema.validate(payload), body);
+  const compiled = run(compileSchema(schema), body);
+
+  results[label] = { joiPerSec: joi, compiledPerSec: compiled, speedup: `${(compiled / joi).toFixed(1)}x` };
+}
+
+console.table(results);
+'''
+
+with open('benchmarks/compiledValidators.bench.js', 'w') as f:
+    f.write(compiled_validators_bench_js)
+
+print("✅ Created middleware/compiledValidators.js - Validators compiled from Joi schema descriptions")
+print("✅ Created tests/compiledValidators.test.js - Differential jest test against Joi")
+print("✅ Created benchmarks/compiledValidators.bench.js - Joi vs compiled validator throughput")
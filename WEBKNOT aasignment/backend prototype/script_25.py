@@ -0,0 +1,371 @@
+# Create the worker-thread password pool, the login endpoint and the login-storm benchmark
+
+password_worker_js = '''const { parentPort } = require('worker_threads');
+const bcrypt = require('bcryptjs');
+
+// Runs inside a pool worker: the sync variants are fastest here because
+// nothing else shares this thread.
+parentPort.on('message', ({ id, op, password, hash, rounds }) => {
+  try {
+    const result = op === 'hash'
+      ? bcrypt.hashSync(password, rounds)
+      : bcrypt.compareSync(password, hash);
+    parentPort.postMessage({ id, result });
+  } catch (error) {
+    parentPort.postMessage({ id, error: error.message });
+  }
+});
+'''
+
+with open('utils/passwordWorker.js', 'w') as f:
+    f.write(password_worker_js)
+
+password_pool_js = '''const os = require('os');
+const path = require('path');
+const { Worker } = require('worker_threads');
+const bcrypt = require('bcryptjs');
+const { AppError } = require('../middleware/errorHandler');
+
+const BCRYPT_SALT_ROUNDS = parseInt(process.env.BCRYPT_SALT_ROUNDS) || 12;
+const DEFAULT_POOL_SIZE = parseInt(process.env.PASSWORD_POOL_SIZE) || Math.max(1, Math.min(4, os.cpus().length - 1));
+const DEFAULT_MAX_QUEUE = parseInt(process.env.PASSWORD_POOL_MAX_QUEUE) || 1000;
+const DEFAULT_JOB_TIMEOUT_MS = parseInt(process.env.PASSWORD_JOB_TIMEOUT_MS) || 10000;
+
+const WORKER_FILE = path.join(__dirname, 'passwordWorker.js');
+
+// Runs bcrypt hash/compare on a fixed set of worker threads so a burst of
+// logins costs queueing time for logins only, not event loop time for every
+// other request. The queue is bounded (excess jobs fail fast with 503) and
+// each job has a deadline covering both its wait and its run; a job that
+// overruns while running takes its worker down with it, since bcrypt cannot
+// be interrupted, and a fresh worker replaces it.
+class PasswordPool {
+  constructor(options = {}) {
+    this.size = options.size || DEFAULT_POOL_SIZE;
+    this.maxQueue = options.maxQueue || DEFAULT_MAX_QUEUE;
+    this.timeoutMs = options.timeoutMs || DEFAULT_JOB_TIMEOUT_MS;
+    this.workers = [];
+    this.idle = [];
+    this.queue = [];
+    this.nextJobId = 1;
+    this.stats = {
+      submitted: 0,
+      completed: 0,
+      failed: 0,
+      rejected: 0,
+      timedOut: 0,
+      workerRestarts: 0,
+      maxQueueDepth: 0,
+      totalWaitMs: 0,
+      totalRunMs: 0
+    };
+  }
+
+  hash(password, rounds = BCRYPT_SALT_ROUNDS) {
+    return this.submit({ op: 'hash', password, rounds });
+  }
+
+  compare(password, hash) {
+    return this.submit({ op: 'compare', password, hash });
+  }
+
+  submit(task) {
+    this.stats.submitted++;
+
+    if (this.queue.length >= this.maxQueue) {
+      this.stats.rejected++;
+      return Promise.reject(new AppError('Server is busy, please retry shortly', 503, 'SERVER_BUSY'));
+    }
+
+    return new Promise((resolve, reject) => {
+      const job = { ...task, id: this.nextJobId++, resolve, reject, queuedAt: Date.now() };
+      job.timer = setTimeout(() => this.expire(job), this.timeoutMs);
+
+      this.queue.push(job);
+      this.stats.maxQueueDepth = Math.max(this.stats.maxQueueDepth, this.queue.length);
+      this.dispatch();
+    });
+  }
+
+  dispatch() {
+    while (this.queue.length > 0) {
+      const slot = this.idle.pop() || this.spawn();
+      if (!slot) return;
+
+      const job = this.queue.shift();
+      job.startedAt = Date.now();
+      this.stats.totalWaitMs += job.startedAt - job.queuedAt;
+
+      slot.job = job;
+      slot.worker.ref();
+      slot.worker.postMessage({ id: job.id, op: job.op, password: job.password, hash: job.hash, rounds: job.rounds });
+    }
+  }
+
+  // Start another worker while below the pool size
+  spawn() {
+    if (this.workers.length >= this.size) return null;
+
+    const slot = { worker: new Worker(WORKER_FILE), job: null };
+    slot.worker.on('message', (message) => this.finish(slot, message));
+    slot.worker.on('error', (error) => this.retire(slot, error));
+    slot.worker.on('exit', () => this.retire(slot, new Error('Password worker exited')));
+    this.workers.push(slot);
+    return slot;
+  }
+
+  finish(slot, { id, result, error }) {
+    const { job } = slot;
+    if (!job || job.id !== id) return;
+
+    clearTimeout(job.timer);
+    this.stats.totalRunMs += Date.now() - job.startedAt;
+    slot.job = null;
+    // Idle workers must not keep the process alive
+    slot.worker.unref();
+    this.idle.push(slot);
+
+    if (error) {
+      this.stats.failed++;
+      job.reject(new Error(error));
+    } else {
+      this.stats.completed++;
+      job.resolve(result);
+    }
+    this.dispatch();
+  }
+
+  expire(job) {
+    this.stats.timedOut++;
+    job.reject(new AppError('Password check timed out, please retry', 503, 'SERVER_BUSY'));
+
+    const queued = this.queue.indexOf(job);
+    if (queued !== -1) {
+      this.queue.splice(queued, 1);
+      return;
+    }
+
+    const slot = this.workers.find((candidate) => candidate.job === job);
+    if (slot) {
+      slot.job = null;
+      this.retire(slot);
+      slot.worker.terminate();
+    }
+  }
+
+  // Drop a dead or stuck worker, fail its job and let dispatch() replace it
+  retire(slot, error) {
+    if (!this.workers.includes(slot)) return;
+
+    this.workers = this.workers.filter((candidate) => candidate !== slot);
+    this.idle = this.idle.filter((candidate) => candidate !== slot);
+    this.stats.workerRestarts++;
+
+    if (slot.job) {
+      clearTimeout(slot.job.timer);
+      this.stats.failed++;
+      slot.job.reject(error);
+      slot.job = null;
+    }
+    this.dispatch();
+  }
+
+  getStats() {
+    const finished = this.stats.completed + this.stats.failed;
+    return {
+      ...this.stats,
+      size: this.size,
+      workers: this.workers.length,
+      busy: this.workers.filter((slot) => slot.job).length,
+      queueDepth: this.queue.length,
+      avgWaitMs: finished ? Math.round(this.stats.totalWaitMs / finished) : 0,
+      avgRunMs: finished ? Math.round(this.stats.totalRunMs / finished) : 0
+    };
+  }
+
+  async close() {
+    const slots = this.workers;
+    this.workers = [];
+    this.idle = [];
+    await Promise.all(slots.map((slot) => slot.worker.terminate()));
+  }
+}
+
+// Hashes made under a different BCRYPT_SALT_ROUNDS are upgraded on next login
+const needsRehash = (hash) => {
+  try {
+    return bcrypt.getRounds(hash) !== BCRYPT_SALT_ROUNDS;
+  } catch (error) {
+    return true;
+  }
+};
+
+const passwordPool = new PasswordPool();
+
+module.exports = {
+  BCRYPT_SALT_ROUNDS,
+  PasswordPool,
+  passwordPool,
+  needsRehash
+};
+'''
+
+with open('utils/passwordPool.js', 'w') as f:
+    f.write(password_pool_js)
+
+# Auth controller
+auth_controller_js = '''const { User } = require('../models');
+const { AppError, asyncHandler } = require('../middleware/errorHandler');
+const { generateToken } = require('../config/jwt');
+
+// Log in with email and password
+const login = asyncHandler(async (req, res) => {
+  const { email, password } = req.body;
+  const user = await User.findByEmail(email);
+
+  if (!user || !(await user.comparePassword(password))) {
+    throw new AppError('Invalid email or password', 401, 'UNAUTHORIZED');
+  }
+
+  if (!user.isActive) {
+    throw new AppError('User account has been deactivated', 401, 'ACCOUNT_INACTIVE');
+  }
+
+  // The plaintext is only known here, so this is where hashes made with an
+  // old cost are upgraded; the pre-save hook re-hashes it on the pool
+  if (user.needsRehash()) {
+    user.password = password;
+    await user.save({ validateBeforeSave: false });
+  }
+  user.updateLastLogin();
+
+  const token = generateToken({ userId: user._id, role: user.role, collegeId: user.collegeId });
+
+  res.status(200).json({
+    success: true,
+    message: 'Login successful',
+    data: {
+      user: {
+        _id: user._id,
+        name: user.name,
+        email: user.email,
+        role: user.role
+      },
+      token
+    }
+  });
+});
+
+module.exports = {
+  login
+};
+'''
+
+with open('controllers/authController.js', 'w') as f:
+    f.write(auth_controller_js)
+
+# Auth routes
+auth_routes_js = '''const express = require('express');
+const { validate, userSchemas } = require('../middleware/validation');
+const { rateLimit } = require('../middleware/rateLimit');
+const { login } = require('../controllers/authController');
+
+const router = express.Router();
+
+// Log in
+router.post('/login', rateLimit('login'), validate(userSchemas.login), login);
+
+module.exports = router;
+'''
+
+with open('routes/auth.js', 'w') as f:
+    f.write(auth_routes_js)
+
+# Login storm benchmark: event loop stalls with on-thread bcryptjs vs the pool
+password_pool_bench_js = '''const { monitorEventLoopDelay } = require('perf_hooks');
+const bcrypt = require('bcryptjs');
+require('dotenv').config();
+
+const { PasswordPool } = require('../utils/passwordPool');
+
+const LOGINS_PER_SEC = parseInt(process.env.BENCH_LOGIN_RATE) || 500;
+const SECONDS = parseInt(process.env.BENCH_SECONDS) || 5;
+// A lower cost than production keeps the on-thread run finite; the stall it
+// causes still grows with the offered rate
+const ROUNDS = parseInt(process.env.BENCH_BCRYPT_ROUNDS) || 8;
+const PASSWORD = 'Benchmark#Passw0rd';
+
+// Another endpoint's latency stand-in: a 1ms timer scheduled every 10ms,
+// measured from when it should fire to when it actually runs
+const probeLatencies = () => {
+  const samples = [];
+  let due = Date.now() + 1;
+  const timer = setInterval(() => {
+    samples.push(Date.now() - due);
+    due = Date.now() + 10;
+  }, 10);
+  return () => {
+    clearInterval(timer);
+    return samples.sort((a, b) => a - b);
+  };
+};
+
+const percentile = (sorted, p) => sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : 0;
+
+const storm = async (compare) => {
+  const loopDelay = monitorEventLoopDelay({ resolution: 10 });
+  loopDelay.enable();
+  const stopProbe = probeLatencies();
+
+  const hash = bcrypt.hashSync(PASSWORD, ROUNDS);
+  const outcomes = { ok: 0, rejected: 0 };
+  const logins = [];
+  const start = Date.now();
+
+  // Offer logins at a fixed rate in 10ms ticks
+  const perTick = Math.max(1, Math.round(LOGINS_PER_SEC / 100));
+  while (Date.now() - start < SECONDS * 1000) {
+    for (let i = 0; i < perTick; i++) {
+      logins.push(compare(PASSWORD, hash).then(() => outcomes.ok++, () => outcomes.rejected++));
+    }
+    await new Promise((resolve) => setTimeout(resolve, 10));
+  }
+  const offeredFor = Date.now() - start;
+  const probes = stopProbe();
+  loopDelay.disable();
+  await Promise.all(logins);
+
+  return {
+    loginsOffered: logins.length,
+    loginsOk: outcomes.ok,
+    loginsRejected: outcomes.rejected,
+    offeredForMs: offeredFor,
+    otherRequestP50Ms: percentile(probes, 0.5),
+    otherRequestP99Ms: percentile(probes, 0.99),
+    loopDelayP99Ms: (loopDelay.percentile(99) / 1e6).toFixed(1)
+  };
+};
+
+const main = async () => {
+  const onThread = await storm((password, hash) => bcrypt.compare(password, hash));
+
+  const pool = new PasswordPool();
+  const pooled = await storm((password, hash) => pool.compare(password, hash));
+  console.table({ 'bcryptjs on event loop': onThread, 'worker pool': pooled });
+  console.log(`${LOGINS_PER_SEC} logins/sec for ${SECONDS}s at cost ${ROUNDS}; pool:`, pool.getStats());
+
+  await pool.close();
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/passwordPool.bench.js', 'w') as f:
+    f.write(password_pool_bench_js)
+
+print("✅ Created utils/passwordPool.js & utils/passwordWorker.js - Bounded worker-thread pool for bcrypt")
+print("✅ Created controllers/authController.js & routes/auth.js - POST /auth/login with transparent rehash")
+print("✅ Created benchmarks/passwordPool.bench.js - Other-request latency during a login storm")
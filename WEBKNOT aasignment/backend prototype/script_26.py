@@ -0,0 +1,122 @@
+# Create the write-behind buffer for login timestamps
+
+last_login_buffer_js = '''const mongoose = require('mongoose');
+const { logger } = require('./logger');
+
+const DEFAULT_FLUSH_INTERVAL_MS = parseInt(process.env.LAST_LOGIN_FLUSH_MS) || 5000;
+const DEFAULT_MAX_BATCH_SIZE = parseInt(process.env.LAST_LOGIN_BATCH_SIZE) || 1000;
+
+// Collects login timestamps in memory (latest per user) and writes them with
+// one unordered bulkWrite of $max updates every flush interval, or as soon as
+// maxBatchSize users are pending. $max keeps the stored value monotonic when
+// several processes flush out of order. A crash loses at most one interval
+// (or one batch) of timestamps; a failed flush puts its entries back.
+class LastLoginBuffer {
+  constructor(options = {}) {
+    this.flushIntervalMs = options.flushIntervalMs || DEFAULT_FLUSH_INTERVAL_MS;
+    this.maxBatchSize = options.maxBatchSize || DEFAULT_MAX_BATCH_SIZE;
+    this.pending = new Map();
+    this.timer = null;
+    this.flushing = null;
+    this.stats = {
+      recorded: 0,
+      flushes: 0,
+      written: 0,
+      failedFlushes: 0,
+      lastFlushMs: 0,
+      maxFlushMs: 0,
+      totalFlushMs: 0,
+      lastFlushAt: null
+    };
+  }
+
+  record(userId, at = new Date()) {
+    const key = String(userId);
+    const current = this.pending.get(key);
+    if (!current || at > current) this.pending.set(key, at);
+    this.stats.recorded++;
+
+    if (!this.timer) {
+      this.timer = setInterval(() => this.flush(), this.flushIntervalMs);
+      this.timer.unref();
+    }
+    if (this.pending.size >= this.maxBatchSize) {
+      this.flush();
+    }
+  }
+
+  // Write everything pending; waits for a flush already in progress first
+  async flush() {
+    while (this.flushing) await this.flushing;
+    if (this.pending.size === 0) return;
+
+    const batch = this.pending;
+    this.pending = new Map();
+    this.flushing = this.writeBatch(batch);
+    try {
+      await this.flushing;
+    } finally {
+      this.flushing = null;
+    }
+  }
+
+  async writeBatch(batch) {
+    const User = mongoose.model('User');
+    const start = Date.now();
+
+    try {
+      await User.bulkWrite(
+        Array.from(batch, ([userId, at]) => ({
+          updateOne: { filter: { _id: userId }, update: { $max: { lastLogin: at } } }
+        })),
+        { ordered: false }
+      );
+      this.stats.written += batch.size;
+    } catch (error) {
+      logger.error('Error flushing login timestamps', { err: error });
+      this.stats.failedFlushes++;
+      for (const [userId, at] of batch) {
+        const current = this.pending.get(userId);
+        if (!current || at > current) this.pending.set(userId, at);
+      }
+    }
+
+    const elapsed = Date.now() - start;
+    this.stats.flushes++;
+    this.stats.lastFlushMs = elapsed;
+    this.stats.maxFlushMs = Math.max(this.stats.maxFlushMs, elapsed);
+    this.stats.totalFlushMs += elapsed;
+    this.stats.lastFlushAt = new Date();
+  }
+
+  // Stop the timer and write what is left (called on shutdown)
+  async stop() {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+    await this.flush();
+  }
+
+  getStats() {
+    return {
+      ...this.stats,
+      pending: this.pending.size,
+      averageFlushMs: this.stats.flushes > 0 ? Math.round(this.stats.totalFlushMs / this.stats.flushes) : 0
+    };
+  }
+}
+
+// Shared per-process instance used by User.updateLastLogin
+const lastLoginBuffer = new LastLoginBuffer();
+
+module.exports = {
+  LastLoginBuffer,
+  lastLoginBuffer
+};
+'''
+
+with open('utils/lastLoginBuffer.js', 'w') as f:
+    f.write(last_login_buffer_js)
+
+print("✅ Created utils/lastLoginBuffer.js - Write-behind $max batching of login timestamps")
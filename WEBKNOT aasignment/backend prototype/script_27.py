@@ -0,0 +1,298 @@
+# Create the query-plan regression check (index plan + explain() for every documented query shape)
+
+# Explain every documented query shape against a seeded database
+query_plans_check_js = '''const mongoose = require('mongoose');
+require('dotenv').config();
+
+const {
+  College,
+  User,
+  Event,
+  Registration,
+  Attendance,
+  Feedback,
+  Counter,
+  StudentRollup,
+  CollegeTypeRollup
+} = require('../models');
+const { EVENT_DERIVED, leanProjection } = require('../utils/leanViews');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const EVENTS = 200;
+const STUDENTS = 200;
+
+const collegeId = new mongoose.Types.ObjectId();
+const eventIds = Array.from({ length: EVENTS }, () => new mongoose.Types.ObjectId());
+const studentIds = Array.from({ length: STUDENTS }, () => new mongoose.Types.ObjectId());
+const now = Date.now();
+const day = 24 * 60 * 60 * 1000;
+
+const seed = async () => {
+  await College.collection.insertOne({ _id: collegeId, collegeId: 'CLG995', name: 'Plan Check College', isActive: true });
+  await User.collection.insertMany(studentIds.map((_id, i) => ({
+    _id,
+    userId: `PLANSTU${i}`,
+    email: `plan.student${i}@plan-check.edu`,
+    role: 'student',
+    studentId: `PLAN${i}`,
+    collegeId,
+    isActive: true
+  })));
+  await Event.collection.insertMany(eventIds.map((_id, i) => ({
+    _id,
+    eventId: `PLANEVT${i}_CLG995`,
+    name: `Plan Check Event ${i}`,
+    eventType: ['workshop', 'seminar', 'fest', 'hackathon'][i % 4],
+    status: i % 5 === 0 ? 'completed' : 'active',
+    collegeId,
+    date: new Date(now + Math.floor(i / 3) * day),
+    registrationDeadline: new Date(now + i * day),
+    capacity: 100,
+    totalRegistrations: i % 50,
+    tags: [`tag${i % 7}`]
+  })));
+  await Registration.collection.insertMany(studentIds.flatMap((studentId, s) => [0, 1, 2].map((k) => ({
+    registrationId: `REG${s}_${k}_PLAN`,
+    studentId,
+    eventId: eventIds[(s + k) % EVENTS],
+    collegeId,
+    registrationDate: new Date(now - (s + k) * 60 * 1000),
+    registrationStatus: k === 2 ? 'waitlisted' : 'registered',
+    waitlistPosition: k === 2 ? s + 1 : undefined
+  }))));
+  await Attendance.collection.insertMany(studentIds.map((studentId, s) => ({
+    attendanceId: `ATT${s}_PLAN`,
+    studentId,
+    eventId: eventIds[s % EVENTS],
+    checkInTime: new Date(now - s * 60 * 1000)
+  })));
+  await Feedback.collection.insertMany(studentIds.map((studentId, s) => ({
+    feedbackId: `FB${s}_PLAN`,
+    studentId,
+    eventId: eventIds[s % EVENTS],
+    overallRating: (s % 5) + 1,
+    submissionDate: new Date(now - s * 60 * 1000)
+  })));
+  await StudentRollup.collection.insertMany(studentIds.map((_id, s) => ({
+    _id, collegeId, eventsRegistered: s % 9, eventsAttended: s % 4
+  })));
+  await CollegeTypeRollup.collection.insertOne({ collegeId, eventType: 'workshop', totalEvents: 50 });
+  await Counter.collection.insertOne({ _id: `content:${collegeId}`, seq: 1 });
+};
+
+const cleanup = async () => {
+  await Promise.all([
+    College.collection.deleteMany({ _id: collegeId }),
+    User.collection.deleteMany({ collegeId }),
+    Event.collection.deleteMany({ collegeId }),
+    Registration.collection.deleteMany({ collegeId }),
+    Attendance.collection.deleteMany({ eventId: { $in: eventIds } }),
+    Feedback.collection.deleteMany({ eventId: { $in: eventIds } }),
+    StudentRollup.collection.deleteMany({ collegeId }),
+    CollegeTypeRollup.collection.deleteMany({ collegeId }),
+    Counter.collection.deleteMany({ _id: `content:${collegeId}` })
+  ]);
+};
+
+const listPage = (match, sort) => Event.aggregate([
+  { $match: match },
+  { $sort: sort },
+  { $limit: 11 },
+  { $project: leanProjection('eventId name date status', EVENT_DERIVED) }
+]);
+
+// Query shapes issued by the documented endpoints, each with the index
+// names allowed to serve it
+const QUERY_SHAPES = [
+  ['GET /events', ['date_1__id_1'], () => listPage({}, { date: 1, _id: 1 }).explain('queryPlanner')],
+  ['GET /events?collegeId', ['collegeId_1_date_1__id_1'], () => listPage({ collegeId }, { date: 1, _id: 1 }).explain('queryPlanner')],
+  ['GET /events?status', ['status_1_date_1__id_1'], () => listPage({ status: 'active' }, { date: 1, _id: 1 }).explain('queryPlanner')],
+  ['GET /events?collegeId&cursor', ['collegeId_1_date_1__id_1'], () => listPage({
+    collegeId,
+    $and: [
+      { date: { $gte: new Date(now + 10 * day) } },
+      { $or: [{ date: { $gt: new Date(now + 10 * day) } }, { _id: { $gt: eventIds[30] } }] }
+    ]
+  }, { date: 1, _id: 1 }).explain('queryPlanner')],
+  ['GET /events/:id', ['_id_'], () => Event.aggregate([{ $match: { _id: eventIds[0] } }]).explain('queryPlanner')],
+  ['GET /reports/events/popularity', ['totalRegistrations_-1'], () =>
+    Event.find({}).sort({ totalRegistrations: -1 }).limit(10).explain('queryPlanner')],
+  ['GET /reports/events/popularity?collegeId', ['collegeId_1_totalRegistrations_-1'], () =>
+    Event.find({ collegeId }).sort({ totalRegistrations: -1 }).limit(10).explain('queryPlanner')],
+  ['GET /reports/events/by-type', ['eventType_1_status_1'], () =>
+    Event.find({ eventType: 'workshop' }).sort({ date: -1 }).limit(100).explain('queryPlanner')],
+  ['GET /reports/exports (college events)', ['collegeId_1_date_1__id_1', 'collegeId_1_totalRegistrations_-1'], () =>
+    Event.find({ collegeId }).select('_id').explain('queryPlanner')],
+  ['POST /registrations (duplicate check)', ['studentId_1_eventId_1'], () =>
+    Registration.findOne({ studentId: studentIds[0], eventId: eventIds[0] }).explain('queryPlanner')],
+  ['POST /registrations/bulk', ['studentId_1_eventId_1', 'eventId_1_registrationStatus_1_waitlistPosition_1', 'eventId_1_registrationDate_1__id_1'], () =>
+    Registration.find({ eventId: eventIds[0], studentId: { $in: studentIds.slice(0, 50) } }).explain('queryPlanner')],
+  ['DELETE /registrations/:id (waitlist promotion)', ['eventId_1_registrationStatus_1_waitlistPosition_1'], () =>
+    Registration.findOne({ eventId: eventIds[2], registrationStatus: 'waitlisted' }).sort({ waitlistPosition: 1 }).explain('queryPlanner')],
+  ['GET /registrations/student/:studentId', ['studentId_1_registrationDate_-1__id_-1'], () =>
+    Registration.find({ studentId: studentIds[0] }).sort({ registrationDate: -1, _id: -1 }).limit(11).explain('queryPlanner')],
+  ['GET /registrations/event/:eventId', ['eventId_1_registrationDate_1__id_1'], () =>
+    Registration.find({ eventId: eventIds[0] }).sort({ registrationDate: 1, _id: 1 }).limit(11).explain('queryPlanner')],
+  ['DELETE /registrations/:id', ['_id_'], () =>
+    Registration.findOne({ _id: new mongoose.Types.ObjectId(), registrationStatus: { $ne: 'cancelled' } }).explain('queryPlanner')],
+  ['POST /attendance/checkin (registration lookup)', ['studentId_1_eventId_1', 'eventId_1_registrationStatus_1_waitlistPosition_1'], () =>
+    Registration.find({ eventId: { $in: eventIds.slice(0, 3) }, studentId: { $in: studentIds.slice(0, 50) }, registrationStatus: 'registered' }).explain('queryPlanner')],
+  ['GET /reports/exports/registrations', ['collegeId_1_registrationDate_1'], () =>
+    Registration.find({ collegeId, registrationDate: { $gte: new Date(now - day) } }).explain('queryPlanner')],
+  ['GET /attendance/event/:eventId', ['eventId_1_checkInTime_1'], () =>
+    Attendance.find({ eventId: eventIds[0] }).sort({ checkInTime: 1 }).explain('queryPlanner')],
+  ['GET /attendance/student/:studentId', ['studentId_1_checkInTime_-1'], () =>
+    Attendance.find({ studentId: studentIds[0] }).sort({ checkInTime: -1 }).explain('queryPlanner')],
+  ['GET /reports/exports/attendance', ['eventId_1_checkInTime_1'], () =>
+    Attendance.find({ eventId: { $in: eventIds.slice(0, 20) }, checkInTime: { $gte: new Date(now - day) } }).explain('queryPlanner')],
+  ['POST /feedback (duplicate check)', ['studentId_1_eventId_1'], () =>
+    Feedback.findOne({ studentId: studentIds[0], eventId: eventIds[0] }).explain('queryPlanner')],
+  ['GET /feedback/event/:eventId', ['eventId_1_submissionDate_-1'], () =>
+    Feedback.find({ eventId: eventIds[0] }).sort({ submissionDate: -1 }).explain('queryPlanner')],
+  ['GET /reports/exports/feedback', ['eventId_1_overallRating_1', 'eventId_1_submissionDate_-1'], () =>
+    Feedback.find({ eventId: { $in: eventIds.slice(0, 20) } }).explain('queryPlanner')],
+  ['POST /auth/login', ['email_1'], () => User.findOne({ email: 'plan.student0@plan-check.edu' }).explain('queryPlanner')],
+  ['authenticate (principal)', ['_id_'], () => User.findById(studentIds[0]).explain('queryPlanner')],
+  ['report student lookup', ['_id_'], () => User.find({ _id: { $in: studentIds.slice(0, 20) } }).explain('queryPlanner')],
+  ['college by code', ['collegeId_1'], () => College.findOne({ collegeId: 'CLG995' }).explain('queryPlanner')],
+  ['GET /reports/students/top-active', ['eventsAttended_-1_eventsRegistered_-1'], () =>
+    StudentRollup.find({}).sort({ eventsAttended: -1, eventsRegistered: -1 }).limit(3).explain('queryPlanner')],
+  ['GET /reports/students/participation?collegeId', ['collegeId_1_eventsAttended_-1_eventsRegistered_-1'], () =>
+    StudentRollup.find({ collegeId }).sort({ eventsAttended: -1, eventsRegistered: -1 }).limit(100).explain('queryPlanner')],
+  ['GET /reports/events/by-type (rollups)', ['eventType_1_collegeId_1'], () =>
+    CollegeTypeRollup.find({ eventType: 'workshop' }).explain('queryPlanner')],
+  ['content version refresh', ['_id_'], () => Counter.find({ _id: { $regex: '^content:' } }).explain('queryPlanner')]
+];
+
+// Stages of the winning plan(s) anywhere in an explain document; aggregate
+// explains nest them under $cursor, slot-based plans under queryPlan
+const winningStages = (explain) => {
+  const stages = [];
+  const visit = (node, winning) => {
+    if (Array.isArray(node)) return node.forEach((child) => visit(child, winning));
+    if (!node || typeof node !== 'object') return;
+    if (winning && typeof node.stage === 'string') stages.push(node);
+    for (const [key, child] of Object.entries(node)) {
+      if (key !== 'rejectedPlans') visit(child, winning || key === 'winningPlan');
+    }
+  };
+  visit(explain, false);
+  return stages;
+};
+
+const indexesUsed = (stages) => stages
+  .map((stage) => (stage.stage.includes('IDHACK') ? '_id_' : stage.indexName))
+  .filter(Boolean);
+
+const indexName = (key) => Object.entries(key).map(([field, direction]) => `${field}_${direction}`).join('_');
+
+const isPrefix = (shorter, longer) => {
+  const [a, b] = [Object.entries(shorter), Object.entries(longer)];
+  return a.length < b.length && a.every(([field, direction], i) => b[i][0] === field && b[i][1] === direction);
+};
+
+// Minimal index set for a model, planned from the declarations Mongoose
+// collected on its schema (field-level index/unique, nested paths included,
+// and schema.index() alike), plus a finding for every declaration dropped
+const planIndexes = (model) => {
+  const findings = [];
+  const kept = [];
+
+  for (const [key, options = {}] of mongoose.model(model).schema.indexes()) {
+    const index = {
+      name: options.name || indexName(key),
+      key,
+      unique: Boolean(options.unique),
+      sparse: Boolean(options.sparse),
+      partial: Boolean(options.partialFilterExpression)
+    };
+    if (index.sparse && index.partial) {
+      findings.push(`${model}: ${index.name} mixes sparse with partialFilterExpression, which MongoDB rejects`);
+    }
+
+    const same = kept.find((other) => other.name === index.name);
+    if (same) {
+      findings.push(`${model}: ${index.name} is declared more than once`);
+      if (same.unique !== index.unique) findings.push(`${model}: ${index.name} is declared both unique and non-unique`);
+      same.unique = same.unique || index.unique;
+    } else {
+      kept.push(index);
+    }
+  }
+
+  const planned = kept.filter((index) => {
+    const plain = !(index.unique || index.sparse || index.partial);
+    const text = Object.values(index.key).includes('text');
+    const covering = kept.find((other) => !(other.sparse || other.partial) && isPrefix(index.key, other.key));
+    if (plain && !text && covering) {
+      findings.push(`${model}: ${index.name} is a prefix of ${covering.name}`);
+      return false;
+    }
+    return true;
+  });
+
+  return { planned, findings };
+};
+
+// Every registered model's declarations must reduce to a minimal set without
+// findings, and its live indexes must be exactly that set
+const checkIndexes = async () => {
+  const failures = [];
+  for (const model of mongoose.modelNames()) {
+    const { planned, findings } = planIndexes(model);
+    failures.push(...findings);
+
+    const live = (await mongoose.model(model).collection.indexes()).map((index) => index.name).filter((name) => name !== '_id_');
+    const expected = planned.map((index) => index.name);
+    const missing = expected.filter((name) => !live.includes(name));
+    const extra = live.filter((name) => !expected.includes(name));
+    if (missing.length || extra.length) {
+      failures.push(`${model}: missing [${missing.join(', ')}], unplanned [${extra.join(', ')}]`);
+    }
+  }
+  return failures;
+};
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  for (const model of Object.values(mongoose.models)) await model.syncIndexes();
+
+  const failures = await checkIndexes();
+  await seed();
+
+  try {
+    for (const [shape, allowed, explain] of QUERY_SHAPES) {
+      const stages = winningStages(await explain());
+      const used = indexesUsed(stages);
+
+      if (stages.length === 0) {
+        failures.push(`${shape}: no winning plan in explain output`);
+      } else if (stages.some((stage) => stage.stage === 'COLLSCAN')) {
+        failures.push(`${shape}: COLLSCAN`);
+      } else if (!used.some((name) => allowed.includes(name))) {
+        failures.push(`${shape}: used [${used.join(', ')}], expected one of [${allowed.join(', ')}]`);
+      }
+    }
+  } finally {
+    await cleanup();
+    await mongoose.connection.close();
+  }
+
+  if (failures.length > 0) {
+    failures.forEach((failure) => console.error(`✗ ${failure}`));
+    console.error(`${failures.length} query plan check(s) failed`);
+    process.exit(1);
+  }
+  console.log(`✓ ${QUERY_SHAPES.length} query shapes use their planned indexes; live indexes match the plan for ${mongoose.modelNames().length} models`);
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/queryPlans.check.js', 'w') as f:
+    f.write(query_plans_check_js)
+
+print("✅ Created benchmarks/queryPlans.check.js - Index plan and explain() regression check for every documented query shape")
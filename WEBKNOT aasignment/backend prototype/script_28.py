@@ -0,0 +1,361 @@
+# Create the shared token-bucket rate limiter (per user and per college, per route policy)
+
+# Rate limit bucket model
+rate_limit_bucket_js = '''const mongoose = require('mongoose');
+
+// One token bucket per (policy, user | college | login email); shared by every process
+const rateLimitBucketSchema = new mongoose.Schema({
+  _id: {
+    type: String,
+    required: true
+  },
+  tokens: {
+    type: Number,
+    required: true
+  },
+  updatedAt: {
+    type: Date,
+    required: true
+  },
+  expiresAt: {
+    type: Date,
+    required: true
+  },
+  // Outcome of the most recent consume, returned by the same atomic update
+  allowed: Boolean
+}, {
+  versionKey: false
+});
+
+// Idle buckets are refilled by then anyway; let MongoDB remove them
+rateLimitBucketSchema.index({ expiresAt: 1 }, { expireAfterSeconds: 0 });
+
+module.exports = mongoose.model('RateLimitBucket', rateLimitBucketSchema);
+'''
+
+with open('models/RateLimitBucket.js', 'w') as f:
+    f.write(rate_limit_bucket_js)
+
+# Bucket stores
+rate_limit_store_js = '''const mongoose = require('mongoose');
+const LRUCache = require('./lruCache');
+
+// Token bucket: `capacity` tokens, refilled continuously at capacity per
+// windowMs. consume() takes `cost` tokens if available and reports what is
+// left and how long until `cost` tokens would be available again.
+const bucketResult = (tokens, allowed, cost, refillPerMs) => ({
+  allowed,
+  remaining: Math.max(0, Math.floor(tokens)),
+  retryAfterMs: tokens >= cost ? 0 : Math.ceil((cost - tokens) / refillPerMs)
+});
+
+// Shared store: one atomic findOneAndUpdate per bucket using MongoDB's clock,
+// so every worker process (and host) sees the same bucket
+class MongoRateLimitStore {
+  async consume(key, { capacity, windowMs, cost }) {
+    const RateLimitBucket = mongoose.model('RateLimitBucket');
+    const refillPerMs = capacity / windowMs;
+
+    const bucket = await RateLimitBucket.findOneAndUpdate(
+      { _id: key },
+      [
+        {
+          $set: {
+            tokens: {
+              $min: [capacity, {
+                $add: [
+                  { $ifNull: ['$tokens', capacity] },
+                  { $multiply: [{ $subtract: ['$$NOW', { $ifNull: ['$updatedAt', '$$NOW'] }] }, refillPerMs] }
+                ]
+              }]
+            },
+            updatedAt: '$$NOW'
+          }
+        },
+        { $set: { allowed: { $gte: ['$tokens', cost] } } },
+        {
+          $set: {
+            tokens: { $cond: ['$allowed', { $subtract: ['$tokens', cost] }, '$tokens'] },
+            expiresAt: { $add: ['$$NOW', windowMs] }
+          }
+        }
+      ],
+      { upsert: true, new: true }
+    ).lean();
+
+    return bucketResult(bucket.tokens, bucket.allowed, cost, refillPerMs);
+  }
+}
+
+// Local stand-in with the same arithmetic, for a single process and tests
+class MemoryRateLimitStore {
+  constructor(options = {}) {
+    this.buckets = new LRUCache({ max: options.max || 100000 });
+  }
+
+  async consume(key, { capacity, windowMs, cost }) {
+    const refillPerMs = capacity / windowMs;
+    const now = Date.now();
+    const bucket = this.buckets.get(key) || { tokens: capacity, updatedAt: now };
+
+    const tokens = Math.min(capacity, bucket.tokens + (now - bucket.updatedAt) * refillPerMs);
+    const allowed = tokens >= cost;
+    const left = allowed ? tokens - cost : tokens;
+    this.buckets.set(key, { tokens: left, updatedAt: now }, windowMs);
+
+    return bucketResult(left, allowed, cost, refillPerMs);
+  }
+}
+
+// Serves hot shared buckets (a college's budget, hit by every request from that
+// college) from a local lease of tokens instead of one shared write per
+// request. A lease is `leasePercent` of the bucket's capacity taken in one
+// consume(); while it lasts, requests are admitted locally. Once the shared
+// bucket cannot cover a whole lease, requests fall back to consuming from it
+// one by one, so the limit stays exact near exhaustion, and a refusal is
+// remembered locally until its retry time. Tokens still unused when a lease
+// expires are dropped, so a college can be throttled up to one lease per
+// process early, never late.
+class LeasedRateLimitStore {
+  constructor(store, options = {}) {
+    this.store = store;
+    this.leasePercent = options.leasePercent || parseInt(process.env.RATE_LIMIT_LEASE_PERCENT) || 1;
+    this.leaseMs = options.leaseMs || parseInt(process.env.RATE_LIMIT_LEASE_MS) || 1000;
+    this.leases = new LRUCache({ max: options.max || 10000 });
+    this.pending = new Map();
+    this.refusals = new LRUCache({ max: options.max || 10000 });
+    this.stats = { local: 0, leases: 0, direct: 0, refused: 0 };
+  }
+
+  takeLocal(key, cost) {
+    const lease = this.leases.get(key);
+    if (!lease || lease.tokens < cost) return null;
+
+    lease.tokens -= cost;
+    this.stats.local++;
+    return { allowed: true, remaining: Math.floor(lease.tokens), retryAfterMs: 0 };
+  }
+
+  // One lease request per key at a time; concurrent callers share its outcome
+  async renew(key, { capacity, windowMs }) {
+    const size = Math.max(1, Math.floor((capacity * this.leasePercent) / 100));
+    const result = await this.store.consume(key, { capacity, windowMs, cost: size });
+    if (!result.allowed) return false;
+
+    this.leases.set(key, { tokens: size }, Math.min(this.leaseMs, windowMs));
+    this.stats.leases++;
+    return true;
+  }
+
+  async consume(key, limits) {
+    const refusal = this.refusals.get(key);
+    if (refusal) {
+      this.stats.refused++;
+      return { allowed: false, remaining: 0, retryAfterMs: Math.max(1, refusal - Date.now()) };
+    }
+
+    // Each renewal takes tokens from the shared bucket, so this ends once the
+    // bucket can no longer cover a lease
+    for (;;) {
+      const local = this.takeLocal(key, limits.cost);
+      if (local) return local;
+
+      if (!this.pending.has(key)) {
+        this.pending.set(key, this.renew(key, limits).finally(() => this.pending.delete(key)));
+      }
+      if (!(await this.pending.get(key))) break;
+    }
+
+    this.stats.direct++;
+    const result = await this.store.consume(key, limits);
+    if (!result.allowed) this.refusals.set(key, Date.now() + result.retryAfterMs, result.retryAfterMs);
+    return result;
+  }
+
+  getStats() {
+    return { ...this.stats, activeLeases: this.leases.map.size, activeRefusals: this.refusals.map.size };
+  }
+}
+
+const createRateLimitStore = (type = process.env.RATE_LIMIT_STORE) =>
+  (type === 'memory' ? new MemoryRateLimitStore() : new MongoRateLimitStore());
+
+module.exports = {
+  MongoRateLimitStore,
+  MemoryRateLimitStore,
+  LeasedRateLimitStore,
+  createRateLimitStore
+};
+'''
+
+with open('utils/rateLimitStore.js', 'w') as f:
+    f.write(rate_limit_store_js)
+
+# Rate limiting middleware
+rate_limit_js = '''const { verifyToken, extractToken } = require('../config/jwt');
+const { createRateLimitStore, LeasedRateLimitStore } = require('../utils/rateLimitStore');
+const { logger } = require('../utils/logger');
+
+const WINDOW_MS = parseInt(process.env.RATE_LIMIT_WINDOW_MS) || 60 * 1000;
+
+// Independent budgets per route group. `user` is per authenticated user (or
+// per login email), `college` is shared by everyone in the caller's college,
+// `ip` is a coarse ceiling per client address for callers without a user
+// bucket (anonymous requests) and for login, and `cost` is what one request
+// takes from each.
+const RATE_LIMIT_POLICIES = {
+  api: {
+    user: parseInt(process.env.RATE_LIMIT_MAX_REQUESTS) || 100,
+    college: parseInt(process.env.RATE_LIMIT_COLLEGE_MAX_REQUESTS) || 5000,
+    ip: parseInt(process.env.RATE_LIMIT_IP_MAX_REQUESTS) || 100,
+    cost: 1
+  },
+  login: {
+    user: parseInt(process.env.RATE_LIMIT_LOGIN_MAX) || 5,
+    // Well above the login burst of a campus sharing one NAT address at the
+    // start of an event; only a single client spraying accounts reaches it
+    ip: parseInt(process.env.RATE_LIMIT_LOGIN_IP_MAX) || 2000,
+    cost: 1
+  },
+  registration: {
+    user: parseInt(process.env.RATE_LIMIT_REGISTRATION_MAX) || 20,
+    college: parseInt(process.env.RATE_LIMIT_COLLEGE_REGISTRATION_MAX) || 3000,
+    cost: 1
+  },
+  reports: {
+    user: parseInt(process.env.RATE_LIMIT_REPORTS_MAX) || 60,
+    college: parseInt(process.env.RATE_LIMIT_COLLEGE_REPORTS_MAX) || 300,
+    cost: 1
+  }
+};
+
+let store = null;
+let collegeStore = null;
+const getStore = () => {
+  if (!store) store = createRateLimitStore();
+  return store;
+};
+
+// College buckets are shared by every request from a college, so they are
+// served from local leases rather than written on every request
+const getCollegeStore = () => {
+  if (!collegeStore) collegeStore = new LeasedRateLimitStore(getStore());
+  return collegeStore;
+};
+
+// Swap the bucket store (e.g. a MemoryRateLimitStore in tests)
+const setRateLimitStore = (replacement) => {
+  store = replacement;
+  collegeStore = null;
+};
+
+const getRateLimitStats = () => (collegeStore ? collegeStore.getStats() : null);
+
+const idOf = (value) => (value ? String(value._id || value) : null);
+
+// Who is calling: req.user once authenticate has run, otherwise the token's
+// claims (verified through the token cache, no database read). Authenticated
+// callers are not keyed by IP, since a whole campus can share one address;
+// anonymous requests only get the coarse per-IP ceiling.
+const callerOf = (req) => {
+  if (req.user) {
+    return { user: `user:${req.user._id}`, college: idOf(req.user.collegeId), ip: null };
+  }
+
+  const token = extractToken(req);
+  if (token) {
+    try {
+      const claims = verifyToken(token);
+      return { user: `user:${claims.userId}`, college: idOf(claims.collegeId), ip: null };
+    } catch (error) {
+      // invalid tokens are rejected by authenticate without touching the database
+    }
+  }
+  return { user: null, college: null, ip: `ip:${req.ip}` };
+};
+
+// Login is keyed by the account being tried, so a campus behind one NAT does
+// not share a tight budget while a single account still cannot be
+// brute-forced. The per-IP ceiling stops one address spraying many accounts.
+const loginCallerOf = (req) => ({
+  user: `login:${String(req.body?.email || req.ip).toLowerCase()}`,
+  college: null,
+  ip: `ip:${req.ip}`
+});
+
+const setRateLimitHeaders = (res, limit, result) => {
+  res.setHeader('RateLimit-Limit', limit);
+  res.setHeader('RateLimit-Remaining', result.remaining);
+  res.setHeader('RateLimit-Reset', Math.ceil(result.retryAfterMs / 1000));
+};
+
+// Consume from the caller's IP ceiling (anonymous callers and login), then
+// their user bucket, then their college bucket, for `policyName`. Each bucket
+// is only charged for requests the previous one admitted, so one throttled
+// user cannot drain their college's budget. Store errors fail open: an
+// unavailable limiter must not take the API down. `options.except` lists
+// paths (relative to the mount point) that have their own policy and skip
+// this one.
+const rateLimit = (policyName, options = {}) => {
+  const { except = [], ...overrides } = options;
+  const policy = { ...RATE_LIMIT_POLICIES[policyName], ...overrides };
+  const identify = policyName === 'login' ? loginCallerOf : callerOf;
+
+  return async (req, res, next) => {
+    if (except.includes(req.path)) return next();
+
+    const caller = identify(req);
+    const windowMs = policy.windowMs || WINDOW_MS;
+    const buckets = [
+      policy.ip && caller.ip && { store: getStore(), key: caller.ip, capacity: policy.ip, scope: 'IP' },
+      caller.user && { store: getStore(), key: caller.user, capacity: policy.user, scope: 'user' },
+      policy.college && caller.college && { store: getCollegeStore(), key: `college:${caller.college}`, capacity: policy.college, scope: 'college' }
+    ].filter(Boolean);
+    if (buckets.length === 0) return next();
+
+    try {
+      let blocked = null;
+      for (const bucket of buckets) {
+        const result = await bucket.store.consume(`${policyName}:${bucket.key}`, { capacity: bucket.capacity, windowMs, cost: policy.cost });
+        if (bucket === buckets[0] || bucket.scope === 'user') setRateLimitHeaders(res, bucket.capacity, result);
+        if (!result.allowed) {
+          blocked = { ...bucket, result };
+          break;
+        }
+      }
+
+      if (blocked) {
+        res.setHeader('Retry-After', Math.max(1, Math.ceil(blocked.result.retryAfterMs / 1000)));
+        return res.status(429).json({
+          success: false,
+          message: 'Too many requests, please try again later.',
+          error: {
+            code: 'RATE_LIMITED',
+            details: blocked.scope === 'user'
+              ? `Request limit for ${policyName} reached`
+              : `${blocked.scope === 'IP' ? 'Per-IP' : 'College-wide'} request limit for ${policyName} reached`
+          }
+        });
+      }
+    } catch (error) {
+      logger.error('Error checking rate limit', { err: error });
+    }
+
+    next();
+  };
+};
+
+module.exports = {
+  RATE_LIMIT_POLICIES,
+  rateLimit,
+  setRateLimitStore,
+  getRateLimitStats
+};
+'''
+
+with open('middleware/rateLimit.js', 'w') as f:
+    f.write(rate_limit_js)
+
+print("✅ Created models/RateLimitBucket.js - Shared token buckets with TTL cleanup")
+print("✅ Created utils/rateLimitStore.js - MongoDB-backed, in-memory and leased bucket stores")
+print("✅ Created middleware/rateLimit.js - Per-user and per-college limits for api, login, registration and reports")
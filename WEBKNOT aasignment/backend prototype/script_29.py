@@ -0,0 +1,384 @@
+# Create graceful shutdown, the cluster supervisor and the core-scaling benchmark
+
+graceful_shutdown_js = '''const mongoose = require('mongoose');
+const { logger } = require('./logger');
+
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS) || 10000;
+
+// Work that must finish before the process exits (flush buffers, stop timers)
+const tasks = [];
+let shuttingDown = null;
+
+const onShutdown = (name, task) => {
+  tasks.push({ name, task });
+};
+
+const isShuttingDown = () => shuttingDown !== null;
+
+// Stop accepting connections and let in-flight requests finish, then run the
+// shutdown tasks in order and close MongoDB. A hard deadline bounds the whole
+// drain so a hung request cannot keep a retiring process alive.
+const shutdown = (server, reason) => {
+  if (!shuttingDown) {
+    logger.info('Shutting down, draining in-flight requests', { reason });
+    const deadline = setTimeout(() => {
+      logger.error('Shutdown did not finish in time, exiting', { timeoutMs: SHUTDOWN_TIMEOUT_MS });
+      logger.writer.flushSync();
+      process.exit(1);
+    }, SHUTDOWN_TIMEOUT_MS);
+    deadline.unref();
+
+    shuttingDown = (async () => {
+      await new Promise((resolve) => {
+        server.close(resolve);
+        // Keep-alive sockets with no request in flight would otherwise hold close() open
+        if (server.closeIdleConnections) server.closeIdleConnections();
+      });
+
+      for (const { name, task } of tasks) {
+        try {
+          await task();
+        } catch (error) {
+          logger.error('Error during shutdown', { task: name, err: error });
+        }
+      }
+
+      await mongoose.connection.close();
+      logger.info('MongoDB connection closed through app termination');
+      await logger.flush();
+      process.exit(0);
+    })();
+  }
+  return shuttingDown;
+};
+
+// Signals from the terminal or a process manager, and the cluster supervisor's
+// 'shutdown' message (or its disappearance) all trigger the same drain
+const installShutdownHandlers = (server) => {
+  process.on('SIGTERM', () => shutdown(server, 'SIGTERM'));
+  process.on('SIGINT', () => shutdown(server, 'SIGINT'));
+
+  if (process.send) {
+    process.on('message', (message) => {
+      if (message === 'shutdown') shutdown(server, 'supervisor request');
+    });
+    process.on('disconnect', () => shutdown(server, 'supervisor exited'));
+  }
+};
+
+// Responses sent while draining ask clients to reconnect elsewhere
+const closeConnectionsWhileDraining = (req, res, next) => {
+  if (isShuttingDown()) res.setHeader('Connection', 'close');
+  next();
+};
+
+module.exports = {
+  onShutdown,
+  isShuttingDown,
+  shutdown,
+  installShutdownHandlers,
+  closeConnectionsWhileDraining
+};
+'''
+
+with open('utils/gracefulShutdown.js', 'w') as f:
+    f.write(graceful_shutdown_js)
+
+# Cluster supervisor
+cluster_js = '''const cluster = require('cluster');
+const os = require('os');
+const path = require('path');
+require('dotenv').config();
+
+const WORKERS = parseInt(process.env.WEB_CONCURRENCY) || os.cpus().length;
+const RESTART_BACKOFF_MS = parseInt(process.env.RESTART_BACKOFF_MS) || 1000;
+const RESTART_BACKOFF_MAX_MS = 30 * 1000;
+// A worker that ran this long before exiting counts as healthy again
+const STABLE_AFTER_MS = 60 * 1000;
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS) || 10000;
+// Workers that die before ever listening (bad config, missing module) will
+// keep dying; after this many in a row the supervisor gives up
+const MAX_BOOT_FAILURES = parseInt(process.env.WORKER_MAX_BOOT_FAILURES) || 5;
+
+cluster.setupPrimary({ exec: path.join(__dirname, 'server.js') });
+
+let stopping = false;
+let restarting = false;
+let crashes = 0;
+let bootFailures = 0;
+let announced = false;
+const listening = new Set();
+
+const fork = () => {
+  const worker = cluster.fork();
+  worker.startedAt = Date.now();
+  return worker;
+};
+
+const once = (worker, event) => new Promise((resolve) => worker.once(event, () => resolve(event)));
+
+cluster.on('listening', (worker) => {
+  listening.add(worker.id);
+  worker.listened = true;
+  bootFailures = 0;
+  if (!announced && listening.size >= WORKERS) {
+    announced = true;
+    console.log(`✅ ${WORKERS} workers listening (supervisor pid ${process.pid})`);
+  }
+});
+
+// Replace crashed workers; repeated quick crashes back off exponentially.
+// Workers that never came up count as boot failures, and too many of those
+// in a row stop the supervisor instead of restarting forever.
+cluster.on('exit', (worker, code, signal) => {
+  listening.delete(worker.id);
+  if (stopping || worker.retiring) return;
+
+  if (!worker.listened && ++bootFailures >= MAX_BOOT_FAILURES) {
+    console.error(`❌ ${bootFailures} workers in a row exited before listening (last: ${signal || code}); giving up`);
+    stop('boot failures', 1);
+    return;
+  }
+
+  crashes = Date.now() - worker.startedAt > STABLE_AFTER_MS ? 1 : crashes + 1;
+  const delay = Math.min(RESTART_BACKOFF_MAX_MS, RESTART_BACKOFF_MS * 2 ** (crashes - 1));
+  console.error(`❌ Worker ${worker.process.pid} exited (${signal || code}), restarting in ${delay}ms`);
+
+  setTimeout(() => {
+    if (!stopping) fork();
+  }, delay);
+});
+
+// Ask a worker to drain and exit; kill it if it overruns its own deadline
+const retire = async (worker) => {
+  worker.retiring = true;
+  const exited = once(worker, 'exit');
+  const timer = setTimeout(() => worker.process.kill('SIGKILL'), SHUTDOWN_TIMEOUT_MS + 1000);
+
+  if (worker.isConnected()) worker.send('shutdown');
+  await exited;
+  clearTimeout(timer);
+};
+
+// Replace workers one at a time: each replacement is accepting connections
+// before the worker it replaces starts draining, so capacity never drops
+const rollingRestart = async () => {
+  if (restarting || stopping) return;
+  restarting = true;
+  console.log('🔄 Rolling restart of all workers');
+
+  for (const worker of Object.values(cluster.workers)) {
+    if (stopping) break;
+
+    const replacement = fork();
+    replacement.retiring = true; // a replacement that dies on boot is not respawned
+    if ((await Promise.race([once(replacement, 'listening'), once(replacement, 'exit')])) === 'exit') {
+      console.error('❌ Replacement worker failed to start; rolling restart aborted');
+      break;
+    }
+    replacement.retiring = false;
+    await retire(worker);
+  }
+
+  restarting = false;
+  console.log('✅ Rolling restart finished');
+};
+
+const stop = async (reason, exitCode = 0) => {
+  if (stopping) return;
+  stopping = true;
+  console.log(`🛑 Stopping (${reason}), draining ${Object.keys(cluster.workers).length} workers`);
+
+  await Promise.all(Object.values(cluster.workers).map(retire));
+  process.exit(exitCode);
+};
+
+for (let i = 0; i < WORKERS; i++) fork();
+
+process.on('SIGHUP', rollingRestart);
+process.on('SIGTERM', () => stop('SIGTERM'));
+process.on('SIGINT', () => stop('SIGINT'));
+'''
+
+with open('cluster.js', 'w') as f:
+    f.write(cluster_js)
+
+# Requests/sec by worker count on the event listing and registration paths
+cluster_bench_js = '''const http = require('http');
+const os = require('os');
+const path = require('path');
+const { spawn } = require('child_process');
+const mongoose = require('mongoose');
+require('dotenv').config();
+
+process.env.JWT_SECRET = process.env.JWT_SECRET || 'cluster-bench-secret';
+
+const { College, User, Event, Registration } = require('../models');
+const { generateToken } = require('../config/jwt');
+
+const MONGODB_URI = process.env.BENCH_MONGODB_URI || 'mongodb://localhost:27017/campus-events-bench';
+const PORT = parseInt(process.env.BENCH_PORT) || 3900;
+const SECONDS = parseInt(process.env.BENCH_SECONDS) || 10;
+const CONCURRENCY = parseInt(process.env.BENCH_CONCURRENCY) || 64;
+const STUDENTS = parseInt(process.env.BENCH_STUDENTS) || 50000;
+const EVENTS = 200;
+const UNLIMITED = '1000000000';
+
+// 1, 2, 4, ... up to the core count
+const workerCounts = () => {
+  const cores = os.cpus().length;
+  const counts = [];
+  for (let n = 1; n < cores; n *= 2) counts.push(n);
+  return [...counts, cores];
+};
+
+const send = (agent, { method = 'GET', path: urlPath, token, body }) => new Promise((resolve) => {
+  const payload = body ? JSON.stringify(body) : null;
+  const headers = {};
+  if (token) headers.Authorization = `Bearer ${token}`;
+  if (payload) {
+    headers['Content-Type'] = 'application/json';
+    headers['Content-Length'] = Buffer.byteLength(payload);
+  }
+
+  const req = http.request({ host: '127.0.0.1', port: PORT, method, path: urlPath, agent, headers }, (res) => {
+    res.resume();
+    res.on('end', () => resolve(res.statusCode));
+  });
+  req.on('error', () => resolve(599));
+  req.end(payload);
+});
+
+// Closed-loop load: CONCURRENCY keep-alive clients for SECONDS
+const load = async (nextRequest) => {
+  const agent = new http.Agent({ keepAlive: true, maxSockets: CONCURRENCY });
+  const end = Date.now() + SECONDS * 1000;
+  let ok = 0;
+  let failed = 0;
+
+  await Promise.all(Array.from({ length: CONCURRENCY }, async () => {
+    while (Date.now() < end) {
+      const status = await send(agent, nextRequest());
+      if (status < 400) ok++;
+      else failed++;
+    }
+  }));
+
+  agent.destroy();
+  return { rps: Math.round(ok / SECONDS), failed };
+};
+
+const startCluster = (workers) => new Promise((resolve, reject) => {
+  const child = spawn(process.execPath, [path.join(__dirname, '..', 'cluster.js')], {
+    env: {
+      ...process.env,
+      NODE_ENV: 'production',
+      MONGODB_URI,
+      PORT: String(PORT),
+      WEB_CONCURRENCY: String(workers),
+      RATE_LIMIT_MAX_REQUESTS: UNLIMITED,
+      RATE_LIMIT_COLLEGE_MAX_REQUESTS: UNLIMITED,
+      RATE_LIMIT_REGISTRATION_MAX: UNLIMITED,
+      RATE_LIMIT_COLLEGE_REGISTRATION_MAX: UNLIMITED
+    },
+    stdio: ['ignore', 'pipe', 'inherit']
+  });
+
+  child.stdout.on('data', (chunk) => {
+    if (chunk.toString().includes('workers listening')) resolve(child);
+  });
+  child.on('exit', (code) => reject(new Error(`cluster exited with code ${code} before listening`)));
+});
+
+const stopCluster = (child) => new Promise((resolve) => {
+  child.removeAllListeners('exit');
+  child.once('exit', resolve);
+  child.kill('SIGTERM');
+});
+
+const main = async () => {
+  await mongoose.connect(MONGODB_URI);
+  await Promise.all([User.syncIndexes(), Event.syncIndexes(), Registration.syncIndexes()]);
+
+  const collegeId = new mongoose.Types.ObjectId();
+  await College.collection.insertOne({ _id: collegeId, collegeId: 'CLG994', name: 'Cluster Bench College', isActive: true });
+
+  const students = Array.from({ length: STUDENTS }, (_, i) => ({
+    _id: new mongoose.Types.ObjectId(),
+    userId: `CLSTU${i}`,
+    email: `cluster.student${i}@cluster-bench.edu`,
+    role: 'student',
+    collegeId,
+    isActive: true
+  }));
+  await User.collection.insertMany(students);
+  const tokens = students.map((student) => generateToken({ userId: student._id, role: 'student', collegeId }));
+
+  const eventDate = new Date(Date.now() + 7 * 24 * 60 * 60 * 1000);
+  const newEvent = (code) => ({
+    eventId: code,
+    name: `Cluster Bench Event ${code}`,
+    eventType: 'workshop',
+    collegeId,
+    capacity: STUDENTS,
+    date: eventDate,
+    registrationDeadline: new Date(eventDate.getTime() - 24 * 60 * 60 * 1000),
+    status: 'active',
+    isRegistrationOpen: true,
+    totalRegistrations: 0,
+    waitlistTail: 0,
+    waitlistLength: 0
+  });
+  await Event.collection.insertMany(Array.from({ length: EVENTS }, (_, i) => newEvent(`CLEVT${i}_CLG994`)));
+
+  const results = {};
+  try {
+    for (const workers of workerCounts()) {
+      const child = await startCluster(workers);
+      try {
+        const listing = await load(() => ({ path: `/api/events?collegeId=${collegeId}&limit=20` }));
+
+        // A fresh event per run lets every student register again
+        const { insertedId: eventId } = await Event.collection.insertOne(newEvent(`CLREG${workers}_CLG994`));
+        let next = 0;
+        const registration = await load(() => ({
+          method: 'POST',
+          path: '/api/registrations',
+          token: tokens[next++ % STUDENTS],
+          body: { eventId: String(eventId) }
+        }));
+
+        results[`${workers} worker(s)`] = {
+          listingRps: listing.rps,
+          listingFailed: listing.failed,
+          registrationRps: registration.rps,
+          registrationFailed: registration.failed
+        };
+      } finally {
+        await stopCluster(child);
+      }
+    }
+
+    console.table(results);
+    console.log(`${CONCURRENCY} keep-alive clients, ${SECONDS}s per path and worker count`);
+  } finally {
+    await Registration.collection.deleteMany({ collegeId });
+    await Event.collection.deleteMany({ collegeId });
+    await User.collection.deleteMany({ collegeId });
+    await College.collection.deleteMany({ _id: collegeId });
+    await mongoose.connection.close();
+  }
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/cluster.bench.js', 'w') as f:
+    f.write(cluster_bench_js)
+
+print("✅ Created utils/gracefulShutdown.js - Drain connections and flush buffers before exit")
+print("✅ Created cluster.js - One worker per core, crash restarts with backoff, SIGHUP rolling restarts")
+print("✅ Created benchmarks/cluster.bench.js - Requests/sec by worker count for listing and registration")
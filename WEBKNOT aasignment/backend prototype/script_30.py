@@ -0,0 +1,140 @@
+# Create the MongoDB connection pool monitor (utilization, wait queue, checkout latency)
+
+pool_monitor_js = '''const LATENCY_SAMPLES = 1000;
+const SATURATION_WAIT_QUEUE = parseInt(process.env.DB_POOL_SATURATION_WAIT_QUEUE) || 50;
+const SATURATION_WAIT_MS = parseInt(process.env.DB_POOL_SATURATION_WAIT_MS) || 250;
+
+const percentile = (sorted, p) => (sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : 0);
+
+// Follows the driver's connection pool (CMAP) events for every server the
+// client talks to. Checkouts are served in FIFO order per server, so each
+// checkout is matched with the oldest waiting request for that address.
+class PoolMonitor {
+  constructor(options = {}) {
+    this.maxPoolSize = options.maxPoolSize || 100;
+    this.minPoolSize = options.minPoolSize || 0;
+    this.saturationWaitQueue = options.saturationWaitQueue || SATURATION_WAIT_QUEUE;
+    this.saturationWaitMs = options.saturationWaitMs || SATURATION_WAIT_MS;
+    this.client = null;
+    this.servers = new Map();
+    this.latencies = [];
+    this.stats = {
+      checkouts: 0,
+      checkoutFailures: 0,
+      checkoutTimeouts: 0,
+      connectionsCreated: 0,
+      connectionsClosed: 0,
+      poolCleared: 0
+    };
+  }
+
+  server(address) {
+    if (!this.servers.has(address)) {
+      this.servers.set(address, { open: 0, inUse: 0, waiting: [] });
+    }
+    return this.servers.get(address);
+  }
+
+  recordLatency(ms) {
+    if (this.latencies.length >= LATENCY_SAMPLES) this.latencies.shift();
+    this.latencies.push(ms);
+  }
+
+  attach(client, options = {}) {
+    if (!client || client === this.client) return;
+    this.client = client;
+    this.maxPoolSize = options.maxPoolSize || this.maxPoolSize;
+    this.minPoolSize = options.minPoolSize || this.minPoolSize;
+
+    client.on('connectionCreated', ({ address }) => {
+      this.server(address).open++;
+      this.stats.connectionsCreated++;
+    });
+    client.on('connectionClosed', ({ address }) => {
+      const server = this.server(address);
+      server.open = Math.max(0, server.open - 1);
+      this.stats.connectionsClosed++;
+    });
+    client.on('connectionCheckOutStarted', ({ address }) => {
+      this.server(address).waiting.push(Date.now());
+    });
+    client.on('connectionCheckedOut', ({ address }) => {
+      const server = this.server(address);
+      const startedAt = server.waiting.shift();
+      server.inUse++;
+      this.stats.checkouts++;
+      if (startedAt) this.recordLatency(Date.now() - startedAt);
+    });
+    client.on('connectionCheckOutFailed', ({ address, reason }) => {
+      this.server(address).waiting.shift();
+      this.stats.checkoutFailures++;
+      if (reason === 'timeout') this.stats.checkoutTimeouts++;
+    });
+    client.on('connectionCheckedIn', ({ address }) => {
+      const server = this.server(address);
+      server.inUse = Math.max(0, server.inUse - 1);
+    });
+    client.on('connectionPoolCleared', () => {
+      this.stats.poolCleared++;
+    });
+  }
+
+  // A server's pool is saturated when too many requests are queued for a
+  // connection, or the oldest one has been waiting too long
+  isSaturated() {
+    const now = Date.now();
+    for (const server of this.servers.values()) {
+      if (server.waiting.length >= this.saturationWaitQueue) return true;
+      if (server.waiting.length > 0 && now - server.waiting[0] >= this.saturationWaitMs) return true;
+    }
+    return false;
+  }
+
+  getStats() {
+    const now = Date.now();
+    const sorted = [...this.latencies].sort((a, b) => a - b);
+    const total = sorted.reduce((sum, ms) => sum + ms, 0);
+    const servers = [...this.servers.entries()].map(([address, server]) => ({
+      address,
+      open: server.open,
+      inUse: server.inUse,
+      available: Math.max(0, server.open - server.inUse),
+      waitQueue: server.waiting.length,
+      oldestWaitMs: server.waiting.length > 0 ? now - server.waiting[0] : 0,
+      utilization: Number((server.inUse / this.maxPoolSize).toFixed(3))
+    }));
+
+    return {
+      maxPoolSize: this.maxPoolSize,
+      minPoolSize: this.minPoolSize,
+      open: servers.reduce((sum, server) => sum + server.open, 0),
+      inUse: servers.reduce((sum, server) => sum + server.inUse, 0),
+      waitQueue: servers.reduce((sum, server) => sum + server.waitQueue, 0),
+      utilization: servers.reduce((max, server) => Math.max(max, server.utilization), 0),
+      saturated: this.isSaturated(),
+      checkoutLatencyMs: {
+        samples: sorted.length,
+        avg: sorted.length ? Number((total / sorted.length).toFixed(2)) : 0,
+        p50: percentile(sorted, 0.5),
+        p95: percentile(sorted, 0.95),
+        p99: percentile(sorted, 0.99),
+        max: sorted.length ? sorted[sorted.length - 1] : 0
+      },
+      ...this.stats,
+      servers
+    };
+  }
+}
+
+const poolMonitor = new PoolMonitor();
+
+module.exports = {
+  PoolMonitor,
+  poolMonitor
+};
+'''
+
+with open('utils/poolMonitor.js', 'w') as f:
+    f.write(pool_monitor_js)
+
+print("✅ Created utils/poolMonitor.js - Connection pool utilization, wait queue and checkout latency")
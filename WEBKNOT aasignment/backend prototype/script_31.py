@@ -0,0 +1,291 @@
+# Create the structured logger (async ring buffer, sampling, request IDs) and request logging middleware
+
+logger_js = '''const fs = require('fs');
+const path = require('path');
+const { AsyncLocalStorage } = require('async_hooks');
+const LRUCache = require('./lruCache');
+
+const LEVELS = { error: 50, warn: 40, info: 30, debug: 20 };
+
+// "debug=0.1,info=0.5": fraction of records kept per level (default: all)
+const parseSampleRates = (value = '') => {
+  const rates = {};
+  for (const pair of value.split(',')) {
+    const [level, rate] = pair.split('=').map((part) => part.trim());
+    if (LEVELS[level] && !Number.isNaN(parseFloat(rate))) rates[level] = Math.min(1, Math.max(0, parseFloat(rate)));
+  }
+  return rates;
+};
+
+// Per-request context (the request ID) carried across awaits, so records
+// written anywhere while serving a request, including query logs, carry its ID
+const requestContext = new AsyncLocalStorage();
+
+const getRequestId = () => requestContext.getStore()?.requestId;
+
+// Fixed-capacity ring of serialized records. Writes go to the file descriptor
+// from the libuv thread pool in batches, so the event loop never blocks on
+// stdout or disk. When the ring is full the oldest records are dropped and
+// counted rather than letting logging apply backpressure to requests.
+class LogWriter {
+  constructor(options = {}) {
+    this.capacity = options.capacity || 8192;
+    this.flushIntervalMs = options.flushIntervalMs || 100;
+    this.fd = options.file ? LogWriter.openFile(options.file) : 1;
+    this.ring = new Array(this.capacity);
+    this.head = 0;
+    this.size = 0;
+    this.timer = null;
+    this.flushing = null;
+    this.stats = { written: 0, dropped: 0, writes: 0, writeErrors: 0 };
+  }
+
+  static openFile(file) {
+    fs.mkdirSync(path.dirname(file), { recursive: true });
+    // O_APPEND: each batch lands whole even when cluster workers share the file
+    return fs.openSync(file, 'a');
+  }
+
+  push(line) {
+    if (this.size === this.capacity) {
+      this.head = (this.head + 1) % this.capacity;
+      this.size--;
+      this.stats.dropped++;
+    }
+    this.ring[(this.head + this.size) % this.capacity] = line;
+    this.size++;
+
+    if (!this.timer && !this.flushing) {
+      this.timer = setTimeout(() => this.flush(), this.flushIntervalMs);
+      this.timer.unref();
+    }
+  }
+
+  drain() {
+    const lines = [];
+    while (this.size > 0) {
+      lines.push(this.ring[this.head]);
+      this.ring[this.head] = undefined;
+      this.head = (this.head + 1) % this.capacity;
+      this.size--;
+    }
+    return lines;
+  }
+
+  write(buffer) {
+    return new Promise((resolve) => {
+      const writeFrom = (offset) => {
+        fs.write(this.fd, buffer, offset, buffer.length - offset, null, (error, bytes) => {
+          if (error && error.code === 'EAGAIN') return setTimeout(() => writeFrom(offset), 10);
+          if (error) {
+            this.stats.writeErrors++;
+            return resolve();
+          }
+          if (offset + bytes < buffer.length) return writeFrom(offset + bytes);
+          resolve();
+        });
+      };
+      writeFrom(0);
+    });
+  }
+
+  // Write everything buffered, one batch at a time so records stay in order;
+  // resolves once the ring is empty and every batch reached the descriptor
+  flush() {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (!this.flushing) {
+      this.flushing = this.writeAll().finally(() => {
+        this.flushing = null;
+      });
+    }
+    return this.flushing;
+  }
+
+  async writeAll() {
+    while (this.size > 0) {
+      const lines = this.drain();
+      this.stats.writes++;
+      this.stats.written += lines.length;
+      await this.write(Buffer.from(lines.join('')));
+    }
+  }
+
+  // Last-resort synchronous write on process exit
+  flushSync() {
+    const lines = this.drain();
+    if (lines.length === 0) return;
+    this.stats.written += lines.length;
+    try {
+      fs.writeSync(this.fd, lines.join(''));
+    } catch (error) {
+      this.stats.writeErrors++;
+    }
+  }
+}
+
+const serializeError = (error, withStack) => {
+  const serialized = { name: error.name, message: error.message };
+  if (error.code !== undefined) serialized.code = error.code;
+  if (withStack) serialized.stack = error.stack;
+  return serialized;
+};
+
+// Writes one JSON object per line: time, level, pid, msg, requestId and the
+// record's fields. An `err` field is serialized with its stack, but only
+// once per stackIntervalMs for each distinct error (name, message and first
+// frame); repeats in between carry `stackSuppressed: true`.
+class Logger {
+  constructor(options = {}) {
+    this.level = LEVELS[options.level] || LEVELS.info;
+    this.sampleRates = options.sampleRates || {};
+    this.writer = options.writer || new LogWriter(options);
+    this.stackSeen = new LRUCache({ max: 1000, ttl: options.stackIntervalMs || 60 * 1000 });
+    this.stats = { records: 0, sampledOut: 0, stacks: 0, stacksSuppressed: 0 };
+  }
+
+  isLevelEnabled(level) {
+    return LEVELS[level] >= this.level;
+  }
+
+  captureStack(error) {
+    const firstFrame = (error.stack || '').split('\\n')[1] || '';
+    const signature = `${error.name}:${error.message}:${firstFrame.trim()}`;
+    if (this.stackSeen.get(signature)) {
+      this.stats.stacksSuppressed++;
+      return false;
+    }
+    this.stackSeen.set(signature, true);
+    this.stats.stacks++;
+    return true;
+  }
+
+  log(level, msg, fields = {}) {
+    if (!this.isLevelEnabled(level)) return;
+    const rate = this.sampleRates[level];
+    if (rate !== undefined && Math.random() >= rate) {
+      this.stats.sampledOut++;
+      return;
+    }
+
+    const { err, ...rest } = fields;
+    const record = {
+      time: new Date().toISOString(),
+      level,
+      pid: process.pid,
+      msg,
+      requestId: getRequestId(),
+      ...rest
+    };
+    if (err instanceof Error) {
+      const withStack = this.captureStack(err);
+      record.err = serializeError(err, withStack);
+      if (!withStack) record.stackSuppressed = true;
+    } else if (err !== undefined) {
+      record.err = err;
+    }
+
+    let line;
+    try {
+      line = JSON.stringify(record);
+    } catch (error) {
+      line = JSON.stringify({ time: record.time, level, pid: record.pid, msg, requestId: record.requestId, unserializable: true });
+    }
+    this.stats.records++;
+    this.writer.push(`${line}\\n`);
+  }
+
+  error(msg, fields) { this.log('error', msg, fields); }
+
+  warn(msg, fields) { this.log('warn', msg, fields); }
+
+  info(msg, fields) { this.log('info', msg, fields); }
+
+  debug(msg, fields) { this.log('debug', msg, fields); }
+
+  flush() {
+    return this.writer.flush();
+  }
+
+  getStats() {
+    return { ...this.stats, ...this.writer.stats, buffered: this.writer.size };
+  }
+}
+
+const logger = new Logger({
+  level: process.env.LOG_LEVEL || 'info',
+  file: process.env.LOG_FILE,
+  sampleRates: parseSampleRates(process.env.LOG_SAMPLE_RATES),
+  capacity: parseInt(process.env.LOG_BUFFER_SIZE) || 8192,
+  flushIntervalMs: parseInt(process.env.LOG_FLUSH_MS) || 100,
+  stackIntervalMs: parseInt(process.env.LOG_STACK_INTERVAL_MS) || 60 * 1000
+});
+
+// Whatever is still buffered when the process exits is written synchronously
+process.on('exit', () => logger.writer.flushSync());
+
+module.exports = {
+  LEVELS,
+  Logger,
+  LogWriter,
+  logger,
+  requestContext,
+  getRequestId,
+  parseSampleRates
+};
+'''
+
+with open('utils/logger.js', 'w') as f:
+    f.write(logger_js)
+
+# Request logging middleware
+request_logger_js = '''const crypto = require('crypto');
+const { logger, requestContext } = require('../utils/logger');
+
+// Accept an upstream request ID (load balancer, gateway) if it looks sane
+const REQUEST_ID_PATTERN = /^[A-Za-z0-9._-]{1,128}$/;
+
+// Assign a request ID, echo it as X-Request-Id, run the rest of the chain in
+// its logging context and write one access record when the response finishes
+const requestLogger = (req, res, next) => {
+  const incoming = req.get('X-Request-Id');
+  const requestId = incoming && REQUEST_ID_PATTERN.test(incoming) ? incoming : crypto.randomUUID();
+  const startedAt = process.hrtime.bigint();
+
+  req.id = requestId;
+  res.setHeader('X-Request-Id', requestId);
+
+  // Database time spent on this request, filled in by the query profiler
+  const context = { requestId, db: { queries: 0, ms: 0 } };
+
+  res.on('finish', () => {
+    const durationMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+    logger.log(res.statusCode >= 500 ? 'error' : 'info', 'request completed', {
+      requestId,
+      method: req.method,
+      url: req.originalUrl,
+      status: res.statusCode,
+      durationMs: Number(durationMs.toFixed(2)),
+      dbQueries: context.db.queries,
+      dbMs: Number(context.db.ms.toFixed(2)),
+      contentLength: res.getHeader('Content-Length'),
+      userId: req.user ? String(req.user._id) : undefined,
+      ip: req.ip
+    });
+  });
+
+  requestContext.run(context, next);
+};
+
+module.exports = {
+  requestLogger
+};
+'''
+
+with open('middleware/requestLogger.js', 'w') as f:
+    f.write(request_logger_js)
+
+print("✅ Created utils/logger.js - Structured JSON logging through an async ring buffer")
+print("✅ Created middleware/requestLogger.js - Request IDs and access records")
@@ -0,0 +1,375 @@
+# Create latency histograms, runtime metrics and the Prometheus text exposition
+
+metrics_js = '''const { monitorEventLoopDelay, PerformanceObserver, constants } = require('perf_hooks');
+
+// Log-linear (HDR-style) buckets over integer microseconds: exact below 32us,
+// then 16 buckets per power of two, so any value lands in a bucket within
+// about 6% of it. Recording is a few integer operations and one array
+// increment; percentiles are read from the bucket counts at scrape time.
+const SUB_BUCKET_BITS = 5;
+const SUB_BUCKETS = 1 << SUB_BUCKET_BITS;
+const HALF_SUB_BUCKETS = SUB_BUCKETS >> 1;
+const MAX_VALUE = 0x7fffffff;
+const BUCKET_COUNT = (32 - SUB_BUCKET_BITS + 1) * HALF_SUB_BUCKETS;
+
+const bucketIndex = (value) => {
+  if (value < SUB_BUCKETS) return value;
+  const shift = 31 - Math.clz32(value) - (SUB_BUCKET_BITS - 1);
+  return shift * HALF_SUB_BUCKETS + (value >>> shift);
+};
+
+// Largest value that falls into bucket `index`
+const bucketUpperBound = (index) => {
+  if (index < SUB_BUCKETS) return index;
+  const shift = Math.floor(index / HALF_SUB_BUCKETS) - 1;
+  return (index - shift * HALF_SUB_BUCKETS + 1) * 2 ** shift - 1;
+};
+
+class Histogram {
+  constructor() {
+    this.counts = new Uint32Array(BUCKET_COUNT);
+    this.count = 0;
+    this.sum = 0;
+    this.max = 0;
+  }
+
+  record(micros) {
+    const value = micros >= MAX_VALUE ? MAX_VALUE : micros > 0 ? Math.round(micros) : 0;
+    this.counts[bucketIndex(value)]++;
+    this.count++;
+    this.sum += value;
+    if (value > this.max) this.max = value;
+  }
+
+  // Value (us) at or below which fraction p of the recorded values fall
+  percentile(p) {
+    if (this.count === 0) return 0;
+    const rank = Math.max(1, Math.ceil(this.count * p));
+    let seen = 0;
+    for (let i = 0; i < BUCKET_COUNT; i++) {
+      seen += this.counts[i];
+      if (seen >= rank) return Math.min(bucketUpperBound(i), this.max);
+    }
+    return this.max;
+  }
+
+  // Cumulative counts at each bound (us), for Prometheus `le` buckets
+  cumulative(bounds) {
+    const result = new Array(bounds.length).fill(0);
+    let seen = 0;
+    let b = 0;
+    for (let i = 0; i < BUCKET_COUNT && b < bounds.length; i++) {
+      while (b < bounds.length && bucketUpperBound(i) > bounds[b]) result[b++] = seen;
+      seen += this.counts[i];
+    }
+    while (b < bounds.length) result[b++] = seen;
+    return result;
+  }
+}
+
+// Exposed `le` bounds in seconds; the HDR buckets underneath keep the detail
+const LATENCY_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+const LATENCY_BUCKETS_US = LATENCY_BUCKETS.map((seconds) => seconds * 1e6);
+const QUANTILES = [0.5, 0.9, 0.99, 0.999];
+
+const requestSeries = new Map();
+const gcSeries = new Map();
+const collectors = [];
+let inFlight = 0;
+let eventLoopDelay = null;
+let gcObserver = null;
+
+const requestStarted = () => {
+  inFlight++;
+};
+
+// One histogram per (method, route pattern, status class)
+const requestFinished = (method, route, status, micros) => {
+  inFlight--;
+  const statusClass = `${(status / 100) | 0}xx`;
+  const key = `${method} ${route} ${statusClass}`;
+  let series = requestSeries.get(key);
+  if (!series) {
+    series = { labels: { method, route, status_class: statusClass }, histogram: new Histogram() };
+    requestSeries.set(key, series);
+  }
+  series.histogram.record(micros);
+};
+
+// Stats objects (caches, pools, buffers) exported on every scrape
+const registerCollector = (name, collect) => {
+  collectors.push({ name, collect });
+};
+
+const GC_KINDS = {
+  [constants.NODE_PERFORMANCE_GC_MAJOR]: 'major',
+  [constants.NODE_PERFORMANCE_GC_MINOR]: 'minor',
+  [constants.NODE_PERFORMANCE_GC_INCREMENTAL]: 'incremental',
+  [constants.NODE_PERFORMANCE_GC_WEAKCB]: 'weakcb'
+};
+
+// Event-loop delay sampling and GC pause observation (once per process)
+const startRuntimeMetrics = () => {
+  if (eventLoopDelay) return;
+  eventLoopDelay = monitorEventLoopDelay({ resolution: 10 });
+  eventLoopDelay.enable();
+
+  gcObserver = new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      const kind = GC_KINDS[entry.detail ? entry.detail.kind : entry.kind] || 'other';
+      if (!gcSeries.has(kind)) gcSeries.set(kind, new Histogram());
+      gcSeries.get(kind).record(entry.duration * 1000);
+    }
+  });
+  gcObserver.observe({ entryTypes: ['gc'] });
+};
+
+const escapeLabel = (value) => String(value).replace(/[\\\\"\\n]/g, (char) => (char === '\\n' ? '\\\\n' : `\\\\${char}`));
+
+const formatLabels = (labels) => {
+  const pairs = Object.entries(labels).map(([name, value]) => `${name}="${escapeLabel(value)}"`);
+  return pairs.length ? `{${pairs.join(',')}}` : '';
+};
+
+const seconds = (micros) => micros / 1e6;
+
+const snakeCase = (name) => name.replace(/([a-z0-9])([A-Z])/g, '$1_$2').replace(/[^a-zA-Z0-9_]/g, '_').toLowerCase();
+
+// Histogram plus quantile summary for each series of one metric
+const renderHistograms = (lines, name, help, series) => {
+  lines.push(`# HELP ${name}_seconds ${help}`, `# TYPE ${name}_seconds histogram`);
+  for (const { labels, histogram } of series) {
+    const counts = histogram.cumulative(LATENCY_BUCKETS_US);
+    LATENCY_BUCKETS.forEach((bound, i) => {
+      lines.push(`${name}_seconds_bucket${formatLabels({ ...labels, le: bound })} ${counts[i]}`);
+    });
+    lines.push(`${name}_seconds_bucket${formatLabels({ ...labels, le: '+Inf' })} ${histogram.count}`);
+    lines.push(`${name}_seconds_sum${formatLabels(labels)} ${seconds(histogram.sum)}`);
+    lines.push(`${name}_seconds_count${formatLabels(labels)} ${histogram.count}`);
+  }
+
+  lines.push(`# HELP ${name}_quantile_seconds ${help} (quantiles since start)`, `# TYPE ${name}_quantile_seconds gauge`);
+  for (const { labels, histogram } of series) {
+    for (const quantile of QUANTILES) {
+      lines.push(`${name}_quantile_seconds${formatLabels({ ...labels, quantile })} ${seconds(histogram.percentile(quantile))}`);
+    }
+  }
+};
+
+// Numeric fields (and one level of nested numeric fields) of a stats object
+const renderCollector = (lines, { name, collect }) => {
+  let stats;
+  try {
+    stats = collect();
+  } catch (error) {
+    return;
+  }
+
+  const emit = (field, value) => {
+    const metric = `campus_${snakeCase(name)}_${snakeCase(field)}`;
+    lines.push(`# TYPE ${metric} untyped`, `${metric} ${typeof value === 'boolean' ? Number(value) : value}`);
+  };
+
+  for (const [field, value] of Object.entries(stats || {})) {
+    if (typeof value === 'number' || typeof value === 'boolean') {
+      emit(field, value);
+    } else if (value && typeof value === 'object' && !Array.isArray(value) && !(value instanceof Date)) {
+      for (const [nested, nestedValue] of Object.entries(value)) {
+        if (typeof nestedValue === 'number') emit(`${field}_${nested}`, nestedValue);
+      }
+    }
+  }
+};
+
+// Prometheus text exposition format (version 0.0.4)
+const renderMetrics = () => {
+  const lines = [];
+
+  lines.push('# HELP http_requests_in_flight Requests currently being served', '# TYPE http_requests_in_flight gauge');
+  lines.push(`http_requests_in_flight ${inFlight}`);
+  renderHistograms(lines, 'http_request_duration', 'HTTP request latency by route and status class', [...requestSeries.values()]);
+
+  if (eventLoopDelay) {
+    // Event-loop delay since the previous scrape
+    for (const [suffix, value] of [
+      ['p50', eventLoopDelay.percentile(50)],
+      ['p99', eventLoopDelay.percentile(99)],
+      ['max', eventLoopDelay.max]
+    ]) {
+      lines.push(`# TYPE nodejs_eventloop_lag_${suffix}_seconds gauge`, `nodejs_eventloop_lag_${suffix}_seconds ${value / 1e9}`);
+    }
+    eventLoopDelay.reset();
+
+    const gc = [...gcSeries.entries()].map(([kind, histogram]) => ({ labels: { kind }, histogram }));
+    renderHistograms(lines, 'nodejs_gc_duration', 'Garbage collection pauses by kind', gc);
+  }
+
+  const memory = process.memoryUsage();
+  lines.push('# TYPE process_resident_memory_bytes gauge', `process_resident_memory_bytes ${memory.rss}`);
+  lines.push('# TYPE nodejs_heap_used_bytes gauge', `nodejs_heap_used_bytes ${memory.heapUsed}`);
+  lines.push('# TYPE nodejs_heap_total_bytes gauge', `nodejs_heap_total_bytes ${memory.heapTotal}`);
+
+  for (const collector of collectors) renderCollector(lines, collector);
+
+  return `${lines.join('\\n')}\\n`;
+};
+
+module.exports = {
+  Histogram,
+  bucketIndex,
+  bucketUpperBound,
+  requestStarted,
+  requestFinished,
+  registerCollector,
+  startRuntimeMetrics,
+  renderMetrics
+};
+'''
+
+with open('utils/metrics.js', 'w') as f:
+    f.write(metrics_js)
+
+# Request metrics middleware
+request_metrics_js = '''const { performance } = require('perf_hooks');
+const { requestStarted, requestFinished, renderMetrics } = require('../utils/metrics');
+
+// Route pattern for a request, e.g. "/api/events/:id". Routers are mounted
+// behind captureRouteBase so the prefix is still known after an error has
+// been passed up to the app-level error handler (which resets req.baseUrl).
+const routeLabel = (req) => {
+  if (!req.route) return 'unmatched';
+  const base = req.routeBase !== undefined ? req.routeBase : req.baseUrl;
+  return req.route.path === '/' && base ? base : `${base}${req.route.path}`;
+};
+
+const captureRouteBase = (req, res, next) => {
+  req.routeBase = req.baseUrl;
+  next();
+};
+
+// Times every request from arrival until the response is finished or the
+// connection closes, and tracks how many are in flight
+const recordRequestMetrics = (req, res, next) => {
+  const startedAt = performance.now();
+  requestStarted();
+  res.once('close', () => {
+    requestFinished(req.method, routeLabel(req), res.statusCode, (performance.now() - startedAt) * 1000);
+  });
+  next();
+};
+
+const metricsEndpoint = (req, res) => {
+  res.setHeader('Content-Type', 'text/plain; version=0.0.4; charset=utf-8');
+  res.setHeader('Cache-Control', 'no-store');
+  res.status(200).send(renderMetrics());
+};
+
+module.exports = {
+  routeLabel,
+  captureRouteBase,
+  recordRequestMetrics,
+  metricsEndpoint
+};
+'''
+
+with open('middleware/requestMetrics.js', 'w') as f:
+    f.write(request_metrics_js)
+
+# Recording overhead benchmark
+metrics_bench_js = '''const { EventEmitter } = require('events');
+const { Histogram, bucketIndex, bucketUpperBound, registerCollector, renderMetrics } = require('../utils/metrics');
+const { recordRequestMetrics } = require('../middleware/requestMetrics');
+
+const REQUESTS = parseInt(process.env.BENCH_REQUESTS) || 1000000;
+const ROUNDS = 5;
+const BUDGET_NS = 1000;
+
+const median = (values) => [...values].sort((a, b) => a - b)[Math.floor(values.length / 2)];
+
+const timeNs = (fn) => {
+  const start = process.hrtime.bigint();
+  fn();
+  return Number(process.hrtime.bigint() - start);
+};
+
+// The same fake request/response pair for every iteration: only the work the
+// middleware adds is compared, not allocation of Express objects
+const ROUTES = ['/:id', '/', '/student/:studentId', '/events/popularity'];
+const makeRequests = () => Array.from({ length: 64 }, (_, i) => ({
+  req: { method: i % 3 ? 'GET' : 'POST', baseUrl: '/api/events', route: { path: ROUTES[i % ROUTES.length] } },
+  res: Object.assign(new EventEmitter(), { statusCode: i % 10 ? 200 : 404 })
+}));
+
+const runBaseline = (pairs) => {
+  const next = () => {};
+  for (let i = 0; i < REQUESTS; i++) {
+    const { res } = pairs[i & 63];
+    next();
+    res.emit('close');
+  }
+};
+
+const runInstrumented = (pairs) => {
+  const next = () => {};
+  for (let i = 0; i < REQUESTS; i++) {
+    const { req, res } = pairs[i & 63];
+    recordRequestMetrics(req, res, next);
+    res.emit('close');
+  }
+};
+
+const checkBuckets = () => {
+  for (let value = 0; value < 5000000; value += 1 + (value >> 6)) {
+    const upper = bucketUpperBound(bucketIndex(value));
+    if (upper < value || (value >= 32 && upper > value * 1.07)) {
+      throw new Error(`Bucket bound ${upper} is off for ${value}`);
+    }
+  }
+};
+
+const run = () => {
+  checkBuckets();
+
+  const histogram = new Histogram();
+  const values = Float64Array.from({ length: 1 << 16 }, () => Math.random() * 200000);
+  const recordNs = median(Array.from({ length: ROUNDS }, () => timeNs(() => {
+    for (let i = 0; i < REQUESTS; i++) histogram.record(values[i & 0xffff]);
+  }))) / REQUESTS;
+
+  // Warm both paths before measuring
+  const pairs = makeRequests();
+  runBaseline(pairs);
+  runInstrumented(pairs);
+
+  const baselineNs = median(Array.from({ length: ROUNDS }, () => timeNs(() => runBaseline(pairs)))) / REQUESTS;
+  const instrumentedNs = median(Array.from({ length: ROUNDS }, () => timeNs(() => runInstrumented(pairs)))) / REQUESTS;
+  const overheadNs = Math.max(0, instrumentedNs - baselineNs);
+
+  registerCollector('bench', () => ({ hits: 1, misses: 2, nested: { value: 3 } }));
+  const renderMs = median(Array.from({ length: ROUNDS }, () => timeNs(renderMetrics))) / 1e6;
+
+  console.table([
+    { measurement: 'Histogram.record', nsPerOp: recordNs.toFixed(1) },
+    { measurement: 'request baseline (next + close)', nsPerOp: baselineNs.toFixed(1) },
+    { measurement: 'request with recordRequestMetrics', nsPerOp: instrumentedNs.toFixed(1) },
+    { measurement: 'added per request', nsPerOp: overheadNs.toFixed(1) },
+    { measurement: '/metrics render (ms)', nsPerOp: renderMs.toFixed(3) }
+  ]);
+  console.log(`p50/p99 of recorded values: ${histogram.percentile(0.5)}us / ${histogram.percentile(0.99)}us`);
+
+  if (overheadNs > BUDGET_NS) {
+    console.error(`❌ Recording overhead ${overheadNs.toFixed(1)}ns exceeds the ${BUDGET_NS}ns budget`);
+    process.exit(1);
+  }
+  console.log(`✅ Recording overhead within the ${BUDGET_NS}ns budget`);
+};
+
+run();
+'''
+
+with open('benchmarks/metrics.bench.js', 'w') as f:
+    f.write(metrics_bench_js)
+
+print("✅ Created utils/metrics.js - HDR-style latency histograms, event-loop lag, GC pauses and stat collectors")
+print("✅ Created middleware/requestMetrics.js - Per-route request timing and the /metrics endpoint")
+print("✅ Created benchmarks/metrics.bench.js - Per-request recording overhead against a 1us budget")
@@ -0,0 +1,386 @@
+# Create the Mongoose query profiler (query, aggregate and hook timing) and its debug endpoint
+
+query_profiler_js = '''const mongoose = require('mongoose');
+const { performance } = require('perf_hooks');
+const { logger, requestContext } = require('./logger');
+
+const ENABLED = process.env.QUERY_PROFILER !== 'off';
+const SLOW_MS = parseInt(process.env.QUERY_PROFILER_SLOW_MS) || 100;
+const SLOW_LOG_SIZE = parseInt(process.env.QUERY_PROFILER_SLOW_LOG_SIZE) || 100;
+const MAX_SHAPES = parseInt(process.env.QUERY_PROFILER_MAX_SHAPES) || 500;
+// A slow shape is explained at most once per interval
+const EXPLAIN_INTERVAL_MS = 60 * 1000;
+
+const QUERY_OPS = [
+  'countDocuments', 'estimatedDocumentCount', 'distinct', 'find', 'findOne',
+  'findOneAndDelete', 'findOneAndReplace', 'findOneAndUpdate',
+  'deleteOne', 'deleteMany', 'replaceOne', 'updateOne', 'updateMany'
+];
+// Document and query middleware whose individual hooks are timed
+const HOOKED_OPS = new Set(['save', 'validate', 'deleteOne', ...QUERY_OPS]);
+// Hook timing depends on how Mongoose calls middleware (when `next` is
+// passed, how promises are awaited); it is only enabled on the major version
+// it was written against, and queries are profiled either way
+const HOOKS_SUPPORTED = /^7\\./.test(mongoose.version);
+
+const shapes = new Map();
+const hooks = new Map();
+const slowLog = [];
+const startedAt = new WeakMap();
+let since = new Date();
+
+// Query shape: field names and operators kept, values replaced with '?'
+const shapeOf = (value) => {
+  if (Array.isArray(value)) {
+    return value.length && value.every((item) => item && item.constructor === Object) ? value.map(shapeOf) : '?';
+  }
+  if (value && value.constructor === Object) {
+    const shape = {};
+    for (const key of Object.keys(value)) shape[key] = shapeOf(value[key]);
+    return shape;
+  }
+  return '?';
+};
+
+const pipelineShape = (pipeline) => pipeline.map((stage) => {
+  const [name] = Object.keys(stage);
+  if (name === '$match') return { $match: shapeOf(stage.$match) };
+  if (name === '$lookup') return { $lookup: stage.$lookup.from };
+  return name;
+});
+
+// Winning plan as a chain of stages, e.g. "FETCH <- IXSCAN(eventId_1_registrationStatus_1)"
+const planSummary = (explain) => {
+  const planner = explain.queryPlanner
+    || (explain.stages && explain.stages[0].$cursor && explain.stages[0].$cursor.queryPlanner);
+  if (!planner) return 'unavailable';
+
+  const parts = [];
+  let stage = planner.winningPlan.queryPlan || planner.winningPlan;
+  while (stage) {
+    parts.push(stage.indexName ? `${stage.stage}(${stage.indexName})` : stage.stage);
+    stage = stage.inputStage || (stage.inputStages && stage.inputStages[0]);
+  }
+  return parts.join(' <- ');
+};
+
+// Explain through the driver so the explain itself is neither profiled nor executed
+const explainPlan = async (sample) => {
+  const { collection } = mongoose.model(sample.model);
+  const explain = sample.pipeline
+    ? await collection.aggregate(sample.pipeline).explain('queryPlanner')
+    : await collection.find(sample.filter || {}, { sort: sample.sort }).explain('queryPlanner');
+  return planSummary(explain);
+};
+
+const entryFor = (key, model, op, shape) => {
+  let entry = shapes.get(key);
+  if (!entry) {
+    // Past MAX_SHAPES, new shapes are folded into one overflow entry
+    if (shapes.size >= MAX_SHAPES) return entryFor('(other)', '*', '*', '(other shapes)');
+    entry = { model, op, shape, calls: 0, totalMs: 0, maxMs: 0, slow: 0, plan: null, explainedAt: 0 };
+    shapes.set(key, entry);
+  }
+  return entry;
+};
+
+// Attribute one query's time to its shape, the current request and, when
+// it ran inside a model hook, to that hook
+const recordQuery = (sample, durationMs, error) => {
+  const context = requestContext.getStore();
+  const entry = entryFor(`${sample.model}.${sample.op} ${sample.shape}`, sample.model, sample.op, sample.shape);
+  entry.calls++;
+  entry.totalMs += durationMs;
+  if (durationMs > entry.maxMs) entry.maxMs = durationMs;
+
+  if (context && context.db) {
+    context.db.queries++;
+    context.db.ms += durationMs;
+  }
+
+  if (durationMs < SLOW_MS) return;
+  entry.slow++;
+
+  const slow = {
+    time: new Date().toISOString(),
+    requestId: context && context.requestId,
+    hook: context && context.hook,
+    model: sample.model,
+    op: sample.op,
+    shape: sample.shape,
+    durationMs: Number(durationMs.toFixed(2)),
+    error: error ? error.message : undefined,
+    plan: entry.plan
+  };
+  slowLog.push(slow);
+  if (slowLog.length > SLOW_LOG_SIZE) slowLog.shift();
+  logger.warn('Slow query', slow);
+
+  if (Date.now() - entry.explainedAt >= EXPLAIN_INTERVAL_MS) {
+    entry.explainedAt = Date.now();
+    explainPlan(sample)
+      .then((plan) => {
+        entry.plan = plan;
+        slow.plan = plan;
+      })
+      .catch((explainError) => logger.debug('Could not explain slow query', { shape: sample.shape, err: explainError }));
+  }
+};
+
+const querySample = (query) => {
+  const options = query.getOptions();
+  return {
+    model: query.model.modelName,
+    op: query.op,
+    filter: query.getFilter(),
+    sort: options.sort,
+    shape: JSON.stringify({ filter: shapeOf(query.getFilter()), sort: options.sort ? shapeOf(options.sort) : undefined })
+  };
+};
+
+const aggregateSample = (aggregate) => ({
+  model: aggregate.model().modelName,
+  op: 'aggregate',
+  pipeline: aggregate.pipeline(),
+  shape: JSON.stringify(pipelineShape(aggregate.pipeline()))
+});
+
+function startTimer() {
+  startedAt.set(this, performance.now());
+}
+
+const stopTimer = (sampleOf) => function(result) {
+  const start = startedAt.get(this);
+  if (start !== undefined) recordQuery(sampleOf(this), performance.now() - start);
+};
+
+const stopTimerOnError = (sampleOf) => function(error, result, next) {
+  const start = startedAt.get(this);
+  if (start !== undefined) recordQuery(sampleOf(this), performance.now() - start, error);
+  next(error);
+};
+
+const recordHook = (label, durationMs, error) => {
+  let entry = hooks.get(label);
+  if (!entry) {
+    entry = { hook: label, calls: 0, totalMs: 0, maxMs: 0, errors: 0 };
+    hooks.set(label, entry);
+  }
+  entry.calls++;
+  entry.totalMs += durationMs;
+  if (durationMs > entry.maxMs) entry.maxMs = durationMs;
+  if (error) entry.errors++;
+};
+
+// Wrap one hook so its duration is recorded and queries it runs are tagged
+// with it. The wrapper keeps the hook's arity, which Mongoose uses to decide
+// whether to pass a `next` callback. Mongoose passes `next` first to pre
+// hooks (before any options) and last to post hooks, so that is the callback
+// wrapped, whatever the hook declares; the hook finishes when it calls
+// `next`, its promise settles or, when it cannot reach `next` and returns no
+// promise, when it returns. `next` resumes in the caller's
+// context, so later hooks and the operation itself are not attributed to
+// this hook.
+const timeHook = (fn, kind, op, index) => {
+  const wrapped = function(...args) {
+    const modelName = (this.constructor && this.constructor.modelName) || (this.model && this.model.modelName) || 'unknown';
+    const label = `${modelName} ${kind} ${op}[${index}]${fn.name ? ` ${fn.name}` : ''}`;
+    const outer = requestContext.getStore();
+    const resume = (callback) => (outer ? requestContext.run(outer, callback) : requestContext.exit(callback));
+    const start = performance.now();
+    let finished = false;
+    const finish = (error) => {
+      if (finished) return;
+      finished = true;
+      recordHook(label, performance.now() - start, error);
+    };
+
+    const nextIndex = kind === 'pre' ? 0 : args.length - 1;
+    const callbackIndex = typeof args[nextIndex] === 'function' ? nextIndex : -1;
+    if (callbackIndex >= 0) {
+      const callback = args[callbackIndex];
+      args[callbackIndex] = function(...callbackArgs) {
+        finish(callbackArgs[0]);
+        return resume(() => callback.apply(this, callbackArgs));
+      };
+    }
+
+    const context = { ...outer, hook: label };
+    const result = requestContext.run(context, () => fn.apply(this, args));
+    if (result && typeof result.then === 'function') {
+      result.then(() => finish(), finish);
+    } else if (callbackIndex < 0 || fn.length <= callbackIndex) {
+      finish();
+    }
+    return result;
+  };
+  Object.defineProperty(wrapped, 'length', { value: fn.length });
+  return wrapped;
+};
+
+// Time the hooks a model file declares on `schema` from here on: the
+// schema's own pre()/post() wrap each document or query hook before
+// registering it. compileModel() removes them again, so hooks Mongoose adds
+// itself while compiling the model are never wrapped.
+const profileHooks = (schema) => {
+  if (!ENABLED || !HOOKS_SUPPORTED) return schema;
+
+  for (const kind of ['pre', 'post']) {
+    let declared = 0;
+    schema[kind] = function(ops, ...rest) {
+      const names = Array.isArray(ops) ? ops : [ops];
+      const fnIndex = rest.findIndex((arg) => typeof arg === 'function');
+      if (fnIndex >= 0 && names.every((name) => HOOKED_OPS.has(name))) {
+        rest[fnIndex] = timeHook(rest[fnIndex], kind, names.join(','), declared++);
+      }
+      return mongoose.Schema.prototype[kind].call(this, ops, ...rest);
+    };
+  }
+  return schema;
+};
+
+// mongoose.model() for a schema passed to profileHooks()
+const compileModel = (name, schema) => {
+  delete schema.pre;
+  delete schema.post;
+  return mongoose.model(name, schema);
+};
+
+// Global plugin, applied as each model is compiled. Its hooks are added after
+// the model's own, so a query's timer starts after the model's pre hooks and
+// stops after its post hooks (which are also timed individually).
+const queryProfilerPlugin = (schema) => {
+  schema.pre(QUERY_OPS, startTimer);
+  schema.post(QUERY_OPS, stopTimer(querySample));
+  schema.post(QUERY_OPS, stopTimerOnError(querySample));
+  schema.pre('aggregate', startTimer);
+  schema.post('aggregate', stopTimer(aggregateSample));
+  schema.post('aggregate', stopTimerOnError(aggregateSample));
+};
+
+// Must run before any model is compiled (models/index.js calls it first)
+const installQueryProfiler = () => {
+  if (!ENABLED || installQueryProfiler.installed) return;
+  installQueryProfiler.installed = true;
+  mongoose.plugin(queryProfilerPlugin);
+};
+
+const round = (ms) => Number(ms.toFixed(2));
+
+const getQueryProfile = ({ limit = 20 } = {}) => {
+  const byTotal = (a, b) => b.totalMs - a.totalMs;
+  return {
+    enabled: ENABLED,
+    since: since.toISOString(),
+    slowThresholdMs: SLOW_MS,
+    queries: [...shapes.values()].sort(byTotal).slice(0, limit).map((entry) => ({
+      model: entry.model,
+      op: entry.op,
+      shape: entry.shape,
+      calls: entry.calls,
+      totalMs: round(entry.totalMs),
+      avgMs: round(entry.totalMs / entry.calls),
+      maxMs: round(entry.maxMs),
+      slow: entry.slow,
+      plan: entry.plan
+    })),
+    hooks: [...hooks.values()].sort(byTotal).slice(0, limit).map((entry) => ({
+      ...entry,
+      totalMs: round(entry.totalMs),
+      avgMs: round(entry.totalMs / entry.calls),
+      maxMs: round(entry.maxMs)
+    })),
+    slowQueries: slowLog.slice(-limit).reverse()
+  };
+};
+
+const resetQueryProfile = () => {
+  shapes.clear();
+  hooks.clear();
+  slowLog.length = 0;
+  since = new Date();
+};
+
+module.exports = {
+  installQueryProfiler,
+  queryProfilerPlugin,
+  profileHooks,
+  compileModel,
+  getQueryProfile,
+  resetQueryProfile,
+  shapeOf,
+  planSummary
+};
+'''
+
+with open('utils/queryProfiler.js', 'w') as f:
+    f.write(query_profiler_js)
+
+# Debug controller
+debug_controller_js = '''const { AppError, asyncHandler } = require('../middleware/errorHandler');
+const { getQueryProfile, resetQueryProfile } = require('../utils/queryProfiler');
+
+// The profile covers every college served by this process, so only super
+// admins may read it
+const requireSuperAdmin = (req) => {
+  if (req.user.adminLevel !== 'super_admin') {
+    throw new AppError('Only super admins can view the query profile', 403, 'FORBIDDEN');
+  }
+};
+
+// @desc    Top query shapes and model hooks by total time, and recent slow queries
+// @route   GET /api/debug/queries
+// @access  Private (Super Admin)
+const queryProfile = asyncHandler(async (req, res) => {
+  requireSuperAdmin(req);
+  const limit = Math.min(200, Math.max(1, parseInt(req.query.limit) || 20));
+
+  res.status(200).json({
+    success: true,
+    message: 'Query profile retrieved successfully',
+    data: { pid: process.pid, ...getQueryProfile({ limit }) }
+  });
+});
+
+// @desc    Clear the query profile of this process
+// @route   DELETE /api/debug/queries
+// @access  Private (Super Admin)
+const clearQueryProfile = asyncHandler(async (req, res) => {
+  requireSuperAdmin(req);
+  resetQueryProfile();
+
+  res.status(200).json({
+    success: true,
+    message: 'Query profile cleared'
+  });
+});
+
+module.exports = {
+  queryProfile,
+  clearQueryProfile
+};
+'''
+
+with open('controllers/debugController.js', 'w') as f:
+    f.write(debug_controller_js)
+
+# Debug routes
+debug_routes_js = '''const express = require('express');
+const { authenticate, authorize } = require('../middleware/auth');
+const { queryProfile, clearQueryProfile } = require('../controllers/debugController');
+
+const router = express.Router();
+
+router.use(authenticate, authorize('admin'));
+
+router.get('/queries', queryProfile);
+router.delete('/queries', clearQueryProfile);
+
+module.exports = router;
+'''
+
+with open('routes/debug.js', 'w') as f:
+    f.write(debug_routes_js)
+
+print("✅ Created utils/queryProfiler.js - Global plugin timing queries, aggregates and model hooks per request")
+print("✅ Created controllers/debugController.js & routes/debug.js - Top query shapes, hook timings and slow queries")
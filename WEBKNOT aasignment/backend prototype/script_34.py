@@ -0,0 +1,657 @@
+# Create the synthetic dataset seeder (npm run seed)
+
+seed_database_js = '''const mongoose = require('mongoose');
+const bcrypt = require('bcryptjs');
+require('dotenv').config();
+
+const {
+  College,
+  User,
+  Event,
+  Registration,
+  Attendance,
+  Feedback,
+  Counter,
+  StudentRollup,
+  CollegeTypeRollup
+} = require('../models');
+const { idAllocator, formatId } = require('./idAllocator');
+const { BCRYPT_SALT_ROUNDS } = require('./passwordPool');
+const { ratingSnapshot, ratingDeltas } = require('./feedbackStats');
+const { feedbackStatsFrom } = require('./rebuildRollups');
+const { typeRollupKey } = require('./rollups');
+const { bumpAllVersions } = require('./contentVersions');
+
+const DAY = 24 * 60 * 60 * 1000;
+const SEMESTER_DAYS = 120;
+
+// README scale target; SEED_SCALE multiplies the number of students (and
+// with it colleges, events and everything students create)
+const BASE_SCALE = { colleges: 50, studentsPerCollege: 500, eventsPerSemester: 20 };
+const MAX_COLLEGES = 999; // collegeId is CLG + three digits
+
+const SEED = parseInt(process.env.SEED) || 1;
+const SEED_SCALE = parseFloat(process.env.SEED_SCALE) || 1;
+const SEED_SEMESTERS = parseInt(process.env.SEED_SEMESTERS) || 2;
+const REGISTRATIONS_PER_SEMESTER = parseFloat(process.env.SEED_REGISTRATIONS_PER_STUDENT) || 6;
+const BATCH_SIZE = parseInt(process.env.SEED_BATCH_SIZE) || 5000;
+const CONCURRENCY = parseInt(process.env.SEED_CONCURRENCY) || 8;
+const SEED_PASSWORD = process.env.SEED_PASSWORD || 'password123';
+// Dates are laid out around this instant; defaults to today (UTC midnight) so
+// reruns on the same day produce identical documents
+const SEED_NOW = process.env.SEED_NOW
+  ? new Date(process.env.SEED_NOW)
+  : new Date(Math.floor(Date.now() / DAY) * DAY);
+
+const DEPARTMENTS = [
+  ['Computer Science', 30],
+  ['Electronics', 18],
+  ['Mechanical', 14],
+  ['Electrical', 11],
+  ['Civil', 9],
+  ['Business Administration', 9],
+  ['Biotechnology', 5],
+  ['Humanities', 4]
+];
+const YEARS = [[1, 30], [2, 27], [3, 23], [4, 20]];
+const EVENT_TYPES = [
+  // type, category, weight, capacity range at 500 students, durations (minutes)
+  ['workshop', 'technical', 30, [30, 80], [90, 120, 180]],
+  ['seminar', 'technical', 25, [80, 300], [60, 90]],
+  ['hackathon', 'technical', 10, [50, 200], [480, 600, 720]],
+  ['sports', 'sports', 12, [40, 150], [120, 180, 240]],
+  ['cultural', 'cultural', 15, [100, 500], [120, 180]],
+  ['fest', 'non-technical', 8, [300, 1500], [360, 480]]
+];
+const TOPICS = {
+  technical: ['Machine Learning', 'Cloud Computing', 'Web Development', 'Embedded Systems', 'Cyber Security', 'Data Structures', 'Robotics', 'Blockchain'],
+  sports: ['Football', 'Cricket', 'Basketball', 'Athletics', 'Badminton', 'Chess'],
+  cultural: ['Music', 'Dance', 'Drama', 'Photography', 'Literature', 'Fine Arts'],
+  'non-technical': ['Annual', 'Spring', 'Tech', 'Entrepreneurship', 'Alumni']
+};
+const VENUES = ['Main Auditorium', 'Seminar Hall A', 'Seminar Hall B', 'Lab Complex', 'Sports Ground', 'Open Air Theatre', 'Library Hall', 'Innovation Centre'];
+const FIRST_NAMES = ['Aarav', 'Aditi', 'Arjun', 'Ananya', 'Dev', 'Diya', 'Ishaan', 'Kavya', 'Krishna', 'Meera', 'Neha', 'Nikhil', 'Priya', 'Rahul', 'Riya', 'Rohan', 'Sai', 'Sneha', 'Tanvi', 'Vikram'];
+const LAST_NAMES = ['Sharma', 'Patel', 'Reddy', 'Iyer', 'Nair', 'Gupta', 'Rao', 'Kulkarni', 'Singh', 'Menon', 'Joshi', 'Das', 'Shetty', 'Verma'];
+const CITIES = [
+  ['Bengaluru', 'Karnataka'], ['Mumbai', 'Maharashtra'], ['Pune', 'Maharashtra'], ['Chennai', 'Tamil Nadu'],
+  ['Hyderabad', 'Telangana'], ['Delhi', 'Delhi'], ['Kolkata', 'West Bengal'], ['Ahmedabad', 'Gujarat']
+];
+const COMMENTS = [
+  'Really well organized, learned a lot.',
+  'Good content but the session ran late.',
+  'The speaker was excellent.',
+  'Venue was too crowded.',
+  'Would love a follow-up session.',
+  'Average experience overall.'
+];
+const CHECK_IN_METHODS = [['qr_code', 60], ['mobile_app', 30], ['manual', 10]];
+const REGISTRATION_SOURCES = [['web', 60], ['mobile', 35], ['admin', 5]];
+const CANCELLATION_RATE = 0.04;
+
+// Small, fast, seedable PRNG (mulberry32); every draw goes through one of these
+class Random {
+  constructor(seed) {
+    this.state = seed >>> 0;
+  }
+
+  next() {
+    this.state = (this.state + 0x6d2b79f5) >>> 0;
+    let t = this.state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  }
+
+  int(min, max) {
+    return min + Math.floor(this.next() * (max - min + 1));
+  }
+
+  chance(p) {
+    return this.next() < p;
+  }
+
+  pick(items) {
+    return items[Math.floor(this.next() * items.length)];
+  }
+
+  // Value from [[value, weight], ...]
+  weighted(pairs) {
+    const total = pairs.reduce((sum, [, weight]) => sum + weight, 0);
+    let r = this.next() * total;
+    for (const [value, weight] of pairs) {
+      r -= weight;
+      if (r < 0) return value;
+    }
+    return pairs[pairs.length - 1][0];
+  }
+
+  exponential(mean) {
+    return -Math.log(1 - this.next()) * mean;
+  }
+
+  normal(mean, sd) {
+    const u = 1 - this.next();
+    const v = this.next();
+    return mean + sd * Math.sqrt(-2 * Math.log(u)) * Math.cos(2 * Math.PI * v);
+  }
+
+  shuffle(items) {
+    for (let i = items.length - 1; i > 0; i--) {
+      const j = Math.floor(this.next() * (i + 1));
+      [items[i], items[j]] = [items[j], items[i]];
+    }
+    return items;
+  }
+}
+
+// Each college draws from its own stream, so its documents depend only on
+// SEED and the college's position, not on how many colleges came before
+const collegeRandom = (seed, index) => new Random(Math.imul(seed ^ 0x9e3779b9, 2654435761) + Math.imul(index + 1, 40503));
+
+// Zipf-like popularity: the item at rank r gets weight 1 / r^exponent.
+// Draws are a binary search over the cumulative weights.
+class ZipfSampler {
+  constructor(size, exponent = 1) {
+    this.cumulative = new Float64Array(size);
+    let total = 0;
+    for (let rank = 0; rank < size; rank++) {
+      total += 1 / Math.pow(rank + 1, exponent);
+      this.cumulative[rank] = total;
+    }
+    this.total = total;
+  }
+
+  sample(random) {
+    const target = random.next() * this.total;
+    let low = 0;
+    let high = this.cumulative.length - 1;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (this.cumulative[mid] <= target) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  }
+}
+
+// Deterministic ObjectIds: creation time, then the college index and a
+// per-college counter, so _id order follows creation order like real inserts
+const objectIds = (collegeIndex) => {
+  let counter = 0;
+  return (date) => {
+    const bytes = Buffer.alloc(12);
+    bytes.writeUInt32BE(Math.floor(date.getTime() / 1000), 0);
+    bytes.writeUInt32BE(collegeIndex, 4);
+    bytes.writeUInt32BE(++counter, 8);
+    return new mongoose.Types.ObjectId(bytes);
+  };
+};
+
+const pad = (value, width = 2) => String(value).padStart(width, '0');
+const clockTime = (minutes) => `${pad(Math.floor(minutes / 60))}:${pad(minutes % 60)}`;
+const clampRating = (value) => Math.min(5, Math.max(1, Math.round(value)));
+
+// Colleges grow with the scale until the CLG### range runs out, after which
+// colleges get bigger instead; events per semester follow college size
+const planScale = (scale = SEED_SCALE, semesters = SEED_SEMESTERS) => {
+  const students = Math.max(1, Math.round(BASE_SCALE.colleges * BASE_SCALE.studentsPerCollege * scale));
+  const colleges = Math.min(MAX_COLLEGES, Math.max(1, Math.round(BASE_SCALE.colleges * scale)));
+  const studentsPerCollege = Math.max(1, Math.round(students / colleges));
+  const eventsPerSemester = Math.max(1, Math.round(BASE_SCALE.eventsPerSemester * studentsPerCollege / BASE_SCALE.studentsPerCollege));
+  return { colleges, studentsPerCollege, eventsPerSemester, semesters };
+};
+
+// Buffers documents per collection and writes them as unordered insertMany
+// batches straight to the driver collections, with at most `concurrency`
+// batches in flight. add() waits for a free slot, which bounds memory.
+class BulkLoader {
+  constructor(options = {}) {
+    this.batchSize = options.batchSize || BATCH_SIZE;
+    this.concurrency = options.concurrency || CONCURRENCY;
+    this.buffers = new Map();
+    this.inFlight = new Set();
+    this.errors = [];
+    this.stats = { batches: 0, inserted: {} };
+  }
+
+  async add(model, docs) {
+    if (!this.buffers.has(model)) this.buffers.set(model, []);
+    const buffer = this.buffers.get(model);
+    for (const doc of docs) buffer.push(doc);
+
+    while (buffer.length >= this.batchSize) {
+      await this.dispatch(model, buffer.splice(0, this.batchSize));
+    }
+  }
+
+  async dispatch(model, batch) {
+    while (this.inFlight.size >= this.concurrency) {
+      await Promise.race(this.inFlight);
+    }
+
+    const write = model.collection.insertMany(batch, { ordered: false })
+      .then(() => {
+        const name = model.modelName;
+        this.stats.inserted[name] = (this.stats.inserted[name] || 0) + batch.length;
+        this.stats.batches++;
+      })
+      .catch((error) => {
+        this.errors.push(error);
+      })
+      .finally(() => {
+        this.inFlight.delete(write);
+      });
+    this.inFlight.add(write);
+  }
+
+  async flush() {
+    for (const [model, buffer] of this.buffers) {
+      if (buffer.length > 0) await this.dispatch(model, buffer.splice(0));
+    }
+    await Promise.all(this.inFlight);
+    if (this.errors.length > 0) throw this.errors[0];
+  }
+}
+
+const buildCollege = (index, random, id, createdAt) => {
+  const [city, state] = random.pick(CITIES);
+  const collegeId = formatId('CLG', index + 1);
+  const domain = `college${pad(index + 1, 3)}.edu`;
+  return {
+    _id: id(createdAt),
+    collegeId,
+    name: `${city} Institute of Technology ${index + 1}`,
+    address: {
+      street: `${random.int(1, 400)} College Road`,
+      city,
+      state,
+      zipCode: String(random.int(100000, 999999)),
+      country: 'India'
+    },
+    contactInfo: {
+      email: `info@${domain}`,
+      phone: `9${random.int(100000000, 999999999)}`,
+      website: `https://www.${domain}`
+    },
+    settings: {
+      maxEventsPerSemester: BASE_SCALE.eventsPerSemester,
+      maxStudents: BASE_SCALE.studentsPerCollege,
+      academicYear: `${SEED_NOW.getUTCFullYear()}-${pad((SEED_NOW.getUTCFullYear() + 1) % 100)}`,
+      currentSemester: SEED_NOW.getUTCMonth() < 6 ? 'Spring' : 'Fall'
+    },
+    isActive: true,
+    createdAt,
+    updatedAt: createdAt,
+    domain
+  };
+};
+
+const buildUser = (random, id, college, fields, createdAt) => {
+  const first = random.pick(FIRST_NAMES);
+  const last = random.pick(LAST_NAMES);
+  return {
+    _id: id(createdAt),
+    name: `${first} ${last}`,
+    email: `${first}.${last}.${fields.userId}@${college.domain}`.toLowerCase(),
+    collegeId: college._id,
+    isActive: true,
+    isVerified: random.chance(0.9),
+    lastLogin: random.chance(0.7) ? new Date(SEED_NOW.getTime() - random.exponential(5 * DAY)) : undefined,
+    createdAt,
+    updatedAt: createdAt,
+    ...fields
+  };
+};
+
+const buildEvent = (random, id, college, admin, semesterStart, seq, studentsPerCollege) => {
+  const [eventType, category, , [minCapacity, maxCapacity], durations] = random.weighted(EVENT_TYPES.map((type) => [type, type[2]]));
+  const topic = random.pick(TOPICS[category]);
+  const duration = random.pick(durations);
+  const startMinutes = random.int(8, Math.max(8, Math.floor((23 * 60 - duration) / 60))) * 60 + random.pick([0, 30]);
+  const day = new Date(semesterStart.getTime() + random.int(0, SEMESTER_DAYS - 1) * DAY);
+  const date = new Date(day.getTime() + startMinutes * 60 * 1000);
+  const registrationOpens = new Date(day.getTime() - random.int(14, 28) * DAY);
+  const registrationDeadline = new Date(day.getTime() - random.int(1, 3) * DAY);
+  const size = studentsPerCollege / BASE_SCALE.studentsPerCollege;
+
+  let status = date < SEED_NOW ? 'completed' : 'active';
+  if (random.chance(0.03)) status = 'cancelled';
+  else if (status === 'active' && random.chance(0.05)) status = 'draft';
+
+  const eventId = formatId('EVT', seq, college.collegeId);
+  return {
+    _id: id(registrationOpens),
+    eventId,
+    name: `${topic} ${eventType.charAt(0).toUpperCase()}${eventType.slice(1)} ${seq}`,
+    description: `${topic} ${eventType} hosted by ${college.name}.`,
+    eventType,
+    category,
+    date,
+    startTime: clockTime(startMinutes),
+    endTime: clockTime(startMinutes + duration),
+    duration,
+    venue: random.pick(VENUES),
+    capacity: Math.max(1, Math.round(random.int(minCapacity, maxCapacity) * size)),
+    registrationDeadline,
+    registrationFee: 0,
+    collegeId: college._id,
+    createdBy: admin._id,
+    status,
+    isRegistrationOpen: status === 'active' && registrationDeadline > SEED_NOW,
+    tags: [category, eventType, topic.toLowerCase()],
+    totalRegistrations: 0,
+    totalAttendance: 0,
+    waitlistTail: 0,
+    waitlistLength: 0,
+    averageRating: 0,
+    createdAt: registrationOpens,
+    updatedAt: registrationOpens,
+    // Generation-only fields, stripped before insert
+    registrationOpens,
+    turnout: 0.6 + random.next() * 0.35,
+    quality: Math.min(4.8, Math.max(2.5, random.normal(3.9, 0.5))),
+    registrants: []
+  };
+};
+
+// Registrations land in a rush right after opening and taper off towards the
+// deadline (or now, for events still open)
+const registrationTime = (random, event) => {
+  const closes = Math.min(event.registrationDeadline.getTime(), SEED_NOW.getTime());
+  const window = closes - event.registrationOpens.getTime();
+  return new Date(event.registrationOpens.getTime() + window * Math.pow(random.next(), 2.5));
+};
+
+const seedCollege = async (index, plan, passwordHash, loader) => {
+  const random = collegeRandom(SEED, index);
+  const id = objectIds(index);
+  const termStart = new Date(SEED_NOW.getTime() - ((plan.semesters - 1) * SEMESTER_DAYS + SEMESTER_DAYS / 2) * DAY);
+  const counters = [];
+
+  const college = buildCollege(index, random, id, new Date(termStart.getTime() - 60 * DAY));
+
+  const admins = [buildUser(random, id, college, {
+    userId: formatId('ADM', index + 1),
+    password: passwordHash,
+    role: 'admin',
+    adminLevel: 'college_admin',
+    permissions: ['create_events', 'manage_users', 'view_reports', 'manage_registrations']
+  }, college.createdAt)];
+  if (index === 0) {
+    admins.push(buildUser(random, id, college, {
+      userId: formatId('ADM', plan.colleges + 1),
+      password: passwordHash,
+      role: 'admin',
+      adminLevel: 'super_admin',
+      permissions: ['create_events', 'manage_users', 'view_reports', 'manage_registrations']
+    }, college.createdAt));
+  }
+
+  const students = Array.from({ length: plan.studentsPerCollege }, (_, i) => {
+    const year = random.weighted(YEARS);
+    const joined = new Date(SEED_NOW.getTime() - (year * 365 - random.int(0, 60)) * DAY);
+    return buildUser(random, id, college, {
+      userId: formatId('STU', index * plan.studentsPerCollege + i + 1),
+      password: passwordHash,
+      role: 'student',
+      studentId: `${college.collegeId}${SEED_NOW.getUTCFullYear() - year + 1}${pad(i + 1, 4)}`,
+      department: random.weighted(DEPARTMENTS),
+      year
+    }, joined);
+  });
+
+  // Events per semester, each with a random popularity rank; every student
+  // picks a skewed number of distinct events per semester by that ranking
+  const events = [];
+  for (let semester = 0; semester < plan.semesters; semester++) {
+    const semesterStart = new Date(termStart.getTime() + semester * SEMESTER_DAYS * DAY);
+    const semesterEvents = [];
+    for (let i = 0; i < plan.eventsPerSemester; i++) {
+      const event = buildEvent(random, id, college, admins[0], semesterStart, events.length + 1, plan.studentsPerCollege);
+      events.push(event);
+      semesterEvents.push(event);
+    }
+
+    const open = random.shuffle(semesterEvents.filter((event) =>
+      (event.status === 'active' || event.status === 'completed') && event.registrationOpens < SEED_NOW));
+    if (open.length === 0) continue;
+    const popularity = new ZipfSampler(open.length, 1.1);
+
+    for (const student of students) {
+      const wanted = Math.min(open.length, Math.round(random.exponential(REGISTRATIONS_PER_SEMESTER)));
+      const chosen = new Set();
+      for (let attempts = 0; chosen.size < wanted && attempts < wanted * 4; attempts++) {
+        chosen.add(popularity.sample(random));
+      }
+      for (const rank of chosen) {
+        const event = open[rank];
+        event.registrants.push({ student, at: registrationTime(random, event) });
+      }
+    }
+  }
+
+  const registrations = [];
+  const attendance = [];
+  const feedback = [];
+  const rollups = new Map();
+  const rollupFor = (student) => {
+    if (!rollups.has(student._id)) {
+      rollups.set(student._id, { _id: student._id, collegeId: college._id, eventsRegistered: 0, eventsAttended: 0, feedbackCount: 0, ratingSum: 0 });
+    }
+    return rollups.get(student._id);
+  };
+  const types = new Map();
+
+  for (const event of events) {
+    // Seats go in registration order; once full, later registrants queue
+    event.registrants.sort((a, b) => a.at - b.at);
+    const ratingPaths = {};
+    let attendanceSeq = 0;
+    let feedbackSeq = 0;
+
+    event.registrants.forEach(({ student, at }, i) => {
+      const registration = {
+        _id: id(at),
+        registrationId: formatId('REG', i + 1, `${event.eventId}_${student.userId}`),
+        studentId: student._id,
+        eventId: event._id,
+        collegeId: college._id,
+        registrationDate: at,
+        paymentStatus: 'not_required',
+        registrationSource: random.weighted(REGISTRATION_SOURCES),
+        createdAt: at,
+        updatedAt: at
+      };
+
+      if (random.chance(CANCELLATION_RATE)) {
+        const cancelledAt = new Date(Math.min(SEED_NOW.getTime(), at.getTime() + random.exponential(3 * DAY)));
+        registration.registrationStatus = 'cancelled';
+        registration.cancellationDate = cancelledAt;
+        registration.cancellationReason = 'Schedule conflict';
+        registration.updatedAt = cancelledAt;
+      } else if (event.totalRegistrations < event.capacity) {
+        registration.registrationStatus = 'registered';
+        event.totalRegistrations++;
+        rollupFor(student).eventsRegistered++;
+      } else {
+        registration.registrationStatus = 'waitlisted';
+        registration.waitlistPosition = ++event.waitlistTail;
+        event.waitlistLength++;
+      }
+      registrations.push(registration);
+
+      if (event.status !== 'completed' || registration.registrationStatus !== 'registered' || !random.chance(event.turnout)) return;
+
+      const checkInMethod = random.weighted(CHECK_IN_METHODS);
+      const checkInTime = new Date(event.date.getTime() + (random.int(0, 45) - 15) * 60 * 1000);
+      const record = {
+        _id: id(checkInTime),
+        attendanceId: formatId('ATT', ++attendanceSeq, `${event.eventId}_${student.userId}`),
+        studentId: student._id,
+        eventId: event._id,
+        registrationId: registration._id,
+        checkInTime,
+        checkInMethod,
+        isVerified: checkInMethod === 'qr_code',
+        createdAt: checkInTime,
+        updatedAt: checkInTime
+      };
+      if (random.chance(0.5)) {
+        record.actualDuration = Math.max(1, Math.round(event.duration * (0.6 + random.next() * 0.4)));
+        record.checkOutTime = new Date(checkInTime.getTime() + record.actualDuration * 60 * 1000);
+      }
+      attendance.push(record);
+      event.totalAttendance++;
+      rollupFor(student).eventsAttended++;
+
+      if (!random.chance(0.4)) return;
+
+      const overall = clampRating(random.normal(event.quality, 0.8));
+      const nearby = () => clampRating(overall + random.int(-1, 1));
+      const [content, speaker, organization, venue] = [nearby(), nearby(), nearby(), nearby()];
+      const submitted = new Date(Math.min(
+        SEED_NOW.getTime(),
+        event.date.getTime() + event.duration * 60 * 1000 + random.exponential(DAY)
+      ));
+      const entry = {
+        _id: id(submitted),
+        feedbackId: formatId('FBK', ++feedbackSeq, `${event.eventId}_${student.userId}`),
+        studentId: student._id,
+        eventId: event._id,
+        attendanceId: record._id,
+        overallRating: overall,
+        contentRating: content,
+        organizationRating: organization,
+        venueRating: venue,
+        comments: random.chance(0.3) ? random.pick(COMMENTS) : undefined,
+        wouldRecommend: overall >= 4,
+        categories: {
+          content: { rating: content },
+          speaker: { rating: speaker },
+          organization: { rating: organization },
+          venue: { rating: venue }
+        },
+        isAnonymous: random.chance(0.1),
+        submissionDate: submitted,
+        createdAt: submitted,
+        updatedAt: submitted
+      };
+      feedback.push(entry);
+
+      for (const [path, value] of Object.entries(ratingDeltas(null, ratingSnapshot(entry)))) {
+        ratingPaths[path] = (ratingPaths[path] || 0) + value;
+      }
+      const rollup = rollupFor(student);
+      rollup.feedbackCount++;
+      rollup.ratingSum += overall;
+    });
+
+    // Derived fields match what the write paths and rebuildRollups maintain
+    event.feedbackStats = feedbackStatsFrom(ratingPaths);
+    const { sum, count } = event.feedbackStats.overall;
+    event.averageRating = count > 0 ? Math.round((sum / count) * 10) / 10 : 0;
+
+    const key = typeRollupKey(college._id, event.eventType);
+    if (!types.has(key)) {
+      types.set(key, { _id: key, collegeId: college._id, eventType: event.eventType, totalEvents: 0, totalRegistrations: 0, totalAttendance: 0 });
+    }
+    const type = types.get(key);
+    type.totalEvents++;
+    type.totalRegistrations += event.totalRegistrations;
+    type.totalAttendance += event.totalAttendance;
+
+    if (event.registrants.length > 0) counters.push([`registration:${event.eventId}`, event.registrants.length]);
+    if (attendanceSeq > 0) counters.push([`attendance:${event.eventId}`, attendanceSeq]);
+    if (feedbackSeq > 0) counters.push([`feedback:${event.eventId}`, feedbackSeq]);
+  }
+  counters.push([`event:${college.collegeId}`, events.length]);
+
+  const { domain, ...collegeDoc } = college;
+  await loader.add(College, [collegeDoc]);
+  await loader.add(User, [...admins, ...students]);
+  await loader.add(Event, events.map(({ registrationOpens, turnout, quality, registrants, ...event }) => event));
+  await loader.add(Registration, registrations);
+  await loader.add(Attendance, attendance);
+  await loader.add(Feedback, feedback);
+  await loader.add(StudentRollup, [...rollups.values()]);
+  await loader.add(CollegeTypeRollup, [...types.values()]);
+
+  return counters;
+};
+
+const SEEDED_MODELS = [College, User, Event, Registration, Attendance, Feedback, Counter, StudentRollup, CollegeTypeRollup];
+
+// Generate and load the whole dataset. Refuses to write into a database that
+// already has users unless `drop` is set, since the precomputed IDs and
+// counters assume an empty database.
+const seedDatabase = async (options = {}) => {
+  const plan = planScale(options.scale, options.semesters);
+  const startedAt = Date.now();
+
+  if (options.drop) {
+    await mongoose.connection.dropDatabase();
+  } else if ((await User.estimatedDocumentCount()) > 0) {
+    throw new Error('Database is not empty; set SEED_DROP=true to replace it');
+  }
+
+  // One bcrypt hash shared by every seeded account
+  const passwordHash = await bcrypt.hash(SEED_PASSWORD, BCRYPT_SALT_ROUNDS);
+  const loader = new BulkLoader(options);
+
+  const counters = [
+    ['user:STU', plan.colleges * plan.studentsPerCollege],
+    ['user:ADM', plan.colleges + 1]
+  ];
+  for (let index = 0; index < plan.colleges; index++) {
+    counters.push(...(await seedCollege(index, plan, passwordHash, loader)));
+  }
+  await loader.flush();
+
+  // Later inserts through the models continue after the seeded sequences
+  await idAllocator.ensureAtLeastMany(counters, BATCH_SIZE);
+
+  // Indexes are built once over the loaded collections rather than maintained per insert
+  for (const model of SEEDED_MODELS) await model.syncIndexes();
+  await bumpAllVersions();
+
+  return {
+    plan,
+    inserted: loader.stats.inserted,
+    documents: Object.values(loader.stats.inserted).reduce((sum, count) => sum + count, 0),
+    batches: loader.stats.batches,
+    seconds: Number(((Date.now() - startedAt) / 1000).toFixed(1))
+  };
+};
+
+if (require.main === module) {
+  // autoIndex off: a dropped database gets its indexes after the load
+  mongoose.connect(process.env.MONGODB_URI, { autoIndex: false })
+    .then(() => seedDatabase({ drop: process.env.SEED_DROP === 'true' }))
+    .then((result) => {
+      const { plan } = result;
+      console.log(`✅ Seeded ${result.documents} documents in ${result.seconds}s ` +
+        `(${plan.colleges} colleges × ${plan.studentsPerCollege} students, ${plan.eventsPerSemester} events × ${plan.semesters} semesters)`);
+      for (const [model, count] of Object.entries(result.inserted)) {
+        console.log(`   ${model}: ${count}`);
+      }
+      return mongoose.connection.close();
+    })
+    .catch((error) => {
+      console.error('❌ Error seeding database:', error);
+      process.exit(1);
+    });
+}
+
+module.exports = {
+  Random,
+  ZipfSampler,
+  BulkLoader,
+  planScale,
+  seedDatabase
+};
+'''
+
+with open('utils/seedDatabase.js', 'w') as f:
+    f.write(seed_database_js)
+
+print("✅ Created utils/seedDatabase.js - Deterministic bulk seeder for the scale target")
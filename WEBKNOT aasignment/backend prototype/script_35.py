@@ -0,0 +1,465 @@
+# Create the scenario load tests (npm run load) and their regression baseline
+import json
+
+load_scenarios_js = '''const fs = require('fs');
+const http = require('http');
+const path = require('path');
+const os = require('os');
+const { performance } = require('perf_hooks');
+const { spawn } = require('child_process');
+const mongoose = require('mongoose');
+require('dotenv').config();
+
+process.env.JWT_SECRET = process.env.JWT_SECRET || 'load-test-secret';
+process.env.SEED_PASSWORD = process.env.SEED_PASSWORD || 'password123';
+
+const { User, Event, Registration } = require('../models');
+const { generateToken } = require('../config/jwt');
+const { seedDatabase } = require('../utils/seedDatabase');
+
+const MONGODB_URI = process.env.LOAD_MONGODB_URI || 'mongodb://localhost:27017/campus-events-load';
+const PORT = parseInt(process.env.LOAD_PORT) || 3901;
+const WORKERS = parseInt(process.env.LOAD_WORKERS) || 0; // 0 runs server.js, otherwise cluster.js
+const SEED_SCALE = parseFloat(process.env.LOAD_SEED_SCALE) || 0.2;
+const SECONDS = parseInt(process.env.LOAD_SECONDS) || 15;
+const WARMUP_SECONDS = parseInt(process.env.LOAD_WARMUP_SECONDS) || 3;
+const CONCURRENCY = parseInt(process.env.LOAD_CONCURRENCY) || 64;
+const BURST_CONCURRENCY = parseInt(process.env.LOAD_BURST_CONCURRENCY) || 256;
+const LOGINS = parseInt(process.env.LOAD_LOGINS) || 400;
+const RESULTS_FILE = process.env.LOAD_RESULTS || path.join(__dirname, 'loadResults.json');
+const BASELINE_FILE = process.env.LOAD_BASELINE || path.join(__dirname, 'loadBaseline.json');
+const ONLY = (process.env.LOAD_SCENARIOS || '').split(',').map((name) => name.trim()).filter(Boolean);
+const UPDATE_BASELINE = process.argv.includes('--update-baseline');
+const UNLIMITED = '1000000000';
+const DAY = 24 * 60 * 60 * 1000;
+
+const send = (agent, { method = 'GET', path: urlPath, token, body }) => new Promise((resolve) => {
+  const payload = body ? JSON.stringify(body) : null;
+  const headers = {};
+  if (token) headers.Authorization = `Bearer ${token}`;
+  if (payload) {
+    headers['Content-Type'] = 'application/json';
+    headers['Content-Length'] = Buffer.byteLength(payload);
+  }
+
+  const req = http.request({ host: '127.0.0.1', port: PORT, method, path: urlPath, agent, headers }, (res) => {
+    res.resume();
+    res.on('end', () => resolve(res.statusCode));
+  });
+  req.on('error', () => resolve(599));
+  req.end(payload);
+});
+
+const percentile = (sorted, p) => (sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : 0);
+const round = (value) => Number(value.toFixed(2));
+const pct = (fraction) => `${round(fraction * 100)}%`;
+
+// Each scenario prepares its state against the seeded data, then hands out
+// requests from next(state, i). Timed scenarios keep their clients busy for
+// LOAD_SECONDS after a warm-up; the others send each prepared request once
+// (next returns null when they run out), like a real rush or burst.
+const SCENARIOS = [
+  {
+    name: 'registration-rush',
+    description: 'every student of a college registers the moment a popular event opens',
+    concurrency: BURST_CONCURRENCY,
+    expect: [201],
+    prepare: async (ctx) => {
+      const college = ctx.colleges[0];
+      const students = ctx.students.filter((student) => String(student.collegeId) === college);
+      const date = new Date(Date.now() + 14 * DAY);
+      // Capacity for 60% of the college; the rest join the waitlist
+      const event = await Event.create({
+        name: 'Load Test Registration Rush',
+        description: 'Event opened by the registration rush scenario',
+        eventType: 'fest',
+        category: 'non-technical',
+        date,
+        startTime: '10:00',
+        endTime: '16:00',
+        venue: 'Main Auditorium',
+        capacity: Math.max(1, Math.floor(students.length * 0.6)),
+        registrationDeadline: new Date(date.getTime() - DAY),
+        collegeId: college,
+        createdBy: ctx.admins.find((admin) => String(admin.collegeId) === college)._id
+      });
+      return { eventId: String(event._id), students };
+    },
+    next: (state, i) => (i < state.students.length ? {
+      method: 'POST',
+      path: '/api/registrations',
+      token: state.students[i].token,
+      body: { eventId: state.eventId }
+    } : null)
+  },
+  {
+    name: 'checkin-burst',
+    description: 'everyone registered for the biggest open event checks in at the door',
+    concurrency: BURST_CONCURRENCY,
+    expect: [201],
+    prepare: async (ctx) => {
+      const event = await Event.findOne({ status: 'active' }).sort({ totalRegistrations: -1 }).select('_id').lean();
+      const registrations = await Registration.find({ eventId: event._id, registrationStatus: 'registered' })
+        .select('studentId')
+        .lean();
+      return {
+        eventId: String(event._id),
+        students: registrations.map((registration) => ctx.studentsById.get(String(registration.studentId)))
+      };
+    },
+    next: (state, i) => (i < state.students.length ? {
+      method: 'POST',
+      path: '/api/attendance/checkin',
+      token: state.students[i].token,
+      body: { eventId: state.eventId, checkInMethod: 'qr_code' }
+    } : null)
+  },
+  {
+    name: 'dashboard-browsing',
+    description: 'students page through their college events, open details and check their registrations',
+    timed: true,
+    concurrency: CONCURRENCY,
+    expect: [200],
+    prepare: async (ctx) => ({ students: ctx.students, eventsByCollege: ctx.eventsByCollege }),
+    next: (state, i) => {
+      const student = state.students[i % state.students.length];
+      const college = String(student.collegeId);
+      const action = i % 10;
+      if (action < 5) {
+        return { path: `/api/events?collegeId=${college}&limit=20`, token: student.token };
+      }
+      if (action < 8) {
+        const events = state.eventsByCollege.get(college);
+        return { path: `/api/events/${events[i % events.length]}`, token: student.token };
+      }
+      return { path: `/api/registrations/student/${student._id}`, token: student.token };
+    }
+  },
+  {
+    name: 'report-refresh',
+    description: 'college admins refresh the report dashboards',
+    timed: true,
+    concurrency: Math.max(1, Math.floor(CONCURRENCY / 4)),
+    expect: [200],
+    prepare: async (ctx) => ({ admins: ctx.admins }),
+    next: (state, i) => {
+      const admin = state.admins[i % state.admins.length];
+      const college = String(admin.collegeId);
+      const paths = [
+        `/api/reports/events/popularity?collegeId=${college}`,
+        `/api/reports/students/participation?collegeId=${college}&limit=50`,
+        `/api/reports/students/top-active?collegeId=${college}`,
+        `/api/reports/events/by-type?eventType=workshop&collegeId=${college}`
+      ];
+      return { path: paths[Math.floor(i / state.admins.length) % paths.length], token: admin.token };
+    }
+  },
+  {
+    name: 'login-storm',
+    description: 'distinct students log in at once (bcrypt on the password pool)',
+    concurrency: BURST_CONCURRENCY,
+    expect: [200],
+    prepare: async (ctx) => ({ students: ctx.students.slice(0, LOGINS) }),
+    next: (state, i) => (i < state.students.length ? {
+      method: 'POST',
+      path: '/api/auth/login',
+      body: { email: state.students[i].email, password: process.env.SEED_PASSWORD }
+    } : null)
+  }
+];
+
+// Drive one scenario and summarize it. Throughput counts responses with an
+// expected status only, so a run cannot get faster by failing.
+const runScenario = async (scenario, state, seconds) => {
+  const agent = new http.Agent({ keepAlive: true, maxSockets: scenario.concurrency });
+  const latencies = [];
+  const statuses = {};
+  let errors = 0;
+  let issued = 0;
+  const startedAt = performance.now();
+  const deadline = scenario.timed ? startedAt + seconds * 1000 : Infinity;
+
+  await Promise.all(Array.from({ length: scenario.concurrency }, async () => {
+    while (performance.now() < deadline) {
+      const request = scenario.next(state, issued++);
+      if (!request) break;
+
+      const sentAt = performance.now();
+      const status = await send(agent, request);
+      latencies.push(performance.now() - sentAt);
+      statuses[status] = (statuses[status] || 0) + 1;
+      if (!scenario.expect.includes(status)) errors++;
+    }
+  }));
+
+  const elapsed = (performance.now() - startedAt) / 1000;
+  agent.destroy();
+
+  const sorted = latencies.sort((a, b) => a - b);
+  const total = sorted.reduce((sum, ms) => sum + ms, 0);
+  return {
+    requests: sorted.length,
+    errors,
+    errorRate: sorted.length ? round(errors / sorted.length) : 0,
+    seconds: round(elapsed),
+    throughput: round((sorted.length - errors) / elapsed),
+    latencyMs: {
+      mean: sorted.length ? round(total / sorted.length) : 0,
+      p50: round(percentile(sorted, 0.5)),
+      p95: round(percentile(sorted, 0.95)),
+      p99: round(percentile(sorted, 0.99)),
+      max: sorted.length ? round(sorted[sorted.length - 1]) : 0
+    },
+    statuses
+  };
+};
+
+// Seeded accounts with signed tokens, plus event IDs grouped by college
+const loadContext = async () => {
+  const users = await User.find().select('_id email role adminLevel collegeId').lean();
+  const withToken = (user) => ({
+    ...user,
+    token: generateToken({ userId: user._id, role: user.role, collegeId: user.collegeId })
+  });
+
+  const students = users.filter((user) => user.role === 'student').map(withToken);
+  const admins = users.filter((user) => user.adminLevel === 'college_admin').map(withToken);
+
+  const eventsByCollege = new Map();
+  for (const event of await Event.find({ status: { $in: ['active', 'completed'] } }).select('_id collegeId').lean()) {
+    const college = String(event.collegeId);
+    if (!eventsByCollege.has(college)) eventsByCollege.set(college, []);
+    eventsByCollege.get(college).push(String(event._id));
+  }
+
+  return {
+    students,
+    studentsById: new Map(students.map((student) => [String(student._id), student])),
+    admins,
+    colleges: admins.map((admin) => String(admin.collegeId)),
+    eventsByCollege
+  };
+};
+
+const startServer = async () => {
+  const entry = WORKERS > 0 ? 'cluster.js' : 'server.js';
+  const child = spawn(process.execPath, [path.join(__dirname, '..', entry)], {
+    env: {
+      ...process.env,
+      NODE_ENV: 'production',
+      MONGODB_URI,
+      PORT: String(PORT),
+      WEB_CONCURRENCY: String(WORKERS),
+      LOG_LEVEL: process.env.LOAD_LOG_LEVEL || 'warn',
+      RATE_LIMIT_MAX_REQUESTS: UNLIMITED,
+      RATE_LIMIT_COLLEGE_MAX_REQUESTS: UNLIMITED,
+      RATE_LIMIT_IP_MAX_REQUESTS: UNLIMITED,
+      RATE_LIMIT_LOGIN_MAX: UNLIMITED,
+      RATE_LIMIT_LOGIN_IP_MAX: UNLIMITED,
+      RATE_LIMIT_REGISTRATION_MAX: UNLIMITED,
+      RATE_LIMIT_COLLEGE_REGISTRATION_MAX: UNLIMITED,
+      RATE_LIMIT_REPORTS_MAX: UNLIMITED,
+      RATE_LIMIT_COLLEGE_REPORTS_MAX: UNLIMITED
+    },
+    stdio: ['ignore', 'ignore', 'inherit']
+  });
+
+  let exitCode = null;
+  child.once('exit', (code) => {
+    exitCode = code;
+  });
+
+  // /ready answers 200 once MongoDB is connected and the pool is warm
+  const giveUpAt = Date.now() + 30 * 1000;
+  while (exitCode === null && Date.now() < giveUpAt) {
+    if ((await send(undefined, { path: '/ready' })) === 200) return child;
+    await new Promise((resolve) => setTimeout(resolve, 200));
+  }
+
+  child.kill('SIGKILL');
+  throw new Error(exitCode === null ? 'Server did not become ready within 30s' : `Server exited with code ${exitCode}`);
+};
+
+const stopServer = (child) => new Promise((resolve) => {
+  if (child.exitCode !== null) return resolve();
+  child.once('exit', resolve);
+  child.kill('SIGTERM');
+});
+
+const readJson = (file) => (fs.existsSync(file) ? JSON.parse(fs.readFileSync(file, 'utf8')) : null);
+
+// A metric regresses when it is worse than the baseline by more than its
+// relative threshold. Latency must also have moved by minLatencyDeltaMs, so
+// sub-millisecond noise on fast paths does not fail a run. A scenario with
+// no recorded baseline fails too, so an empty baseline can never pass.
+const scenarioErrors = (name, current, thresholds) => {
+  const limits = { ...thresholds.default, ...thresholds[name] };
+  const failures = [];
+  if (current.requests === 0 || current.throughput === 0) {
+    failures.push('no successful requests');
+  }
+  if (current.errorRate > limits.maxErrorRate) {
+    failures.push(`error rate ${pct(current.errorRate)} above ${pct(limits.maxErrorRate)}`);
+  }
+  return failures;
+};
+
+const compareScenario = (name, current, baseline, thresholds) => {
+  const limits = { ...thresholds.default, ...thresholds[name] };
+  const failures = scenarioErrors(name, current, thresholds);
+
+  if (!baseline) {
+    failures.push('no baseline recorded (run npm run load:baseline)');
+    return failures;
+  }
+
+  if (current.throughput < baseline.throughput * (1 - limits.throughputDrop)) {
+    failures.push(`throughput ${current.throughput}/s vs ${baseline.throughput}/s (allowed drop ${pct(limits.throughputDrop)})`);
+  }
+  for (const p of ['p50', 'p95', 'p99']) {
+    const allowed = limits[`${p}Increase`];
+    const before = baseline.latencyMs[p];
+    const after = current.latencyMs[p];
+    if (allowed !== undefined && after > before * (1 + allowed) && after - before > limits.minLatencyDeltaMs) {
+      failures.push(`${p} ${after}ms vs ${before}ms (allowed increase ${pct(allowed)})`);
+    }
+  }
+  return failures;
+};
+
+const main = async () => {
+  const scenarios = SCENARIOS.filter((scenario) => ONLY.length === 0 || ONLY.includes(scenario.name));
+  const config = {
+    seedScale: SEED_SCALE,
+    workers: WORKERS,
+    seconds: SECONDS,
+    concurrency: CONCURRENCY,
+    burstConcurrency: BURST_CONCURRENCY,
+    logins: LOGINS
+  };
+  const environment = { node: process.version, cpus: os.cpus().length, platform: process.platform };
+  const results = { recordedAt: new Date().toISOString(), environment, config, scenarios: {} };
+
+  await mongoose.connect(MONGODB_URI, { autoIndex: false });
+  let server = null;
+  try {
+    // A fresh, deterministic dataset every run keeps runs comparable
+    const seeded = await seedDatabase({ scale: SEED_SCALE, drop: true });
+    console.log(`Seeded ${seeded.documents} documents in ${seeded.seconds}s`);
+
+    server = await startServer();
+    const ctx = await loadContext();
+
+    for (const scenario of scenarios) {
+      const state = await scenario.prepare(ctx);
+      if (scenario.timed && WARMUP_SECONDS > 0) await runScenario(scenario, state, WARMUP_SECONDS);
+      results.scenarios[scenario.name] = await runScenario(scenario, state, SECONDS);
+      console.log(`  ${scenario.name}: ${scenario.description}`);
+    }
+  } finally {
+    if (server) await stopServer(server);
+    await mongoose.connection.close();
+  }
+
+  fs.writeFileSync(RESULTS_FILE, `${JSON.stringify(results, null, 2)}\\n`);
+
+  console.table(Object.fromEntries(Object.entries(results.scenarios).map(([name, result]) => [name, {
+    requests: result.requests,
+    errors: result.errors,
+    'req/s': result.throughput,
+    'p50 ms': result.latencyMs.p50,
+    'p95 ms': result.latencyMs.p95,
+    'p99 ms': result.latencyMs.p99
+  }])));
+  console.log(`Results written to ${path.relative(process.cwd(), RESULTS_FILE)}`);
+
+  const baseline = readJson(BASELINE_FILE) || { thresholds: { default: {} }, scenarios: {} };
+
+  if (UPDATE_BASELINE) {
+    // A run that failed requests would make a meaningless baseline
+    const broken = Object.entries(results.scenarios)
+      .map(([name, result]) => [name, scenarioErrors(name, result, baseline.thresholds)])
+      .filter(([, failures]) => failures.length > 0);
+    if (broken.length > 0) {
+      for (const [name, failures] of broken) console.log(`✗ ${name}: ${failures.join('; ')}`);
+      console.log('Baseline not updated');
+      process.exitCode = 1;
+      return;
+    }
+
+    fs.writeFileSync(BASELINE_FILE, `${JSON.stringify({
+      thresholds: baseline.thresholds,
+      recordedAt: results.recordedAt,
+      environment,
+      config,
+      scenarios: { ...baseline.scenarios, ...results.scenarios }
+    }, null, 2)}\\n`);
+    console.log(`✅ Baseline updated: ${path.relative(process.cwd(), BASELINE_FILE)}`);
+    return;
+  }
+
+  if (baseline.config && JSON.stringify(baseline.config) !== JSON.stringify(config)) {
+    console.log('⚠️  Baseline was recorded with a different configuration:', baseline.config);
+  }
+  if (baseline.environment && baseline.environment.cpus !== environment.cpus) {
+    console.log('⚠️  Baseline was recorded on a different machine:', baseline.environment);
+  }
+
+  let failed = 0;
+  for (const [name, result] of Object.entries(results.scenarios)) {
+    const previous = baseline.scenarios[name];
+    const failures = compareScenario(name, result, previous, baseline.thresholds);
+    if (failures.length > 0) {
+      failed++;
+      console.log(`✗ ${name}: ${failures.join('; ')}`);
+    } else {
+      console.log(`✓ ${name}`);
+    }
+  }
+
+  if (failed > 0) {
+    console.log(`${failed} scenario(s) failed against ${path.relative(process.cwd(), BASELINE_FILE)}`);
+    process.exitCode = 1;
+  }
+};
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
+'''
+
+with open('benchmarks/scenarios.load.js', 'w') as f:
+    f.write(load_scenarios_js)
+
+# Regression thresholds: relative to the recorded baseline, per scenario
+# overrides on top of the defaults. Scenario numbers are recorded on the
+# machine that runs the comparison with `npm run load:baseline`.
+load_baseline = {
+    "thresholds": {
+        "default": {
+            "throughputDrop": 0.15,
+            "p50Increase": 0.25,
+            "p95Increase": 0.3,
+            "p99Increase": 0.5,
+            "minLatencyDeltaMs": 2,
+            "maxErrorRate": 0.01
+        },
+        "registration-rush": {
+            "maxErrorRate": 0
+        },
+        "checkin-burst": {
+            "maxErrorRate": 0
+        },
+        "login-storm": {
+            "p99Increase": 0.75
+        }
+    },
+    "scenarios": {}
+}
+
+with open('benchmarks/loadBaseline.json', 'w') as f:
+    json.dump(load_baseline, f, indent=2)
+
+print("✅ Created benchmarks/scenarios.load.js - Scenario load tests with baseline regression checks")
+print("✅ Created benchmarks/loadBaseline.json - Load test thresholds (record numbers with npm run load:baseline)")
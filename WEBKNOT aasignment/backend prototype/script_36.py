@@ -0,0 +1,160 @@
+# Create the feedback controller and routes (mounted at /api/feedback by server.js)
+
+feedback_controller_js = '''const mongoose = require('mongoose');
+const { User, Event, Attendance, Feedback } = require('../models');
+const { AppError, asyncHandler } = require('../middleware/errorHandler');
+const { USER_DERIVED, leanProjection } = require('../utils/leanViews');
+
+const FEEDBACK_FIELDS = [
+  'overallRating',
+  'contentRating',
+  'organizationRating',
+  'venueRating',
+  'comments',
+  'suggestions',
+  'wouldRecommend',
+  'isAnonymous',
+  'categories'
+];
+
+const sameCollege = (user, collegeId) =>
+  user.adminLevel === 'super_admin' || String(user.collegeId._id || user.collegeId) === String(collegeId);
+
+// Submit feedback for an event the current student checked in to. The save
+// hooks assign the feedback ID and fold the ratings into Event.feedbackStats.
+const submitFeedback = asyncHandler(async (req, res) => {
+  const { eventId } = req.body;
+
+  if (!mongoose.isValidObjectId(eventId)) {
+    throw new AppError('Invalid event ID', 400, 'INVALID_ID');
+  }
+
+  const attendance = await Attendance.findOne({ studentId: req.user._id, eventId })
+    .select('_id')
+    .lean();
+  if (!attendance) {
+    throw new AppError('Feedback can only be submitted for attended events', 400, 'NOT_ATTENDED');
+  }
+
+  const details = {};
+  for (const field of FEEDBACK_FIELDS) {
+    if (req.body[field] !== undefined) details[field] = req.body[field];
+  }
+
+  let feedback;
+  try {
+    feedback = await Feedback.create({
+      ...details,
+      studentId: req.user._id,
+      eventId,
+      attendanceId: attendance._id
+    });
+  } catch (error) {
+    // { studentId, eventId } is unique: one submission per student and event
+    if (error.code === 11000 && error.keyValue && error.keyValue.studentId) {
+      throw new AppError('Feedback already submitted for this event', 409, 'DUPLICATE_ENTRY');
+    }
+    throw error;
+  }
+
+  res.status(201).json({
+    success: true,
+    message: 'Feedback submitted successfully',
+    data: {
+      _id: feedback._id,
+      feedbackId: feedback.feedbackId,
+      overallRating: feedback.overallRating,
+      submissionDate: feedback.submissionDate
+    }
+  });
+});
+
+// GET /feedback/event/:eventId?limit=
+// Newest first on the { eventId, submissionDate } index; the totals come from
+// the running statistics kept on the event instead of an aggregation
+const listForEvent = asyncHandler(async (req, res) => {
+  const { eventId } = req.params;
+
+  if (!mongoose.isValidObjectId(eventId)) {
+    throw new AppError('Invalid event ID', 400, 'INVALID_ID');
+  }
+
+  const event = await Event.findById(eventId).select('name collegeId averageRating feedbackStats.overall').lean();
+  if (!event || !sameCollege(req.user, event.collegeId)) {
+    throw new AppError('Event not found', 404, 'NOT_FOUND');
+  }
+
+  const limit = Math.min(Math.max(parseInt(req.query.limit) || 50, 1), 200);
+  const [feedback, recommended] = await Promise.all([
+    Feedback.find({ eventId: event._id })
+      .sort({ submissionDate: -1 })
+      .limit(limit)
+      .select('overallRating comments wouldRecommend isAnonymous submissionDate studentId')
+      .lean(),
+    Feedback.countDocuments({ eventId: event._id, wouldRecommend: true })
+  ]);
+
+  // Student details with one $in lookup, never for anonymous entries
+  const studentIds = feedback.filter((entry) => !entry.isAnonymous).map((entry) => entry.studentId);
+  const students = studentIds.length > 0
+    ? await User.aggregate([
+      { $match: { _id: { $in: studentIds } } },
+      { $project: leanProjection('name studentId', USER_DERIVED) }
+    ])
+    : [];
+  const byId = new Map(students.map((student) => [String(student._id), student]));
+
+  const total = event.feedbackStats?.overall?.count || 0;
+
+  res.status(200).json({
+    success: true,
+    data: {
+      event: { _id: event._id, name: event.name },
+      feedback: feedback.map(({ studentId, ...entry }) => ({
+        ...entry,
+        student: entry.isAnonymous ? null : byId.get(String(studentId)) || null
+      })),
+      stats: {
+        totalFeedback: total,
+        averageRating: event.averageRating || 0,
+        recommendationRate: total > 0 ? Math.round((recommended / total) * 100) : 0
+      }
+    }
+  });
+});
+
+module.exports = {
+  submitFeedback,
+  listForEvent
+};
+'''
+
+with open('controllers/feedbackController.js', 'w') as f:
+    f.write(feedback_controller_js)
+
+feedback_routes_js = '''const express = require('express');
+const { authenticate, authorize } = require('../middleware/auth');
+const { validate, feedbackSchemas } = require('../middleware/validation');
+const { submitFeedback, listForEvent } = require('../controllers/feedbackController');
+
+const router = express.Router();
+
+// Submit feedback for an attended event
+router.post(
+  '/',
+  authenticate,
+  authorize('student'),
+  validate(feedbackSchemas.create),
+  submitFeedback
+);
+
+// List an event's feedback with its rating summary (admin only)
+router.get('/event/:eventId', authenticate, authorize('admin'), listForEvent);
+
+module.exports = router;
+'''
+
+with open('routes/feedback.js', 'w') as f:
+    f.write(feedback_routes_js)
+
+print("✅ Created controllers/feedbackController.js & routes/feedback.js - Feedback submission and per-event listing")
@@ -2,6 +2,30 @@
 
 # Event model
 event_js = '''const mongoose = require('mongoose');
+const { idAllocator } = require('../utils/idAllocator');
+const { fillFromWaitlist } = require('../utils/registrationService');
+const { recordEvent } = require('../utils/rollups');
+const {
+  bumpCollegeVersion,
+  bumpEventVersion,
+  bumpAllVersions,
+  rememberEventCollege
+} = require('../utils/contentVersions');
+const { logger } = require('../utils/logger');
+const { profileHooks, compileModel } = require('../utils/queryProfiler');
+
+// Running totals for one rating dimension: sum, count and a 1-5 histogram
+const ratingStats = () => ({
+  sum: { type: Number, default: 0 },
+  count: { type: Number, default: 0 },
+  histogram: {
+    r1: { type: Number, default: 0 },
+    r2: { type: Number, default: 0 },
+    r3: { type: Number, default: 0 },
+    r4: { type: Number, default: 0 },
+    r5: { type: Number, default: 0 }
+  }
+});
 
 const eventSchema = new mongoose.Schema({
   eventId: {
@@ -166,11 +190,26 @@ const eventSchema = new mongoose.Schema({
     type: Number,
     default: 0
   },
+  waitlistTail: {
+    type: Number,
+    default: 0 // Last waitlist position handed out
+  },
+  waitlistLength: {
+    type: Number,
+    default: 0 // Students currently waiting; newcomers only take seats while 0
+  },
   averageRating: {
     type: Number,
     default: 0,
     min: 0,
     max: 5
+  },
+  feedbackStats: {
+    overall: ratingStats(),
+    content: ratingStats(),
+    speaker: ratingStats(),
+    organization: ratingStats(),
+    venue: ratingStats()
   }
 }, {
   timestamps: true,
@@ -178,6 +217,8 @@ const eventSchema = new mongoose.Schema({
   toObject: { virtuals: true }
 });
 
+profileHooks(eventSchema);
+
 // Virtual for available spots
 eventSchema.virtual('availableSpots').get(function() {
   return Math.max(0, this.capacity - this.totalRegistrations);
@@ -209,22 +250,22 @@ eventSchema.pre('save', async function(next) {
   
   try {
     const College = mongoose.model('College');
-    const college = await College.findById(this.collegeId);
+    const college = await College.findById(this.collegeId).select('collegeId').lean();
     if (!college) {
       return next(new Error('College not found'));
     }
     
-    const count = await this.constructor.countDocuments({ collegeId: this.collegeId });
-    this.eventId = `EVT${String(count + 1).padStart(3, '0')}_${college.collegeId}`;
+    this.eventId = await idAllocator.nextId(`event:${college.collegeId}`, 'EVT', college.collegeId);
     next();
   } catch (error) {
     next(error);
   }
 });
 
-// Pre-save middleware to calculate duration
+// Pre-save middleware to calculate duration (stored so lean reads need no recomputation)
 eventSchema.pre('save', function(next) {
-  if (!this.duration) {
+  const timesChanged = this.isModified('startTime') || this.isModified('endTime');
+  if (!this.duration || (timesChanged && !this.isModified('duration'))) {
     const start = this.startTime.split(':').map(Number);
     const end = this.endTime.split(':').map(Number);
     const startMinutes = start[0] * 60 + start[1];
@@ -234,13 +275,120 @@ eventSchema.pre('save', function(next) {
   next();
 });
 
+// Promote waitlisted students when capacity is raised
+eventSchema.pre('save', function(next) {
+  this.$locals.capacityRaised = !this.isNew && this.isModified('capacity');
+  next();
+});
+
+eventSchema.post('save', async function() {
+  if (!this.$locals.capacityRaised) return;
+  
+  try {
+    await fillFromWaitlist(this._id);
+  } catch (error) {
+    logger.error('Error promoting waitlisted registrations', { err: error });
+  }
+});
+
+// Keep the college/event-type rollups in step with event creation, type changes and deletion
+eventSchema.post('init', function() {
+  this.$locals.persistedType = this.eventType;
+});
+
+eventSchema.pre('save', function(next) {
+  this.$locals.wasNew = this.isNew;
+  this.$locals.previousType = this.isModified('eventType') ? this.$locals.persistedType : null;
+  next();
+});
+
+eventSchema.post('save', async function() {
+  try {
+    if (this.$locals.wasNew) {
+      await recordEvent(this, 1);
+    } else if (this.$locals.previousType) {
+      await recordEvent({ ...this.toObject(), eventType: this.$locals.previousType }, -1);
+      await recordEvent(this, 1);
+    }
+    this.$locals.persistedType = this.eventType;
+  } catch (error) {
+    logger.error('Error updating event type rollup', { err: error });
+  }
+});
+
+eventSchema.post('deleteOne', { document: true, query: false }, async function() {
+  try {
+    await recordEvent(this, -1);
+  } catch (error) {
+    logger.error('Error updating event type rollup', { err: error });
+  }
+});
+
+eventSchema.post('findOneAndDelete', async function(doc) {
+  if (!doc) return;
+  
+  try {
+    await recordEvent(doc, -1);
+  } catch (error) {
+    logger.error('Error updating event type rollup', { err: error });
+  }
+});
+
+// Bump the college content version on every event write (including counter
+// $incs), which invalidates ETags and cached GET /events responses
+eventSchema.post('save', async function() {
+  try {
+    rememberEventCollege(this._id, this.collegeId);
+    await bumpCollegeVersion(this.collegeId);
+  } catch (error) {
+    logger.error('Error bumping event content version', { err: error });
+  }
+});
+
+eventSchema.post('deleteOne', { document: true, query: false }, async function() {
+  try {
+    await bumpCollegeVersion(this.collegeId);
+  } catch (error) {
+    logger.error('Error bumping event content version', { err: error });
+  }
+});
+
+eventSchema.post('findOneAndDelete', async function(doc) {
+  if (!doc) return;
+  
+  try {
+    await bumpCollegeVersion(doc.collegeId);
+  } catch (error) {
+    logger.error('Error bumping event content version', { err: error });
+  }
+});
+
+eventSchema.post(['findOneAndUpdate', 'updateOne', 'deleteOne'], { document: false, query: true }, async function() {
+  const { _id } = this.getFilter();
+  try {
+    await (mongoose.isValidObjectId(_id) ? bumpEventVersion(_id) : bumpAllVersions());
+  } catch (error) {
+    logger.error('Error bumping event content version', { err: error });
+  }
+});
+
+eventSchema.post(['updateMany', 'deleteMany'], { document: false, query: true }, async function() {
+  try {
+    await bumpAllVersions();
+  } catch (error) {
+    logger.error('Error bumping event content version', { err: error });
+  }
+});
+
 // Indexes
-eventSchema.index({ collegeId: 1, date: 1 });
+eventSchema.index({ collegeId: 1, date: 1, _id: 1 });
 eventSchema.index({ eventType: 1, status: 1 });
-eventSchema.index({ status: 1, date: 1 });
+eventSchema.index({ status: 1, date: 1, _id: 1 });
+eventSchema.index({ date: 1, _id: 1 });
 eventSchema.index({ registrationDeadline: 1 });
 eventSchema.index({ tags: 1 });
-eventSchema.index({ eventId: 1 }, { unique: true });
+eventSchema.index({ collegeId: 1, totalRegistrations: -1 });
+eventSchema.index({ totalRegistrations: -1 });
 
 // Text search index
 eventSchema.index({ 
@@ -249,7 +397,7 @@ eventSchema.index({
   tags: 'text' 
 });
 
-module.exports = mongoose.model('Event', eventSchema);
+module.exports = compileModel('Event', eventSchema);
 '''
 
 with open('models/Event.js', 'w') as f:
@@ -1,5 +1,9 @@
 # Create Feedback model
 feedback_js = '''const mongoose = require('mongoose');
+const { idAllocator, formatId } = require('../utils/idAllocator');
+const { ratingSnapshot, applyFeedbackDelta } = require('../utils/feedbackStats');
+const { logger } = require('../utils/logger');
+const { profileHooks, compileModel } = require('../utils/queryProfiler');
 
 const feedbackSchema = new mongoose.Schema({
   feedbackId: {
@@ -133,11 +137,12 @@ const feedbackSchema = new mongoose.Schema({
   toObject: { virtuals: true }
 });
 
+profileHooks(feedbackSchema);
+
 // Compound index to prevent duplicate feedback
 feedbackSchema.index({ studentId: 1, eventId: 1 }, { unique: true });
 feedbackSchema.index({ eventId: 1, overallRating: 1 });
 feedbackSchema.index({ eventId: 1, submissionDate: -1 });
-feedbackSchema.index({ feedbackId: 1 }, { unique: true });
 
 // Virtual for average category rating
 feedbackSchema.virtual('averageCategoryRating').get(function() {
@@ -158,64 +163,88 @@ feedbackSchema.pre('save', async function(next) {
     const Event = mongoose.model('Event');
     const User = mongoose.model('User');
     
-    const event = await Event.findById(this.eventId);
-    const student = await User.findById(this.studentId);
+    const [event, student] = await Promise.all([
+      Event.findById(this.eventId).select('eventId').lean(),
+      User.findById(this.studentId).select('userId').lean()
+    ]);
     
     if (!event || !student) {
       return next(new Error('Event or Student not found'));
     }
     
-    const count = await this.constructor.countDocuments({ eventId: this.eventId });
-    this.feedbackId = `FBK${String(count + 1).padStart(3, '0')}_${event.eventId}_${student.userId}`;
+    const seq = await idAllocator.next(`feedback:${event.eventId}`);
+    this.feedbackId = formatId('FBK', seq, `${event.eventId}_${student.userId}`);
     next();
   } catch (error) {
     next(error);
   }
 });
 
-// Post-save middleware to update event average rating
+// Remember the persisted ratings so edits only move the difference
+feedbackSchema.post('init', function() {
+  this.$locals.persistedRatings = ratingSnapshot(this);
+});
+
+feedbackSchema.pre('save', function(next) {
+  this.$locals.ratingsChanged = this.isNew || this.isModified('overallRating') || this.isModified('categories');
+  this.$locals.previousRatings = this.isNew ? null : this.$locals.persistedRatings;
+  next();
+});
+
+// Post-save middleware to update the event's running rating statistics
 feedbackSchema.post('save', async function() {
+  if (!this.$locals.ratingsChanged) return;
+  
   try {
-    const Event = mongoose.model('Event');
-    
-    // Calculate average rating for the event
-    const feedbackStats = await this.constructor.aggregate([
-      { $match: { eventId: this.eventId } },
-      {
-        $group: {
-          _id: '$eventId',
-          averageRating: { $avg: '$overallRating' },
-          totalFeedback: { $sum: 1 }
-        }
-      }
-    ]);
-    
-    if (feedbackStats.length > 0) {
-      const { averageRating } = feedbackStats[0];
-      await Event.findByIdAndUpdate(this.eventId, { 
-        averageRating: Math.round(averageRating * 10) / 10 // Round to 1 decimal
-      });
-    }
+    const ratings = ratingSnapshot(this);
+    await applyFeedbackDelta(this.eventId, this.studentId, this.$locals.previousRatings, ratings);
+    this.$locals.persistedRatings = ratings;
   } catch (error) {
-    console.error('Error updating event average rating:', error);
+    logger.error('Error updating event average rating', { err: error });
   }
 });
 
-module.exports = mongoose.model('Feedback', feedbackSchema);
+// Post-delete middleware to remove the ratings from the event statistics
+feedbackSchema.post('deleteOne', { document: true, query: false }, async function() {
+  try {
+    await applyFeedbackDelta(this.eventId, this.studentId, this.$locals.persistedRatings || ratingSnapshot(this), null);
+  } catch (error) {
+    logger.error('Error updating event average rating', { err: error });
+  }
+});
+
+feedbackSchema.post('findOneAndDelete', async function(doc) {
+  if (!doc) return;
+  
+  try {
+    await applyFeedbackDelta(doc.eventId, doc.studentId, ratingSnapshot(doc), null);
+  } catch (error) {
+    logger.error('Error updating event average rating', { err: error });
+  }
+});
+
+module.exports = compileModel('Feedback', feedbackSchema);
 '''
 
 with open('models/Feedback.js', 'w') as f:
     f.write(feedback_js)
 
 # Create index.js to export all models
-models_index_js = '''// Export all models for easy importing
+models_index_js = '''// Query profiling is a global plugin, so it is installed before any model is compiled
+require('../utils/queryProfiler').installQueryProfiler();
+
+// Export all models for easy importing
 module.exports = {
   College: require('./College'),
   User: require('./User'),
   Event: require('./Event'),
   Registration: require('./Registration'),
   Attendance: require('./Attendance'),
-  Feedback: require('./Feedback')
+  Feedback: require('./Feedback'),
+  Counter: require('./Counter'),
+  StudentRollup: require('./StudentRollup'),
+  CollegeTypeRollup: require('./CollegeTypeRollup'),
+  RateLimitBucket: require('./RateLimitBucket')
 };
 '''
 
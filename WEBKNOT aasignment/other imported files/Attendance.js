@@ -1,4 +1,8 @@
 const mongoose = require('mongoose');
+const { idAllocator, formatId } = require('../utils/idAllocator');
+const { incrementEventCounters } = require('../utils/eventCounters');
+const { logger } = require('../utils/logger');
+const { profileHooks, compileModel } = require('../utils/queryProfiler');
 
 const attendanceSchema = new mongoose.Schema({
   attendanceId: {
@@ -63,11 +67,12 @@ const attendanceSchema = new mongoose.Schema({
   toObject: { virtuals: true }
 });
 
+profileHooks(attendanceSchema);
+
 // Compound index to prevent duplicate attendance
 attendanceSchema.index({ studentId: 1, eventId: 1 }, { unique: true });
 attendanceSchema.index({ eventId: 1, checkInTime: 1 });
 attendanceSchema.index({ studentId: 1, checkInTime: -1 });
-attendanceSchema.index({ attendanceId: 1 }, { unique: true });
 
 // Virtual for attendance duration
 attendanceSchema.virtual('attendanceDuration').get(function() {
@@ -86,15 +91,17 @@ attendanceSchema.pre('save', async function(next) {
     const Event = mongoose.model('Event');
     const User = mongoose.model('User');
 
-    const event = await Event.findById(this.eventId);
-    const student = await User.findById(this.studentId);
+    const [event, student] = await Promise.all([
+      Event.findById(this.eventId).select('eventId').lean(),
+      User.findById(this.studentId).select('userId').lean()
+    ]);
 
     if (!event || !student) {
       return next(new Error('Event or Student not found'));
     }
 
-    const count = await this.constructor.countDocuments({ eventId: this.eventId });
-    this.attendanceId = `ATT${String(count + 1).padStart(3, '0')}_${event.eventId}_${student.userId}`;
+    const seq = await idAllocator.next(`attendance:${event.eventId}`);
+    this.attendanceId = formatId('ATT', seq, `${event.eventId}_${student.userId}`);
     next();
   } catch (error) {
     next(error);
@@ -109,16 +116,39 @@ attendanceSchema.pre('save', function(next) {
   next();
 });
 
-// Post-save middleware to update event attendance count
+attendanceSchema.pre('save', function(next) {
+  this.$locals.wasNew = this.isNew;
+  next();
+});
+
+// Post-save middleware to count a new check-in against the event
 attendanceSchema.post('save', async function() {
+  if (!this.$locals.wasNew) return;
+
   try {
-    const Event = mongoose.model('Event');
-    const totalAttendance = await this.constructor.countDocuments({ eventId: this.eventId });
+    await incrementEventCounters(this.eventId, { totalAttendance: 1 }, this.studentId);
+  } catch (error) {
+    logger.error('Error updating event attendance count', { err: error });
+  }
+});
+
+// Post-delete middleware to undo a check-in
+attendanceSchema.post('deleteOne', { document: true, query: false }, async function() {
+  try {
+    await incrementEventCounters(this.eventId, { totalAttendance: -1 }, this.studentId);
+  } catch (error) {
+    logger.error('Error updating event attendance count', { err: error });
+  }
+});
 
-    await Event.findByIdAndUpdate(this.eventId, { totalAttendance });
+attendanceSchema.post('findOneAndDelete', async function(doc) {
+  if (!doc) return;
+
+  try {
+    await incrementEventCounters(doc.eventId, { totalAttendance: -1 }, doc.studentId);
   } catch (error) {
-    console.error('Error updating event attendance count:', error);
+    logger.error('Error updating event attendance count', { err: error });
   }
 });
 
-module.exports = mongoose.model('Attendance', attendanceSchema);
+module.exports = compileModel('Attendance', attendanceSchema);
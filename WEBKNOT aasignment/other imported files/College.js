@@ -1,4 +1,8 @@
 const mongoose = require('mongoose');
+const { clearPrincipals } = require('../utils/principalCache');
+const { bumpCollegeVersion, bumpAllVersions } = require('../utils/contentVersions');
+const { logger } = require('../utils/logger');
+const { profileHooks, compileModel } = require('../utils/queryProfiler');
 
 const collegeSchema = new mongoose.Schema({
   collegeId: {
@@ -71,14 +75,42 @@ const collegeSchema = new mongoose.Schema({
   toObject: { virtuals: true }
 });
 
+profileHooks(collegeSchema);
+
 // Virtual for full address
 collegeSchema.virtual('fullAddress').get(function() {
   return `${this.address.street}, ${this.address.city}, ${this.address.state} ${this.address.zipCode}, ${this.address.country}`;
 });
 
 // Indexes
-collegeSchema.index({ collegeId: 1 });
 collegeSchema.index({ name: 1 });
 collegeSchema.index({ isActive: 1 });
 
-module.exports = mongoose.model('College', collegeSchema);
+// Cached auth principals embed a college snapshot, so drop them on college changes
+collegeSchema.post('save', function() {
+  clearPrincipals();
+});
+
+collegeSchema.post(['findOneAndUpdate', 'updateOne', 'updateMany'], { document: false, query: true }, function() {
+  clearPrincipals();
+});
+
+// Event detail responses embed the college name, so college edits bump its content version
+collegeSchema.post('save', async function() {
+  try {
+    await bumpCollegeVersion(this._id);
+  } catch (error) {
+    logger.error('Error bumping college content version', { err: error });
+  }
+});
+
+collegeSchema.post(['findOneAndUpdate', 'updateOne', 'updateMany'], { document: false, query: true }, async function() {
+  const { _id } = this.getFilter();
+  try {
+    await (mongoose.isValidObjectId(_id) ? bumpCollegeVersion(_id) : bumpAllVersions());
+  } catch (error) {
+    logger.error('Error bumping college content version', { err: error });
+  }
+});
+
+module.exports = compileModel('College', collegeSchema);
@@ -1,4 +1,8 @@
 const mongoose = require('mongoose');
+const { idAllocator, formatId } = require('../utils/idAllocator');
+const { ratingSnapshot, applyFeedbackDelta } = require('../utils/feedbackStats');
+const { logger } = require('../utils/logger');
+const { profileHooks, compileModel } = require('../utils/queryProfiler');
 
 const feedbackSchema = new mongoose.Schema({
   feedbackId: {
@@ -132,11 +136,12 @@ const feedbackSchema = new mongoose.Schema({
   toObject: { virtuals: true }
 });
 
+profileHooks(feedbackSchema);
+
 // Compound index to prevent duplicate feedback
 feedbackSchema.index({ studentId: 1, eventId: 1 }, { unique: true });
 feedbackSchema.index({ eventId: 1, overallRating: 1 });
 feedbackSchema.index({ eventId: 1, submissionDate: -1 });
-feedbackSchema.index({ feedbackId: 1 }, { unique: true });
 
 // Virtual for average category rating
 feedbackSchema.virtual('averageCategoryRating').get(function() {
@@ -157,47 +162,64 @@ feedbackSchema.pre('save', async function(next) {
     const Event = mongoose.model('Event');
     const User = mongoose.model('User');
 
-    const event = await Event.findById(this.eventId);
-    const student = await User.findById(this.studentId);
+    const [event, student] = await Promise.all([
+      Event.findById(this.eventId).select('eventId').lean(),
+      User.findById(this.studentId).select('userId').lean()
+    ]);
 
     if (!event || !student) {
       return next(new Error('Event or Student not found'));
     }
 
-    const count = await this.constructor.countDocuments({ eventId: this.eventId });
-    this.feedbackId = `FBK${String(count + 1).padStart(3, '0')}_${event.eventId}_${student.userId}`;
+    const seq = await idAllocator.next(`feedback:${event.eventId}`);
+    this.feedbackId = formatId('FBK', seq, `${event.eventId}_${student.userId}`);
     next();
   } catch (error) {
     next(error);
   }
 });
 
-// Post-save middleware to update event average rating
+// Remember the persisted ratings so edits only move the difference
+feedbackSchema.post('init', function() {
+  this.$locals.persistedRatings = ratingSnapshot(this);
+});
+
+feedbackSchema.pre('save', function(next) {
+  this.$locals.ratingsChanged = this.isNew || this.isModified('overallRating') || this.isModified('categories');
+  this.$locals.previousRatings = this.isNew ? null : this.$locals.persistedRatings;
+  next();
+});
+
+// Post-save middleware to update the event's running rating statistics
 feedbackSchema.post('save', async function() {
+  if (!this.$locals.ratingsChanged) return;
+
   try {
-    const Event = mongoose.model('Event');
+    const ratings = ratingSnapshot(this);
+    await applyFeedbackDelta(this.eventId, this.studentId, this.$locals.previousRatings, ratings);
+    this.$locals.persistedRatings = ratings;
+  } catch (error) {
+    logger.error('Error updating event average rating', { err: error });
+  }
+});
 
-    // Calculate average rating for the event
-    const feedbackStats = await this.constructor.aggregate([
-      { $match: { eventId: this.eventId } },
-      {
-        $group: {
-          _id: '$eventId',
-          averageRating: { $avg: '$overallRating' },
-          totalFeedback: { $sum: 1 }
-        }
-      }
-    ]);
+// Post-delete middleware to remove the ratings from the event statistics
+feedbackSchema.post('deleteOne', { document: true, query: false }, async function() {
+  try {
+    await applyFeedbackDelta(this.eventId, this.studentId, this.$locals.persistedRatings || ratingSnapshot(this), null);
+  } catch (error) {
+    logger.error('Error updating event average rating', { err: error });
+  }
+});
 
-    if (feedbackStats.length > 0) {
-      const { averageRating } = feedbackStats[0];
-      await Event.findByIdAndUpdate(this.eventId, { 
-        averageRating: Math.round(averageRating * 10) / 10 // Round to 1 decimal
-      });
-    }
+feedbackSchema.post('findOneAndDelete', async function(doc) {
+  if (!doc) return;
+
+  try {
+    await applyFeedbackDelta(doc.eventId, doc.studentId, ratingSnapshot(doc), null);
   } catch (error) {
-    console.error('Error updating event average rating:', error);
+    logger.error('Error updating event average rating', { err: error });
   }
 });
 
-module.exports = mongoose.model('Feedback', feedbackSchema);
+module.exports = compileModel('Feedback', feedbackSchema);
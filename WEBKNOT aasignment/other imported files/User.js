@@ -1,5 +1,9 @@
 const mongoose = require('mongoose');
-const bcrypt = require('bcryptjs');
+const { idAllocator } = require('../utils/idAllocator');
+const { invalidatePrincipal, clearPrincipals } = require('../utils/principalCache');
+const { passwordPool, needsRehash } = require('../utils/passwordPool');
+const { lastLoginBuffer } = require('../utils/lastLoginBuffer');
+const { profileHooks, compileModel } = require('../utils/queryProfiler');
 
 const userSchema = new mongoose.Schema({
   userId: {
@@ -124,14 +128,13 @@ const userSchema = new mongoose.Schema({
   toObject: { virtuals: true }
 });
 
+profileHooks(userSchema);
+
 // Compound indexes
 userSchema.index({ collegeId: 1, studentId: 1 }, { 
   unique: true, 
-  sparse: true,
   partialFilterExpression: { role: 'student' }
 });
-userSchema.index({ email: 1 }, { unique: true });
-userSchema.index({ userId: 1 }, { unique: true });
 userSchema.index({ role: 1, isActive: 1 });
 
 // Virtual for full name with ID
@@ -141,13 +144,12 @@ userSchema.virtual('displayName').get(function() {
     `${this.name} (Admin)`;
 });
 
-// Pre-save middleware to hash password
+// Pre-save middleware to hash password (on the worker pool, off the event loop)
 userSchema.pre('save', async function(next) {
   if (!this.isModified('password')) return next();
 
   try {
-    const salt = await bcrypt.genSalt(parseInt(process.env.BCRYPT_SALT_ROUNDS) || 12);
-    this.password = await bcrypt.hash(this.password, salt);
+    this.password = await passwordPool.hash(this.password);
     next();
   } catch (error) {
     next(error);
@@ -160,23 +162,46 @@ userSchema.pre('save', async function(next) {
 
   try {
     const prefix = this.role === 'admin' ? 'ADM' : 'STU';
-    const count = await this.constructor.countDocuments({ role: this.role });
-    this.userId = `${prefix}${String(count + 1).padStart(3, '0')}`;
+    this.userId = await idAllocator.nextId(`user:${prefix}`, prefix);
     next();
   } catch (error) {
     next(error);
   }
 });
 
+// Drop cached auth snapshots whenever a user is updated, deactivated or changes password
+userSchema.post('save', function() {
+  invalidatePrincipal(this._id);
+});
+
+userSchema.post(['findOneAndUpdate', 'findOneAndDelete'], function(doc) {
+  if (doc) invalidatePrincipal(doc._id);
+});
+
+userSchema.post(['updateOne', 'updateMany', 'deleteOne', 'deleteMany'], { document: false, query: true }, function() {
+  const { _id } = this.getFilter();
+  if (_id && mongoose.isValidObjectId(_id)) {
+    invalidatePrincipal(_id);
+  } else {
+    clearPrincipals();
+  }
+});
+
 // Instance method to compare password
 userSchema.methods.comparePassword = async function(candidatePassword) {
-  return bcrypt.compare(candidatePassword, this.password);
+  return passwordPool.compare(candidatePassword, this.password);
+};
+
+// Instance method to check whether the stored hash uses the configured cost
+userSchema.methods.needsRehash = function() {
+  return needsRehash(this.password);
 };
 
-// Instance method to update last login
+// Instance method to update last login. The write is buffered and flushed in
+// batches (see utils/lastLoginBuffer.js) instead of saving the document.
 userSchema.methods.updateLastLogin = function() {
   this.lastLogin = new Date();
-  return this.save({ validateBeforeSave: false });
+  lastLoginBuffer.record(this._id, this.lastLogin);
 };
 
 // Static method to find by email
@@ -184,4 +209,4 @@ userSchema.statics.findByEmail = function(email) {
   return this.findOne({ email: email.toLowerCase() });
 };
 
-module.exports = mongoose.model('User', userSchema);
+module.exports = compileModel('User', userSchema);
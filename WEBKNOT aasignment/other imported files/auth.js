@@ -1,6 +1,6 @@
 const jwt = require('jsonwebtoken');
-const { User } = require('../models');
 const { verifyToken, extractToken } = require('../config/jwt');
+const { getPrincipal } = require('../utils/principalCache');
 
 // Authenticate user middleware
 const authenticate = async (req, res, next) => {
@@ -19,7 +19,7 @@ const authenticate = async (req, res, next) => {
     }
 
     const decoded = verifyToken(token);
-    const user = await User.findById(decoded.userId).populate('collegeId');
+    const user = await getPrincipal(decoded.userId);
 
     if (!user) {
       return res.status(401).json({
@@ -136,7 +136,8 @@ const checkCollegeAccess = async (req, res, next) => {
     }
 
     // Users can only access their own college data
-    if (req.user.collegeId.toString() !== collegeId) {
+    const userCollegeId = req.user.collegeId._id || req.user.collegeId;
+    if (userCollegeId.toString() !== collegeId) {
       return res.status(403).json({
         success: false,
         message: 'Access denied. Cannot access other college data.',
@@ -167,7 +168,7 @@ const optionalAuth = async (req, res, next) => {
 
     if (token) {
       const decoded = verifyToken(token);
-      const user = await User.findById(decoded.userId).populate('collegeId');
+      const user = await getPrincipal(decoded.userId);
 
       if (user && user.isActive) {
         req.user = user;
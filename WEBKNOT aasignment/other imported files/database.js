@@ -1,32 +1,65 @@
 const mongoose = require('mongoose');
+const { poolMonitor } = require('../utils/poolMonitor');
+const { logger } = require('../utils/logger');
+
+// Connection pool per MongoDB server, per process. In cluster mode every
+// worker has its own pool, so the server sees up to WEB_CONCURRENCY x maxPoolSize.
+const POOL_OPTIONS = {
+  maxPoolSize: parseInt(process.env.DB_POOL_MAX_SIZE) || 50,
+  minPoolSize: parseInt(process.env.DB_POOL_MIN_SIZE) || 5,
+  maxConnecting: parseInt(process.env.DB_POOL_MAX_CONNECTING) || 4,
+  maxIdleTimeMS: parseInt(process.env.DB_POOL_MAX_IDLE_MS) || 60000,
+  waitQueueTimeoutMS: parseInt(process.env.DB_POOL_WAIT_QUEUE_TIMEOUT_MS) || 5000,
+  serverSelectionTimeoutMS: parseInt(process.env.DB_SERVER_SELECTION_TIMEOUT_MS) || 5000,
+  connectTimeoutMS: parseInt(process.env.DB_CONNECT_TIMEOUT_MS) || 10000,
+  socketTimeoutMS: parseInt(process.env.DB_SOCKET_TIMEOUT_MS) || 45000
+};
+
+// Open minPoolSize connections up front: concurrent pings each need their own
+// connection, so the first requests do not pay for connection handshakes
+const warmPool = async (size) => {
+  const admin = mongoose.connection.db.admin();
+  await Promise.all(Array.from({ length: size }, () => admin.ping()));
+};
+
+// At LOG_LEVEL=debug every query is logged, tagged with the request that issued it
+const logQueries = () => {
+  mongoose.set('debug', (collection, method, ...args) => {
+    logger.debug('MongoDB query', { collection, method, args });
+  });
+};
 
 const connectDB = async () => {
   try {
-    const conn = await mongoose.connect(process.env.MONGODB_URI, {
-      useNewUrlParser: true,
-      useUnifiedTopology: true,
-    });
+    if (logger.isLevelEnabled('debug')) logQueries();
 
-    console.log(`📦 MongoDB Connected: ${conn.connection.host}`);
+    const connecting = mongoose.connect(process.env.MONGODB_URI, POOL_OPTIONS);
+    // Listen for pool events before the first connection opens where possible
+    poolMonitor.attach(mongoose.connection.getClient(), POOL_OPTIONS);
+    const conn = await connecting;
+    poolMonitor.attach(mongoose.connection.getClient(), POOL_OPTIONS);
+
+    await warmPool(POOL_OPTIONS.minPoolSize);
+    logger.info('MongoDB connected', {
+      host: conn.connection.host,
+      minPoolSize: POOL_OPTIONS.minPoolSize,
+      maxPoolSize: POOL_OPTIONS.maxPoolSize
+    });
 
     // Handle connection events
     mongoose.connection.on('error', (err) => {
-      console.error('❌ MongoDB connection error:', err);
+      logger.error('MongoDB connection error', { err });
     });
 
     mongoose.connection.on('disconnected', () => {
-      console.log('📦 MongoDB disconnected');
+      logger.warn('MongoDB disconnected');
     });
 
-    // Graceful shutdown
-    process.on('SIGINT', async () => {
-      await mongoose.connection.close();
-      console.log('📦 MongoDB connection closed through app termination');
-      process.exit(0);
-    });
+    // Shutdown (draining requests, flushing buffers, closing this connection)
+    // is handled by utils/gracefulShutdown.js once the HTTP server is up
 
   } catch (error) {
-    console.error('❌ Error connecting to MongoDB:', error.message);
+    logger.error('Error connecting to MongoDB', { err: error });
     process.exit(1);
   }
 };
@@ -1,15 +1,26 @@
+const { logger } = require('../utils/logger');
+
+const CLIENT_ERRORS = new Set(['CastError', 'ValidationError', 'JsonWebTokenError', 'TokenExpiredError']);
+
+// Expected client errors (validation, bad IDs, duplicates, auth, 4xx AppErrors)
+// are logged at warn without a stack; anything else is logged as an error
+// with its stack (rate-limited per distinct error by the logger)
+const logError = (err, req) => {
+  const isClientError = CLIENT_ERRORS.has(err.name) || err.code === 11000 || (err.statusCode || 500) < 500;
+  const fields = { method: req.method, url: req.originalUrl };
+
+  if (isClientError) {
+    logger.warn(err.message, { ...fields, name: err.name, code: err.code });
+  } else {
+    logger.error(err.message, { ...fields, err });
+  }
+};
+
 const errorHandler = (err, req, res, next) => {
   let error = { ...err };
   error.message = err.message;
 
-  // Log error
-  console.error('Error:', {
-    message: err.message,
-    stack: err.stack,
-    url: req.originalUrl,
-    method: req.method,
-    timestamp: new Date().toISOString()
-  });
+  logError(err, req);
 
   // Mongoose bad ObjectId
   if (err.name === 'CastError') {
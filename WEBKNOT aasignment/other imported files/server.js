@@ -1,12 +1,30 @@
 const express = require('express');
 const cors = require('cors');
 const helmet = require('helmet');
-const morgan = require('morgan');
-const rateLimit = require('express-rate-limit');
 require('dotenv').config();
 
+const mongoose = require('mongoose');
 const connectDB = require('./config/database');
 const { errorHandler } = require('./middleware/errorHandler');
+const { rateLimit, getRateLimitStats } = require('./middleware/rateLimit');
+const { requestLogger } = require('./middleware/requestLogger');
+const { recordRequestMetrics, captureRouteBase, metricsEndpoint } = require('./middleware/requestMetrics');
+const { getResponseCacheStats } = require('./middleware/responseCache');
+const { getTokenCacheStats } = require('./config/jwt');
+const { logger } = require('./utils/logger');
+const { registerCollector, startRuntimeMetrics } = require('./utils/metrics');
+const { getPrincipalCacheStats } = require('./utils/principalCache');
+const { idAllocator } = require('./utils/idAllocator');
+const { passwordPool } = require('./utils/passwordPool');
+const { lastLoginBuffer } = require('./utils/lastLoginBuffer');
+const { checkInBatcher } = require('./utils/checkInBatcher');
+const { poolMonitor } = require('./utils/poolMonitor');
+const {
+  onShutdown,
+  isShuttingDown,
+  installShutdownHandlers,
+  closeConnectionsWhileDraining
+} = require('./utils/gracefulShutdown');
 
 // Import routes
 const authRoutes = require('./routes/auth');
@@ -15,14 +33,19 @@ const registrationRoutes = require('./routes/registrations');
 const attendanceRoutes = require('./routes/attendance');
 const feedbackRoutes = require('./routes/feedback');
 const reportRoutes = require('./routes/reports');
+const debugRoutes = require('./routes/debug');
 
 const app = express();
 
-// Connect to MongoDB
-connectDB();
+// Per-route latency histograms and in-flight count, timed from arrival
+app.use(recordRequestMetrics);
+
+// Request IDs and structured access logs (every record carries the ID)
+app.use(requestLogger);
 
 // Security middleware
 app.use(helmet());
+app.use(closeConnectionsWhileDraining);
 
 // CORS configuration
 app.use(cors({
@@ -32,40 +55,81 @@ app.use(cors({
   credentials: true
 }));
 
-// Rate limiting
-const limiter = rateLimit({
-  windowMs: 1 * 60 * 1000, // 1 minute
-  max: 100, // limit each IP to 100 requests per windowMs
-  message: {
-    error: 'Too many requests from this IP, please try again later.'
-  }
-});
-app.use(limiter);
+// Rate limiting: per user and per college (buckets shared by all processes);
+// registration and reports also have their own budgets on their routes, and
+// login is only limited by its own policy (per account and per IP)
+app.use('/api', rateLimit('api', { except: ['/auth/login'] }));
 
 // Body parsing middleware
 app.use(express.json({ limit: '10mb' }));
 app.use(express.urlencoded({ extended: true }));
 
-// Logging middleware
-app.use(morgan('combined'));
+const DB_STATES = ['disconnected', 'connected', 'connecting', 'disconnecting'];
 
-// Health check endpoint
+// Health check endpoint (liveness, with connection pool telemetry)
 app.get('/health', (req, res) => {
   res.status(200).json({
     success: true,
     message: 'Campus Event Management API is running',
     timestamp: new Date().toISOString(),
-    version: '1.0.0'
+    version: '1.0.0',
+    data: {
+      pid: process.pid,
+      database: DB_STATES[mongoose.connection.readyState] || 'unknown',
+      pool: poolMonitor.getStats(),
+      logger: logger.getStats()
+    }
   });
 });
 
-// API Routes
-app.use('/api/auth', authRoutes);
-app.use('/api/events', eventRoutes);
-app.use('/api/registrations', registrationRoutes);
-app.use('/api/attendance', attendanceRoutes);
-app.use('/api/feedback', feedbackRoutes);
-app.use('/api/reports', reportRoutes);
+const notReadyReason = () => {
+  if (isShuttingDown()) return 'Server is shutting down';
+  if (mongoose.connection.readyState !== 1) return 'Database is not connected';
+  if (poolMonitor.isSaturated()) return 'Database connection pool is saturated';
+  return null;
+};
+
+// Readiness endpoint: fails while MongoDB is unreachable, the connection pool
+// is saturated or the process is draining, so a load balancer sheds traffic
+app.get('/ready', (req, res) => {
+  const reason = notReadyReason();
+  if (reason) {
+    return res.status(503).json({
+      success: false,
+      message: 'Not ready',
+      error: {
+        code: 'NOT_READY',
+        details: reason
+      }
+    });
+  }
+
+  res.status(200).json({ success: true, message: 'Ready' });
+});
+
+// Prometheus-style metrics: request latency, event-loop lag, GC pauses and
+// the counters of every cache, pool and write buffer in this process
+startRuntimeMetrics();
+registerCollector('principal_cache', getPrincipalCacheStats);
+registerCollector('token_cache', getTokenCacheStats);
+registerCollector('response_cache', getResponseCacheStats);
+registerCollector('db_pool', () => poolMonitor.getStats());
+registerCollector('password_pool', () => passwordPool.getStats());
+registerCollector('id_allocator', () => idAllocator.getStats());
+registerCollector('check_in_batcher', () => checkInBatcher.getStats());
+registerCollector('last_login_buffer', () => lastLoginBuffer.getStats());
+registerCollector('rate_limit_leases', getRateLimitStats);
+registerCollector('logger', () => logger.getStats());
+app.get('/metrics', metricsEndpoint);
+
+// API Routes (captureRouteBase keeps the mount path for route metrics)
+app.use('/api/auth', captureRouteBase, authRoutes);
+app.use('/api/events', captureRouteBase, eventRoutes);
+app.use('/api/registrations', captureRouteBase, registrationRoutes);
+app.use('/api/attendance', captureRouteBase, attendanceRoutes);
+app.use('/api/feedback', captureRouteBase, feedbackRoutes);
+app.use('/api/reports', captureRouteBase, reportRoutes);
+app.use('/api/debug', captureRouteBase, debugRoutes);
 
 // 404 handler
 app.use('*', (req, res) => {
@@ -84,10 +148,26 @@ app.use(errorHandler);
 
 const PORT = process.env.PORT || 3000;
 
-app.listen(PORT, () => {
-  console.log(`🚀 Campus Event Management Server running on port ${PORT}`);
-  console.log(`📊 Environment: ${process.env.NODE_ENV || 'development'}`);
-  console.log(`🌐 Health check: http://localhost:${PORT}/health`);
-});
+// Accept traffic only once MongoDB is connected and the pool is warm
+const start = async () => {
+  await connectDB();
+
+  const server = app.listen(PORT, () => {
+    logger.info('Campus Event Management Server running', {
+      port: PORT,
+      environment: process.env.NODE_ENV || 'development',
+      healthCheck: `http://localhost:${PORT}/health`
+    });
+  });
+
+  // On SIGTERM/SIGINT or a rolling restart: stop accepting connections, finish
+  // in-flight requests, then write anything still buffered
+  installShutdownHandlers(server);
+  onShutdown('check-in batches', () => checkInBatcher.flush());
+  onShutdown('login timestamps', () => lastLoginBuffer.stop());
+  onShutdown('password pool', () => passwordPool.close());
+};
+
+start();
 
 module.exports = app;
@@ -1,17 +1,29 @@
 const Joi = require('joi');
+const { FALLBACK, compileSchema } = require('./compiledValidators');
 
-// Generic validation middleware
+// Schema -> precompiled validator (filled in once the schemas below exist)
+const compiledBySchema = new Map();
+
+// Generic validation middleware. Schemas the compiler supports run their
+// compiled validator first and only fall back to Joi when Joi would have to
+// convert the input.
 const validate = (schema) => {
+  const compiled = compiledBySchema.get(schema);
+
   return (req, res, next) => {
-    const { error } = schema.validate(req.body);
+    let details = compiled ? compiled(req.body) : FALLBACK;
+    if (details === FALLBACK) {
+      const { error } = schema.validate(req.body);
+      details = error ? error.details[0].message : null;
+    }
 
-    if (error) {
+    if (details) {
       return res.status(400).json({
         success: false,
         message: 'Validation error',
         error: {
           code: 'VALIDATION_ERROR',
-          details: error.details[0].message
+          details
         }
       });
     }
@@ -138,6 +150,12 @@ const registrationSchemas = {
 
   cancel: Joi.object({
     cancellationReason: Joi.string().max(500).allow('')
+  }),
+
+  bulk: Joi.object({
+    eventId: Joi.string().required(),
+    studentIds: Joi.array().items(Joi.string()).min(1).max(5000).unique().required(),
+    specialRequirements: Joi.string().max(500).allow('')
   })
 };
 
@@ -145,6 +163,7 @@ const registrationSchemas = {
 const attendanceSchemas = {
   checkIn: Joi.object({
     eventId: Joi.string().required(),
+    studentId: Joi.string(), // scanned student; only honoured for admin scanners
     checkInMethod: Joi.string().valid('qr_code', 'manual', 'mobile_app').default('mobile_app'),
     checkInLocation: Joi.string().allow('')
   }),
@@ -212,6 +231,16 @@ const collegeSchemas = {
   })
 };
 
+// Compile every schema from its Joi description; ones using features the
+// compiler does not reproduce are validated by Joi alone
+const schemaGroups = { userSchemas, eventSchemas, registrationSchemas, attendanceSchemas, feedbackSchemas, collegeSchemas };
+for (const schemas of Object.values(schemaGroups)) {
+  for (const schema of Object.values(schemas)) {
+    const compiled = compileSchema(schema);
+    if (compiled) compiledBySchema.set(schema, compiled);
+  }
+}
+
 module.exports = {
   validate,
   userSchemas,